@@ -1,5 +1,9 @@
 """
-    Contains i/o-related functions.
+    Contains i/o-related functions, and a class to write a screen's
+     output all at once.
+
+    Class Definitions:
+    - ScreenBuffer -- a buffer which a screen's output is composed in.
 
     Public Functions:
     - build_dict_string -- converts a dictionary into a string
@@ -16,19 +20,30 @@
     - get_input -- prints a prompt and gets a string, int or float from
        the user.
     - goodbye_screen -- prints a goodbye message
+    - is_compressed -- checks whether a file is compressed.
     - menu -- prints a menu and gets a choice from the user.
     - print_block -- prints or returns a string broken at a specified
        column width.
     - print_status -- prints a status message.
+    - row_offsets -- finds where each row of csv data begins and ends.
+    - rule_line -- builds (and caches) a "-=-=" rule line.
     - welcome_screen -- prints an initial screen.
+    - wrap_lines -- lays out (and caches) a string as a list of lines.
     - yes_no -- gets the user's answer to a yes/no question.
 
     Private Functions:
+    - _ansi_terminal -- checks (once) whether the screen can be cleared
+       with ANSI escape codes.
+    - _has_extension -- checks whether a filename ends with one of a
+       list of extensions.
     - _menu_build_display_list -- builds the list for a menu.
     - _menu_build_prompt -- builds the prompt for a menu.
     - _menu_display -- displays a menu.
     - _menu_evaluate_response -- checks the response to a menu.
     - menu_get_response -- gets a response to a menu.
+    - _open_file -- opens a file for reading or writing text,
+       decompressing or compressing it if necessary.
+    - _wrap -- lays out (and caches) a string within a specified width.
     - _z_exc -- generic exception handler.
    ---------------------------------------------------------------------
 """
@@ -62,6 +77,9 @@ def _z_exc(loc, err):
 # Other imports.
 try:
     import csv
+    import functools
+    import gzip
+    import lzma
     import os
     import re
 
@@ -72,6 +90,135 @@ except Exception as err:
 # end try
 
 
+# Constants.
+COMPRESSORS = {".gz": gzip, ".xz": lzma}
+# The pattern of rule lines, which alternates by column.
+RULE = "-="
+# Clearing the screen.  The marker line is left on screens which can't
+#  be cleared.  The escape codes move the cursor to the top, and erase
+#  the screen and the scrollback.
+CLEAR_MARKER = "SCREENCLEARSHERE SCREENCLEARSHERE SCREENCLEARSHERE\n"
+CLEAR_CODES = "\033[H\033[2J\033[3J"
+# Laying out blocks of text:  words are broken along spaces, hyphens
+#  and new line marks, and the laid-out blocks are cached.
+WRAP_PATTERN = re.compile(r"(\s)|(-)|(¤)")
+WRAP_CACHE_SIZE = 512
+# Terminals which don't understand escape codes.
+DUMB_TERMINALS = ["", "dumb", "unknown"]
+
+
+class ScreenBuffer:
+    """
+        A buffer which a screen's output is composed in.
+
+        Printing a screen a piece at a time makes a separate write (and,
+         over a remote connection, a separate packet) for every piece.
+         Instead, the pieces are added to the buffer, and the buffer is
+         written in one go when the screen is finished or input is
+         needed.
+
+        Public Methods:
+        - flush -- writes the buffer's contents and empties it.
+        - getvalue -- returns the buffer's contents.
+        - rule -- adds a rule line.
+        - write -- adds values, as print would print them.
+
+        Magic Methods:
+        - __init__ -- creates an empty buffer.
+       -----------------------------------------------------------------
+    """
+
+    def __init__(self):
+        """
+            Returns an empty buffer.
+           -------------------------------------------------------------
+        """
+        self._parts = []
+    # end method
+
+    def flush(self):
+        """
+            Writes the buffer's contents to the screen and empties it.
+
+            Arguments:  none.
+
+            Returns:  nothing.
+           -------------------------------------------------------------
+        """
+        try:
+            sys.stdout.write("".join(self._parts))
+            sys.stdout.flush()
+            self._parts.clear()
+            return
+        except Exception as err:
+            _z_exc("io_utils.py/ScreenBuffer/flush", err)
+        # end try
+    # end method
+
+    def getvalue(self):
+        """
+            Returns the buffer's contents.
+
+            Arguments:  none.
+
+            Returns:  the contents, as a string.
+           -------------------------------------------------------------
+        """
+        try:
+            return "".join(self._parts)
+        except Exception as err:
+            _z_exc("io_utils.py/ScreenBuffer/getvalue", err)
+        # end try
+    # end method
+
+    def rule(self, line_length, label=None):
+        """
+            Adds a rule line, and a new line.
+
+            Arguments:
+            - line_length -- the width of the screen in characters.
+
+            Keyword Arguments:
+            - label -- the label at the start of the line (default
+               None).
+
+            Returns:  nothing.
+           -------------------------------------------------------------
+        """
+        try:
+            self._parts.append(rule_line(line_length, label=label) + "\n")
+            return
+        except Exception as err:
+            _z_exc("io_utils.py/ScreenBuffer/rule", err)
+        # end try
+    # end method
+
+    def write(self, *values, sep=" ", end="\n"):
+        """
+            Adds values to the buffer, as print would print them.
+
+            Arguments:
+            - values -- the values to add.
+
+            Keyword Arguments:
+            - sep -- the string between values (default " ").
+            - end -- the string after the last value (default a new
+               line).
+
+            Returns:  nothing.
+           -------------------------------------------------------------
+        """
+        try:
+            self._parts.append(sep.join(str(value) for value in values) + end)
+            return
+        except Exception as err:
+            _z_exc("io_utils.py/ScreenBuffer/write", err)
+        # end try
+    # end method
+
+# end class
+
+
 def build_dict_string(dic):
     """
         Builds and returns a string representation of a dictionary.
@@ -97,8 +244,19 @@ def build_dict_string(dic):
         # end if
         string = "{"
         # Loop through the dictionary, getting strings for each key and
-        #  value.
+        #  value.  (The same problem applies to the items in a list or
+        #  tuple.)
         for key, value in dic.items():
+            if type(value) in [list, tuple]:
+                items = ", ".join(str(item) for item in value)
+                if type(value) == list:
+                    value = "[" + items + "]"
+                elif len(value) == 1:
+                    value = "(" + items + ",)"
+                else:
+                    value = "(" + items + ")"
+                # end if
+            # end if
             string += str(key) + ": " + str(value) + ", "
         # end for
         # Strip the last comma and space and close.
@@ -120,12 +278,21 @@ def clear_screen():
        -----------------------------------------------------------------
     """
     try:
-        # This print line is a marker for those terminals/shells which
-        #  refuse to implement the system call.  For those terminals/shells
-        #  that do, this line will instantly disappear.
-        print(
-          "SCREENCLEARSHERE SCREENCLEARSHERE SCREENCLEARSHERE")
-        os.system("cls" if os.name == "nt" else "clear")
+        # The marker line is for those terminals/shells which can't be
+        #  cleared.  For those that can, this line will instantly
+        #  disappear.  Most terminals are cleared with escape codes,
+        #  without starting another process; the Windows console, if it
+        #  doesn't understand them, is cleared with "cls".
+        if _ansi_terminal():
+            sys.stdout.write(CLEAR_MARKER + CLEAR_CODES)
+            sys.stdout.flush()
+        else:
+            sys.stdout.write(CLEAR_MARKER)
+            sys.stdout.flush()
+            if os.name == "nt" and sys.stdout.isatty():
+                os.system("cls")
+            # end if
+        # end if
         return
     except Exception as err:
         _z_exc("io_utils.py/clear_screen", err)
@@ -191,18 +358,12 @@ def confirm(prompt, line_length=80):
         #  valid answer.  It treats "Y" (or "y") as confirmation, and
         #  any other input as non-confirmation.
         #
-        # Print the header line.
-        print("\n-=-=-{Confirm}", end="")
-        char = "-"
-        for n in range(15, line_length):
-            print(char, end="")
-            if char == "-":
-                char = "="
-            else:
-                char = "-"
-            # end if
-        # end for
-        print()
+        # Print the header line (one character short of the screen's
+        #  width, as it always has been).
+        screen = ScreenBuffer()
+        screen.write()
+        screen.rule(line_length - 1, label="Confirm")
+        screen.flush()
         # Get the response.  If it isn't a "y", assume the answer is no.
         response = input(
           print_block(
@@ -224,7 +385,8 @@ def file_create(filetype="txt", line_length=80):
         Creates a new file/overwrites an existing file to store data.
 
         Keyword Arguments:
-        - filetype -- the type of file to create (default "txt").
+        - filetype -- the type of file to create (default "txt"), or a
+           list of acceptable types (the first is the default).
         - line_length -- the width of the screen in characters (default
            80).
 
@@ -234,6 +396,10 @@ def file_create(filetype="txt", line_length=80):
        -----------------------------------------------------------------
     """
     try:
+        # Allow either a single file type or a list of file types.
+        if type(filetype) == str:
+            filetype = [filetype]
+        # end if
         fname = ""
         while not fname:
             fname = get_input(
@@ -253,8 +419,8 @@ def file_create(filetype="txt", line_length=80):
                 # end if
             else:
                 # If user did not manually put in an extension, add it.
-                if fname[-4:].lower() != ("." + filetype):
-                    fname += "." + filetype
+                if not _has_extension(fname, filetype):
+                    fname += "." + filetype[0]
                 # end if
                 # Check to see if the file exists.
                 if os.path.isfile(fname):
@@ -293,7 +459,7 @@ def file_create(filetype="txt", line_length=80):
                     # File doesn't exist (good).  Test create the file
                     # just to make sure it will work.
                     try:
-                        with open(fname, "w", newline="") as data_file:
+                        with _open_file(fname, "w") as data_file:
                             data_file.write("TEST")
                             return fname, False
                     except Exception as err:
@@ -345,7 +511,7 @@ def file_read(fname, filetype="txt", line_length=80):
     """
     # Open and read the file.
     try:
-        with open(fname, "r", newline="") as data_file:
+        with _open_file(fname, "r") as data_file:
             if filetype == "txt":
                 data_list = list(data_file)
             elif filetype == "csv":
@@ -389,7 +555,7 @@ def file_write(fname, filetype, data_list, fieldnames=None, line_length=80):
     """
     # Open the file.
     try:
-        with open(fname, "w", newline="") as file:
+        with _open_file(fname, "w") as file:
             if filetype == "txt":
                 for line in data_list:
                     file.write(line)
@@ -400,7 +566,7 @@ def file_write(fname, filetype, data_list, fieldnames=None, line_length=80):
                 writer.writerows(data_list)
             # end if
         # end with
-    except OSError as err:
+    except (OSError, lzma.LZMAError) as err:
         print_status(
           "Warning", f"Error writing log file:  {err}",
           line_length=line_length)
@@ -418,7 +584,8 @@ def get_filename_open(filetype, line_length=80):
          and allows the user to choose one.
 
         Arguments:
-        - filetype -- extension of the file to open.
+        - filetype -- extension of the file to open, or a list of
+           acceptable extensions (the first is the default).
         - line_length -- the width of the screen in characters (default
            80).
 
@@ -426,6 +593,10 @@ def get_filename_open(filetype, line_length=80):
        -----------------------------------------------------------------
     """
     try:
+        # Allow either a single file type or a list of file types.
+        if type(filetype) == str:
+            filetype = [filetype]
+        # end if
         valid = False
         while not valid:
             prompt = (
@@ -447,8 +618,8 @@ def get_filename_open(filetype, line_length=80):
             elif fname != "?":
                 # If the user specified a filename but did not type the
                 #  extension, add it now.
-                if fname[-4:].lower() != ("." + filetype):
-                    fname += "." + filetype
+                if not _has_extension(fname, filetype):
+                    fname += "." + filetype[0]
                 # end if
                 # Then check to make sure the file exists.
                 if os.path.isfile(fname):
@@ -476,7 +647,7 @@ def get_filename_open(filetype, line_length=80):
                     # remove any files of the wrong filetype.
                     temp = []
                     for f in files:
-                        if f[-3:] == filetype:
+                        if _has_extension(f, filetype):
                             temp.append(f)
                         # end if
                     # end for
@@ -531,20 +702,15 @@ def get_input(prompt, typ="str", must_respond=True, line_length=80):
     try:
         # Loop.
         while True:
-            # Print the header line.
-            print("\n-=-=-{Input}", end="")
-            char = "-"
-            for n in range(12, line_length):
-                print(char, end="")
-                if char == "-":
-                    char = "="
-                else:
-                    char = "-"
-                # end if
-            # end for
-            print()
-            # Print the prompt text.
-            print_block(prompt, line_length=line_length)
+            # Compose the header line and the prompt text, and print
+            #  them all at once.
+            screen = ScreenBuffer()
+            screen.write()
+            screen.rule(line_length, label="Input")
+            screen.write(
+              print_block(prompt, line_length=line_length, ret_str=True),
+              end="")
+            screen.flush()
             # Put the prompt itself on the next line, and get a response.
             response = input(">>  ")
             # If the user must respond, check to make sure the response
@@ -596,32 +762,12 @@ def goodbye_screen(project_name, line_length=80):
        -----------------------------------------------------------------
     """
     try:
-        # Print header line.
-        begin = "-=-=-{Goodbye}"
-        print(begin, end="")
-        char = "-"
-        for n in range(14, line_length):
-            print(char, end="")
-            if char == "-":
-                char = "="
-            else:
-                char = "-"
-            # end if
-        # end for
-        print()
-        # Print message.
-        print(f"Thanks for using {project_name}!")
-        # Print footer line.
-        char = "-"
-        for n in range(line_length):
-            print(char, end="")
-            if char == "-":
-                char = "="
-            else:
-                char = "-"
-            # end if
-        # end for
-        print()
+        screen = ScreenBuffer()
+        # Header line, message and footer line.
+        screen.rule(line_length, label="Goodbye")
+        screen.write(f"Thanks for using {project_name}!")
+        screen.rule(line_length)
+        screen.flush()
         return
     except Exception as err:
         _z_exc("io_utils.py/goodbye_screen", err)
@@ -629,6 +775,25 @@ def goodbye_screen(project_name, line_length=80):
 # end function
 
 
+def is_compressed(fname):
+    """
+        Checks whether a file is compressed, by its extension.
+
+        Arguments:
+        - fname -- the filename to check.
+
+        Returns:  True if the file is compressed with gzip or xz, else
+         False.
+       -----------------------------------------------------------------
+    """
+    try:
+        return os.path.splitext(fname)[1].lower() in COMPRESSORS
+    except Exception as err:
+        _z_exc("io_utils.py/is_compressed", err)
+    # end try
+# end function
+
+
 def menu(
   options, option_type="options", confirm=False, keystroke=False,
   keystroke_list=[], match_case=False, multiple=False, lines=True, columns=1,
@@ -760,85 +925,19 @@ def print_block(string, line_length=80, lf=True, ret_str=False):
        -----------------------------------------------------------------
     """
     try:
-        if ret_str:
-            r_str = ""
-        # end if
-        # Break the string into words, along spaces, hyphens, and
-        #  newlines.
-        word_list = re.split(r"(\s)|(-)|(¤)", string)
-        col = 0
-        for word in word_list:
-            # Filter out None.
-            if word:
-                # If the word is a newline character, always print (or
-                #  add) a new line, and reset the column counter.
-                if word == "¤":
-                    if ret_str:
-                        r_str += "\n"
-                    else:
-                        print()
-                    # end if
-                    col = 0
-                # If there is EXACTLY one character left on the line--
-                elif col == line_length - 1:
-                    # If the word is a space or a hyphen, print or add
-                    #  it, and then a new line, and reset the column
-                    #  counter.
-                    if word in [" ", "-"]:
-                        if ret_str:
-                            r_str += word + "\n"
-                        else:
-                            print(word)
-                        # end if
-                        col = 0
-                    # If the word is anything else, print or add a new
-                    #  line, then the word, and reset the column
-                    #  counter.
-                    else:
-                        if ret_str:
-                            r_str += "\n" + word
-                        else:
-                            print("\n" + word, end="")
-                        # end if
-                        col = len(word)
-                    # end if
-                # In all other cases--
-                else:
-                    # Print or add the word if it won't run past the end
-                    #  of the line, and increment the column counter.
-                    if col + len(word) < line_length:
-                        if ret_str:
-                            r_str += word
-                        else:
-                            print(word, end="")
-                        # end if
-                        col += len(word)
-                    # If it would run past the end of the line, print or
-                    #  add a new line, then the word, and reset the
-                    #  column counter.
-                    else:
-                        if ret_str:
-                            r_str += "\n" + word
-                        else:
-                            print("\n" + word, end="")
-                        # end if
-                        col = len(word)
-                    # end if
-                # end if
-            # end if
-        # end for
-        # Print or add a newline at the end if called for.
+        # The block is only laid out the first time a string is printed
+        #  at a given width.
+        block = _wrap(string, line_length)
+        # Add a newline at the end if called for.
         if lf:
-            if ret_str:
-                r_str += "\n"
-            else:
-                print()
-            # end if
+            block += "\n"
         # end if
-        # Return the string if called for; otherwise we're done.
+        # Return the string if called for; otherwise print it all at
+        #  once.
         if ret_str:
-            return r_str
+            return block
         else:
+            sys.stdout.write(block)
             return
         # end if
     except Exception as err:
@@ -865,41 +964,21 @@ def print_status(msg_type, msg, go=False, line_length=80):
        -----------------------------------------------------------------
     """
     try:
-        # Print the beginning of the header line.
-        begin = "\n-=-=-{" + msg_type.title() + "}"
-        print(begin, end="")
-        # Print the remainder of the header line.
-        if len(begin) % 2 == 1:
-            char = "-"
-        else:
-            char = "="
-        # end if
-        for n in range(len(begin) - 1, line_length):
-            print(char, end="")
-            if char == "-":
-                char = "="
-            else:
-                char = "-"
-            # end if
-        # end for
-        print()
-        # Print the message.
+        screen = ScreenBuffer()
+        # The header line.
+        screen.write()
+        screen.rule(line_length, label=msg_type.title())
+        # The message.
         if len(msg) < line_length:
-            print(msg)
+            screen.write(msg)
         else:
-            print_block(msg, line_length=line_length)
+            screen.write(
+              print_block(msg, line_length=line_length, ret_str=True),
+              end="")
         # end if
-        # Print the footer line.
-        char = "-"
-        for n in range(line_length):
-            print(char, end="")
-            if char == "-":
-                char = "="
-            else:
-                char = "-"
-            # end if
-        # end for
-        print()
+        # The footer line.
+        screen.rule(line_length)
+        screen.flush()
         # Optionally wait for the user.
         if not go:
             input("Press [ENTER] to continue.")
@@ -911,6 +990,81 @@ def print_status(msg_type, msg, go=False, line_length=80):
 # end function
 
 
+def row_offsets(buf, start=0):
+    """
+        Finds where each row of csv data begins and ends.
+
+        Newlines inside quoted fields do not end a row.
+
+        Arguments:
+        - buf -- the csv data, as bytes (or any object which can be
+           searched and sliced like bytes, such as an mmap).
+
+        Keyword Arguments:
+        - start -- the offset at which to start (default 0).
+
+        Returns:  a list of (start, end) tuples, one for each row.
+       -----------------------------------------------------------------
+    """
+    try:
+        offsets = []
+        end = len(buf)
+        pos = start
+        while pos < end:
+            row_start = pos
+            quotes = 0
+            # A row ends at the first newline which is preceded by an
+            #  even number of quote marks (escaped quote marks are
+            #  doubled, so they don't change the count).
+            while pos < end:
+                nl = buf.find(b"\n", pos)
+                stop = end if nl == -1 else nl + 1
+                quotes += buf[pos:stop].count(b'"')
+                pos = stop
+                if quotes % 2 == 0:
+                    break
+                # end if
+            # end while
+            offsets.append((row_start, pos))
+        # end while
+        return offsets
+    except Exception as err:
+        _z_exc("io_utils.py/row_offsets", err)
+    # end try
+# end function
+
+
+@functools.lru_cache(maxsize=None)
+def rule_line(line_length, label=None):
+    """
+        Builds a "-=-=" rule line.
+
+        The pattern alternates by column, so a label at the start of the
+         line is written over the beginning of the pattern.
+
+        Arguments:
+        - line_length -- the width of the line in characters.
+
+        Keyword Arguments:
+        - label -- the label at the start of the line, such as "Status"
+           (default None).  It is written as "-=-=-{Status}".
+
+        Returns:  the line, without a new line.
+       -----------------------------------------------------------------
+    """
+    try:
+        if label is None:
+            begin = ""
+        else:
+            begin = "-=-=-{" + label + "}"
+        # end if
+        return begin + (RULE * line_length)[len(begin):line_length]
+    except Exception as err:
+        _z_exc("io_utils.py/rule_line", err)
+    # end try
+# end function
+
+
 def welcome_screen(project_no, project_name, line_length):
     """
         Clears the screen and prints introductory text.
@@ -926,36 +1080,19 @@ def welcome_screen(project_no, project_name, line_length):
     try:
         # Clear the screen.
         clear_screen()
-        # Print the header line.
-        print("-=-=-{Welcome}", end="")
-        char = "-"
-        for n in range(14, line_length):
-            print(char, end="")
-            if char == "-":
-                char = "="
-            else:
-                char = "-"
-            # end if
-        # end for
-        print()
-        # Print the welcome message.
-        print(
+        screen = ScreenBuffer()
+        # The header line.
+        screen.rule(line_length, label="Welcome")
+        # The welcome message.
+        screen.write(
           "Treehouse Python Techdegree Project #" +
           str(project_no) + ":")
-        print(project_name)
-        print("-" * (line_length))
-        print("Implemented by Steven Tagawa")
-        # Print the footer line.
-        char = "-"
-        for n in range(line_length):
-            print(char, end="")
-            if char == "-":
-                char = "="
-            else:
-                char = "-"
-            # end if
-        # end for
-        print()
+        screen.write(project_name)
+        screen.write("-" * (line_length))
+        screen.write("Implemented by Steven Tagawa")
+        # The footer line.
+        screen.rule(line_length)
+        screen.flush()
         return
     except Exception as err:
         _z_exc("io_utils.py/welcome_screen", err)
@@ -963,6 +1100,32 @@ def welcome_screen(project_no, project_name, line_length):
 # end function
 
 
+@functools.lru_cache(maxsize=WRAP_CACHE_SIZE)
+def wrap_lines(string, line_length=80):
+    """
+        Lays out a long string as a list of lines within a specified
+         width, as print_block would print it.
+
+        The layout is cached, so a string which has been laid out at the
+         same width before is found without laying it out again.
+
+        Arguments:
+        - string -- the string to lay out.  "¤" marks a new line.
+
+        Keyword Arguments:
+        - line_length -- the desired line length (default 80).
+
+        Returns:  a tuple of the lines, without line feeds.
+       -----------------------------------------------------------------
+    """
+    try:
+        return tuple(_wrap(string, line_length).split("\n"))
+    except Exception as err:
+        _z_exc("io_utils.py/wrap_lines", err)
+    # end try
+# end function
+
+
 def yes_no(prompt, clear=False, quit_=False, line_length=80):
     """
         Prompts the user to answer a yes or no question.
@@ -986,23 +1149,16 @@ def yes_no(prompt, clear=False, quit_=False, line_length=80):
             clear_screen()
         # Run in a loop until a valid response is obtained.
         while True:
-            # Print the header line.
-            print("\n-=-=-{Input}", end="")
-            char = "-"
-            for n in range(12, line_length):
-                print(char, end="")
-                if char == "-":
-                    char = "="
-                else:
-                    char = "-"
-                # end if
-            # end for
-            print()
-            # If the user can quit or back out, print instructions.
+            # Compose the header line (and, if the user can quit or back
+            #  out, instructions), and print them all at once.
+            screen = ScreenBuffer()
+            screen.write()
+            screen.rule(line_length, label="Input")
             if quit_:
-                wl_resource.print_nav(q=True, b=True)
-                print("-" * line_length)
+                wl_resource.print_nav(q=True, b=True, screen=screen)
+                screen.write("-" * line_length)
             # end if
+            screen.flush()
             # Print the prompt and get a response.
             response = input(prompt + " [Y]/[N] >>  ")
             # Because the function uses an RE method, make sure that the
@@ -1035,6 +1191,62 @@ def yes_no(prompt, clear=False, quit_=False, line_length=80):
 # end function
 
 
+@functools.lru_cache(maxsize=None)
+def _ansi_terminal():
+    """
+        Checks whether the screen can be cleared with ANSI escape codes.
+
+        The check is made once, and the result cached.
+
+        Arguments:  none.
+
+        Returns:  True if output goes to a terminal which understands
+         escape codes, else False.
+       -----------------------------------------------------------------
+    """
+    try:
+        if not sys.stdout.isatty():
+            return False
+        # end if
+        # The Windows console understands escape codes in Windows
+        #  Terminal, or when another program has set it up to.
+        if os.name == "nt":
+            return bool(
+              os.environ.get("WT_SESSION") or os.environ.get("ANSICON") or
+              os.environ.get("TERM"))
+        # end if
+        return os.environ.get("TERM", "") not in DUMB_TERMINALS
+    except Exception as err:
+        _z_exc("io_utils.py/_ansi_terminal", err)
+    # end try
+# end function
+
+
+def _has_extension(fname, filetypes):
+    """
+        Checks whether a filename ends with one of a list of extensions.
+
+        Arguments:
+        - fname -- the filename to check.
+        - filetypes -- a list of extensions (without the dot).
+
+        Returns:  True if the filename has one of the extensions, else
+         False.
+       -----------------------------------------------------------------
+    """
+    try:
+        for filetype in filetypes:
+            if fname.lower().endswith("." + filetype):
+                return True
+            # end if
+        # end for
+        return False
+    except Exception as err:
+        _z_exc("io_utils.py/_has_extension", err)
+    # end try
+# end function
+
+
 def _menu_build_display_list(
   options, option_type, prompt, keystroke, keystroke_list, line_length,
   multiple, quit_, top_level, header):
@@ -1167,47 +1379,38 @@ def _menu_display(
        -----------------------------------------------------------------
     """
     try:
-        # Print the menu and get a response.
-        print(
-          "\n-=-=-{Input}", end="")
-        char = "-"
-        for n in range(12, line_length):
-            print(char, end="")
-            if char == "-":
-                char = "="
-            else:
-                char = "-"
-            # end if
-        # end for
-        print()
+        # Compose the menu, and print it all at once.
+        screen = ScreenBuffer()
+        screen.write()
+        screen.rule(line_length, label="Input")
         # TODO:  Implement multi-column display.
         if len(prompt) < line_length:
-            print(prompt, "\n")
+            screen.write(prompt, "\n")
         else:
-            print_block(prompt)
-            print()
+            screen.write(print_block(prompt, ret_str=True))
         # end if
         for n, option in enumerate(display_list):
             if lines or (n >= len(display_list) - 2):
-                print(option)
+                screen.write(option)
             else:
-                print(option, end=", ")
+                screen.write(option, end=", ")
             # end if
         # end for
         if multiple:
-            print("\nSeparate multiple choices with commas.")
+            screen.write("\nSeparate multiple choices with commas.")
         # end if
-        # If necessary, print navigational options.
+        # If necessary, add navigational options.
         if nav and (prev or nxt):
-            print()
+            screen.write()
             if prev:
-                print("[P] Previous, ", end="")
+                screen.write("[P] Previous, ", end="")
             # end if
             if nxt:
-                print("[N] Next", end="")
+                screen.write("[N] Next", end="")
             # end if
-            print()
+            screen.write()
         # end if
+        screen.flush()
         return
     except Exception as err:
         _z_exc("io_utils.py/_menu_display", err)
@@ -1439,3 +1642,90 @@ def _menu_get_response(line_length):
         _z_exc("io_utils.py/_menu_get_response", err)
     # end try
 # end function
+
+
+def _open_file(fname, mode):
+    """
+        Opens a file for reading or writing text.
+
+        Files with a .gz or .xz extension are decompressed as they are
+         read, or compressed as they are written.
+
+        Arguments:
+        - fname -- the name of the file.
+        - mode -- "r" to read or "w" to write.
+
+        Returns:  a text file object.
+       -----------------------------------------------------------------
+    """
+    compressor = COMPRESSORS.get(os.path.splitext(fname)[1].lower())
+    if compressor:
+        return compressor.open(fname, mode + "t", newline="")
+    # end if
+    return open(fname, mode, newline="")
+# end function
+
+
+@functools.lru_cache(maxsize=WRAP_CACHE_SIZE)
+def _wrap(string, line_length):
+    """
+        Lays out (and caches) a long string within a specified width.
+
+        Arguments:
+        - string -- the string to lay out.  "¤" marks a new line.
+        - line_length -- the desired line length.
+
+        Returns:  the string, broken into lines, without a line feed at
+         the end.
+       -----------------------------------------------------------------
+    """
+    try:
+        # The block is built as a list of pieces, which are joined
+        #  once at the end.
+        parts = []
+        # Break the string into words, along spaces, hyphens, and
+        #  newlines.
+        word_list = WRAP_PATTERN.split(string)
+        col = 0
+        for word in word_list:
+            # Filter out None.
+            if word:
+                # If the word is a newline character, always add a new
+                #  line, and reset the column counter.
+                if word == "¤":
+                    parts.append("\n")
+                    col = 0
+                # If there is EXACTLY one character left on the line--
+                elif col == line_length - 1:
+                    # If the word is a space or a hyphen, add it, and
+                    #  then a new line, and reset the column counter.
+                    if word in [" ", "-"]:
+                        parts.append(word + "\n")
+                        col = 0
+                    # If the word is anything else, add a new line, then
+                    #  the word, and reset the column counter.
+                    else:
+                        parts.append("\n" + word)
+                        col = len(word)
+                    # end if
+                # In all other cases--
+                else:
+                    # Add the word if it won't run past the end of the
+                    #  line, and increment the column counter.
+                    if col + len(word) < line_length:
+                        parts.append(word)
+                        col += len(word)
+                    # If it would run past the end of the line, add a new
+                    #  line, then the word, and reset the column counter.
+                    else:
+                        parts.append("\n" + word)
+                        col = len(word)
+                    # end if
+                # end if
+            # end if
+        # end for
+        return "".join(parts)
+    except Exception as err:
+        _z_exc("io_utils.py/_wrap", err)
+    # end try
+# end function
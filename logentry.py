@@ -56,9 +56,10 @@ class LogEntry:
         A log entry object.
 
         Attributes:
-        - id -- the object's identifier, a random nine-digit integer.
-           (Not guaranteed to be unique, but the odds of duplication are
-           low enough to be acceptable for this program.)
+        - id -- the object's identifier.  A random nine-digit integer
+           until the entry is added to a work log, which gives it the
+           log's next ID (see wl_ids); only IDs given by the log are
+           guaranteed to be unique.
         - title -- the title assigned to the task.
         - date -- a date object; the date of the task.
         - time -- a time object; the start time of the task.
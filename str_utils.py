@@ -20,6 +20,8 @@
     - _datetime_fromisoformat -- converts a formatted string to a
        datetime object; replicates the fromisoformat method for
        environments below Python 3.7.
+    - _str_to_scalar -- converts an item of a container string to a
+       date/time, number or boolean value.
     - _time_fromisoformat -- converts a formatted string to a time
        object; replicates the fromisoformat method for environments
        below Python 3.7.
@@ -33,6 +35,27 @@ import re
 import datetime
 
 
+# Constants.
+# The characters which matter when scanning an item of a container
+#  string (the container characters, the separator and, in a quoted
+#  item, the quote mark), by separator and quote mark.
+SCAN_PATTERNS = {
+  (sep_char, quote_char): re.compile(
+    r"[()\[\]{}" + re.escape(sep_char + quote_char) + "]")
+  for sep_char in [",", ":"] for quote_char in ["", "'", '"']}
+# Numbers.
+COMPLEX_PATTERN = re.compile(r"[+-]?\d+(\.\d+)?[+-]{1}\d+(\.\d+)?j")
+FLOAT_PATTERN = re.compile(r"[+-]?\d+\.\d*(e\d*)?")
+INT_PATTERN = re.compile(r"[+-]?\d+")
+# Dates, times and durations (as written by str()).
+DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+TIME_PATTERN = re.compile(r"\d{2}:\d{2}:\d{2}")
+DATETIME_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}")
+TIMEDELTA_PATTERN = re.compile(
+  r"(?P<days>\d+)?( days, )?(?P<hours>\d{1,2}):(?P<minutes>\d{2})" +
+  r":(?P<seconds>\d{2})")
+
+
 def comma_str_from_list(lst):
     """
         Takes a list or other string-convertible iterable and returns
@@ -111,16 +134,16 @@ def str_to_container(string):
     while (string[0] == open_char) and (string[-1] == close_char):
         string = string[1:-1]
     # end while
-    # Initialize pointers and flags.
+    # Initialize pointers and flags.  Items are collected in a list (for
+    #  a dictionary, alternating keys and values), and the container is
+    #  built from the list at the end.
+    items = []
     char = ""
     quote = False
     quote_char = ""
     level = 0
     start = 0
     pos = 0
-    if type(container) == dict:
-        d_flag = "key"
-    # end if
     # Item parsing happens in an endless loop.
     while True:
         # Set start of current item.
@@ -137,7 +160,13 @@ def str_to_container(string):
         #  end of the string).
         while (pos < len(string) and (
                 (level > 0) or (quote) or (char != sep_char))):
-            # Read a character.
+            # Skip to the next character which matters, and read it.
+            match = SCAN_PATTERNS[sep_char, quote_char].search(string, pos)
+            if not match:
+                pos = len(string)
+                break
+            # end if
+            pos = match.start()
             char = string[pos]
             # Opening and closing container characters.  The level flag
             #  shows whether the item is a nested container.
@@ -171,44 +200,20 @@ def str_to_container(string):
         #  convert it.
         if item[0] in ["(", "[", "{"]:
             item = str_to_container(item)
-        # Otherwise, try to convert to a number or boolean value.
+        # Otherwise, try to convert to a date/time, number or boolean
+        #  value.
         else:
-            item = str_to_datetime(item)
-            item = str_to_num(item)
-            item = str_to_bool(item)
+            item = _str_to_scalar(item)
         # end if
-        # Add the item to the container.  For a list, just append.
-        if type(container) == list:
-            container.append(item)
-            # Tuples are immutable, so adding an item requires unpacking
-            #  and repacking the entire tuple.  We use a temporary list
-            #  for this.
-        if type(container) == tuple:
-            lst = []
-            for x in container:
-                lst.append(x)
-            # end for
-            lst.append(item)
-            container = tuple(lst)
-        # Dictionaries are the most complicated, because items are added
-        #  in pairs.
-        elif type(container) == dict:
-            # Check the flag.  It if's set to "key"...
-            if d_flag == "key":
-                # Store the key.
-                key_item = item
-                # Change the separator.
+        items.append(item)
+        # In a dictionary, keys are followed by ":" and values by ",".
+        if type(container) == dict:
+            if sep_char == ":":
                 sep_char = ","
-                # Flip the flag.
-                d_flag = "value"
-            # Else, add the key and value to the container.
             else:
-                container[key_item] = item
-                # Change the separator.
                 sep_char = ":"
-                # Flip the flag.
-                d_flag = "key"
             # end if
+        # end if
         # Advance the pointer past the separator and any whitespace.
         pos += 1
         while (pos < len(string)) and (string[pos] == " "):
@@ -220,8 +225,14 @@ def str_to_container(string):
         if pos >= len(string):
             break
     # end while
-    # All done; return the container.
-    return container
+    # All done; build and return the container.  (A key without a value
+    #  is dropped.)
+    if type(container) == dict:
+        return dict(zip(items[::2], items[1::2]))
+    elif type(container) == tuple:
+        return tuple(items)
+    # end if
+    return items
 # end function
 
 
@@ -242,21 +253,32 @@ def str_to_num(string):
         return string
     str_num = string
     # Strip parentheses.
-    while str_num[0] == "(" and str_num[-1] == ")":
+    while str_num[:1] == "(" and str_num[-1:] == ")":
         str_num = str_num[1:-1]
     # end while
-    # Complex number.
-    if re.search(r"[+-]?\d+(\.\d+)?[+-]{1}\d+(\.\d+)?j", str_num):
-            return complex(str_num)
-    # Floating point number.
-    elif re.search(r"[+-]?\d+\.\d*(e\d*)?", str_num):
-        return float(str_num)
+    # A number can only start with a digit, a sign, a decimal point or
+    #  a space.
+    first = str_num[:1]
+    if not first or not (
+      first.isdecimal() or first in "+-." or first.isspace()):
+        return string
+    # end if
     # Integer.
-    elif re.fullmatch(r"[+-]?\d+", str_num):
+    if INT_PATTERN.fullmatch(str_num):
         return int(str_num)
-    else:
-        return string
     # end if
+    # Complex and floating point numbers.  Strings which only contain a
+    #  number (like "1.5 hours") are left alone.
+    try:
+        if COMPLEX_PATTERN.search(str_num):
+            return complex(str_num)
+        elif FLOAT_PATTERN.search(str_num):
+            return float(str_num)
+        # end if
+    except ValueError:
+        pass
+    # end try
+    return string
 # end function
 
 
@@ -300,12 +322,17 @@ def str_to_datetime(string):
          possible, or the original string.
        -----------------------------------------------------------------
     """
-    # Error check.
-    if type(string) != str:
+    # Error check.  All of the formats start with a digit, and their
+    #  lengths and separators tell them apart before any pattern is
+    #  matched.
+    if type(string) != str or not string[:1].isdecimal():
         return string
+    # end if
+    length = len(string)
     # Check for date format.
-    match = re.fullmatch(r"\d{4}-\d{2}-\d{2}", string)
-    if match:
+    if (
+      length == 10 and string[4] == "-" and string[7] == "-" and
+      DATE_PATTERN.fullmatch(string)):
         # Put conversion in a try block in case the numbers aren't a
         #  valid date.
         try:
@@ -316,8 +343,9 @@ def str_to_datetime(string):
             return _date_fromisoformat(string)
         # end try
     # Check for time format.
-    match = re.fullmatch(r"\d{2}:\d{2}:\d{2}", string)
-    if match:
+    if (
+      length == 8 and string[2] == ":" and string[5] == ":" and
+      TIME_PATTERN.fullmatch(string)):
         # Put conversion in a try block in case the numbers aren't a
         #  valid time.
         try:
@@ -328,8 +356,9 @@ def str_to_datetime(string):
             return _time_fromisoformat(string)
         # end try
     # Check for datetime format.
-    match = re.match(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}", string)
-    if match:
+    if (
+      length >= 19 and string[10] == " " and string[13] == ":" and
+      DATETIME_PATTERN.match(string)):
         # Put conversion in a try block in case the numbers aren't a
         #  valid datetime.
         try:
@@ -340,9 +369,10 @@ def str_to_datetime(string):
             return _datetime_fromisoformat(string)
         # end try
     # Check for timedelta format.
-    match = re.fullmatch(
-          r"(?P<days>\d+)?( days, )?(?P<hours>\d{1,2}):(?P<minutes>\d{2})" +
-          r":(?P<seconds>\d{2})", string)
+    if length < 7 or string[-3] != ":" or string[-6] != ":":
+        return string
+    # end if
+    match = TIMEDELTA_PATTERN.fullmatch(string)
     if match:
         # Make sure days isn't None.
         if not match.group("days"):
@@ -420,6 +450,30 @@ def _datetime_fromisoformat(string):
 # end function
 
 
+def _str_to_scalar(string):
+    """
+        Converts an item of a container string to a date/time, number or
+         boolean value.
+
+        Only the converters which could succeed are tried:  dates, times
+         and numbers start with a digit, a sign, a decimal point or a
+         space.
+
+        Arguments:
+        - string -- the string to convert.
+
+        Returns:  the converted value, if applicable; or the original
+         string.
+       -----------------------------------------------------------------
+    """
+    first = string[0]
+    if first.isdigit() or first in "+-." or first.isspace():
+        return str_to_num(str_to_datetime(string))
+    # end if
+    return str_to_bool(string)
+# end function
+
+
 def _time_fromisoformat(string):
     """
         Creates a time object from a string, if that string is in the
@@ -18,6 +18,7 @@
        will recur.
     - _get_dates -- gets a list of integers from the user, representing
        days of the month.
+    - _print_dates -- prints a list of dates, three across.
     - _screen_reset -- clears the screen, prints the program header, and
        for the current task being added, displays the attributes which
        have been set.
@@ -65,6 +66,7 @@ try:
     import io_utils
     import str_utils
     import wl_datetime
+    import wl_recur
     import wl_resource
 except Exception as err:
     _z_exc("wl_add.py/module imports", err)
@@ -72,9 +74,9 @@ except Exception as err:
 
 
 # Constants.
-DAILY = 1
-WEEKLY = 2
-MONTHLY = 3
+# The number of recurrance dates shown at each end of the preview of a
+#  series.
+PREVIEW_PAGE = 30
 
 
 def add_date(wl_obj, entry, edit=False):
@@ -893,6 +895,36 @@ def _get_dates(wl_obj):
 # end function
 
 
+def _print_dates(wl_obj, date_list):
+    """
+        Prints a list of dates, three across.
+
+        Arguments:
+        - wl_obj -- the work log object.
+        - date_list -- the dates to print.
+
+        Returns:  nothing.
+       -----------------------------------------------------------------
+    """
+    try:
+        for n in range(len(date_list)):
+            print(
+              wl_datetime.dformat(date_list[n], wl_obj.date_format),
+              end=" " * 10)
+            if n % 3 == 2:
+                print()
+            # end if
+        # end for
+        if len(date_list) % 3:
+            print()
+        # end if
+        return
+    except Exception as err:
+        _z_exc("wl_add.py/_print_dates", err)
+    # end try
+# end function
+
+
 def _screen_reset(wl_obj, entry, entry_number):
     """
         Refreshes the screen with a task's attributes.
@@ -979,7 +1011,9 @@ def _set_occurrances(wl_obj, entry):
     """
         Calculates the specific dates for a recurring task.
 
-        Obtains an end date of recurrances from the user.
+        Obtains an end date of recurrances from the user.  Before the
+         user confirms the end date, only the number of dates and the
+         first and last PREVIEW_PAGE dates are calculated.
 
         Arguments:
         - wl_obj -- the work log object.
@@ -989,27 +1023,8 @@ def _set_occurrances(wl_obj, entry):
        -----------------------------------------------------------------
     """
     try:
-        recurrance_list = []
-        # The recurrance pattern is governed by five flags:
-        # * unit:  This is the base unit; daily, weekly, or monthly.
-        # * skip:  This denotes how often to skip the base unit.  For
-        #    example, if a task is flagged to recur on Tuesdays, a value
-        #    of [2] for skip would change the recurrance to every other
-        #    Tuesday.
-        # * days:  Only relevant if unit is weekly or monthly.  Day(s)
-        #    of the week for the task to recur.  Can be from [1]
-        #    (Sunday) to [7] (Saturday).  This value always needs to be
-        #    converted to and from Python's Monday-based week.
-        # * ordl:  Only relevant if unit is monthly and days of the week
-        #    are specified; indicates on which weekdays the task should
-        #    recur.  For example, if days is Tuesday, [1, 3] for ordl
-        #    indicates the first and third Tuesdays of each month.
-        # * dates:  Only relevant if unit is monthly; denotes days of
-        #    the month that the task should recur.  Can be from [1] to
-        #    [31] for absolute dates, and from [-1] to [-31] for dates
-        #    relative to the end of the month; dates before the first
-        #    day or after the last day of any particular month are
-        #    ignored.
+        # The recurrance pattern is governed by the flags in the
+        #  entry's rec_interval attribute; see wl_recur.
         #
         # The screen should have been reset just prior to the calling of
         #  this function.  Print the string representation of the
@@ -1058,200 +1073,37 @@ def _set_occurrances(wl_obj, entry):
                     valid = True
                 # end if
             # end while
-            # Calculate for daily options.
-            if entry.rec_interval["unit"] == DAILY:
-                # This is the simplest calculation.  Just skip the
-                #  appropriate number of days per occurrance.
-                # Use the skip argument to create a timedelta object.
-                interval = datetime.timedelta(days=entry.rec_interval["skip"])
-                # Now start creating dates, starting from the date of
-                #  the first occurrance.
-                cur_date = entry.date + interval
-                while cur_date <= end_date:
-                    recurrance_list.append(cur_date)
-                    cur_date += interval
-                # end while
-            # Calculate for weekly options.
-            elif entry.rec_interval["unit"] == WEEKLY:
-                # Weekly recurrances are a combination of days and
-                #  (optionally) a skip value.  The skip value determines
-                #  the interval between recurrances.
-                interval = 7 * entry.rec_interval["skip"]
-                # Identify the weekday of the original task (but note
-                #  that the task does not necessarily need to recur on
-                #  this day).
-                cur_date = []
-                start_day = wl_datetime.conv_wkday(entry.date.weekday())
-                for day in entry.rec_interval["days"]:
-                    if day == start_day:
-                        cur_date.append(
-                          entry.date + datetime.timedelta(days=interval))
-                    elif day > start_day:
-                        cur_date.append(
-                          entry.date +
-                          datetime.timedelta(days=(day - start_day)))
-                    else:
-                        cur_date.append(
-                          entry.date +
-                          datetime.timedelta(
-                            days=(day - start_day + interval)))
-                    # end if
-                # end for
-                # Make sure the recurrances get made in order.
-                cur_date.sort()
-                # Now start setting dates.
-                # If the end date is before the first recurrance, don't
-                #  do anything.
-                if not(end_date < cur_date[0]):
-                    # Loop.
-                    done = False
-                    while not done:
-                        # Loop through the recurrances.  The first one
-                        #  to be after the end date breaks the loop.
-                        for d in range(len(cur_date)):
-                            if cur_date[d] <= end_date:
-                                recurrance_list.append(cur_date[d])
-                                cur_date[d] += (
-                                  datetime.timedelta(days=interval))
-                            else:
-                                done = True
-                                break
-                            # end if
-                        # end for
-                    # end while
-                # end if
-            # Calculate for monthly options.
-            else:
-                # Monthly recurrances can be more complicated.  They can
-                #  occur on specific dates of the month, or specific
-                #  weekdays.  The latter is more complex because the
-                #  date(s) that the specific weekday(s) fall upon must
-                #  be recalculated for each month.
-                month = entry.date.month
-                year = entry.date.year
-                # First calculate for specific dates during the month.
-                if entry.rec_interval["dates"]:
-                    done = False
-                    while not done:
-                        # If any of the dates are negative (counting
-                        #  backwards from the end of the month), they
-                        #  need to be converted to positive dates for
-                        #  each new month.  (The original dates need to
-                        #  be stored and restored at the end of the
-                        #  loop, so they can be correctly converted for
-                        #  the next month.)
-                        orig_dates = list(entry.rec_interval["dates"])
-                        for d in range(len(entry.rec_interval["dates"])):
-                            if entry.rec_interval["dates"][d] < 0:
-                                # Need to offset plus one because -1
-                                #  represents the last day of the month.
-                                entry.rec_interval["dates"][d] = (
-                                  wl_datetime.last_date(month, year) +
-                                  entry.rec_interval["dates"][d] + 1)
-                            # end if
-                        # end for
-                        # Now resort the list.
-                        entry.rec_interval["dates"].sort()
-                        # Loop through the dates for recurrance.
-                        for date in entry.rec_interval["dates"]:
-                            # Ignore any numbers that are still
-                            #  negative.
-                            if date > 0:
-                                # The first recurrance to extend beyond
-                                #  the end date breaks the loop.
-                                try:
-                                    cur_date = datetime.date(year, month, date)
-                                    if entry.date < cur_date <= end_date:
-                                        recurrance_list.append(cur_date)
-                                    else:
-                                        if cur_date > end_date:
-                                            done = True
-                                            break
-                                        # end if
-                                    # end if
-                                except ValueError:
-                                    pass
-                                # end try
-                            # end if
-                        # end for
-                        # Increment the month.
-                        month += 1
-                        if month == 13:
-                            month = 1
-                            year += 1
-                        # end if
-                        # Restore the unaltered date list.
-                        entry.rec_interval["dates"] = list(orig_dates)
-                    # end while
-                # Calculate for specific weekdays during the month.
-                elif entry.rec_interval["days"]:
-                    done = False
-                    while not done:
-                        # Both ordl and days can have multiple values;
-                        #  ordl is the outside loop.
-                        for ordl in entry.rec_interval["ordinal"]:
-                            brk = False
-                            # Loop through each weekday
-                            for day in entry.rec_interval["days"]:
-                                cur_date = wl_datetime.find_weekday(
-                                  day, ordl, month, year)
-                                # If the function returns None, it means
-                                #  that that particular combination (for
-                                #  example, the fifth Friday) fell
-                                #  outside the month's range.  Bypass
-                                #  that date.
-                                if cur_date:
-                                    if cur_date > entry.date:
-                                        if cur_date <= end_date:
-                                            recurrance_list.append(cur_date)
-                                        else:
-                                            # If past the end date,
-                                            #  break all three loops.
-                                            brk = True
-                                            done = True
-                                            break
-                                        # end if
-                                    # end if
-                                # end if
-                            # end for
-                            if brk:
-                                break
-                            # end if
-                        # end for
-                        # Once all the occurances for the month are set,
-                        #  go on to the next month.
-                        month += 1
-                        if month > 12:
-                            month == 1
-                            year += 1
-                        # end if
-                    # end while
-                # end if
-            # end if
-            # Some occurances may be out of order; sort the list.
-            recurrance_list.sort()
+            # Count the dates.
+            total = wl_recur.count(entry.date, entry.rec_interval, end_date)
             # Now display the results.
-            if len(recurrance_list) == 1:
+            if total == 1:
                 t = "time"
             else:
                 t = "times"
             print(
-              f"This task will recur {len(recurrance_list)} {t} between ",
+              f"This task will recur {total} {t} between ",
               f"{wl_datetime.dformat(entry.date, wl_obj.date_format)} and ",
               f"{wl_datetime.dformat(end_date, wl_obj.date_format)}:", "\n")
-            # Print the recurrance dates, three across.
-            for n in range(len(recurrance_list)):
-                print(
-                  wl_datetime.dformat(recurrance_list[n], wl_obj.date_format),
-                  end=" " * 10)
-                if n % 3 == 2:
-                    print()
-                # end if
-            # end for
+            # Print the first recurrance dates and, if there are more
+            #  than will fit on two pages, the last ones.
+            if total <= PREVIEW_PAGE * 2:
+                _print_dates(wl_obj, wl_recur.page(
+                  entry.date, entry.rec_interval, 0, total, end_date))
+            else:
+                _print_dates(wl_obj, wl_recur.page(
+                  entry.date, entry.rec_interval, 0, PREVIEW_PAGE, end_date))
+                print(f"... ({total - PREVIEW_PAGE * 2} more) ...")
+                _print_dates(wl_obj, wl_recur.page(
+                  entry.date, entry.rec_interval, total - PREVIEW_PAGE,
+                  PREVIEW_PAGE, end_date))
+            # end if
             go = io_utils.yes_no("Proceed?", line_length=wl_obj.line_length)
             if go:
                 # Set the rec_interval attribute.
                 entry.rec_interval["end"] = end_date
+                # Now calculate all of the dates.
+                recurrance_list = wl_recur.date_list(wl_recur.date_array(
+                  entry.date, entry.rec_interval, end_date))
                 good = True
             else:
                 action = io_utils.menu(
@@ -0,0 +1,818 @@
+"""
+    Benchmarks for the Work Log program.
+
+    Usage:  python wl_benchmark.py [-n ROWS] [NAME ...]
+
+    Runs the named benchmarks (or all of them) and prints the timings.
+     Benchmarks which need a log file write a synthetic one, with ROWS
+     entries, to a temporary directory.
+
+    Public Functions:
+    - bench_add -- times adding entries to a log, one at a time and all
+       at once.
+    - bench_clear -- times clearing the screen by starting a process
+       and with escape codes.
+    - bench_compress -- times reading and writing plain and compressed
+       log files.
+    - bench_container -- times converting the container strings of
+       log entries.
+    - bench_help -- times creating help objects, reading the help file
+       each time and sharing one catalog.
+    - bench_manual -- times reading and laying out the user manual,
+       and finding it already laid out.
+    - bench_open -- times reading a log file serially and in parallel.
+    - bench_parse -- times parsing the date, time and duration examples
+       in the user manual.
+    - bench_pool -- times reading log entries with and without sharing
+       their strings, and reports the memory saved.
+    - bench_recur -- times calculating the dates of recurring tasks
+       over several decades.
+    - bench_wrap -- times laying out the help text, with and without
+       the cache of laid-out text.
+    - main -- runs the benchmarks named on the command line.
+    - make_log -- writes a synthetic log file.
+
+    Private Functions:
+    - _add_singly -- adds entries to a log one at a time.
+    - _load_entries -- creates log entries and their title index.
+    - _log_rows -- builds the rows of a synthetic log file.
+    - _parse_rounds -- parses a list of strings repeatedly.
+    - _report -- prints a line of benchmark results.
+    - _time -- times a function call.
+    - _z_exc -- generic exception handler.
+   ---------------------------------------------------------------------
+"""
+
+
+# Import sys.
+import sys
+
+
+def _z_exc(loc, err):
+    """
+        Catch-all exception handler.
+
+        Arguments:
+        - loc -- string naming the module/function/method in which the
+           exception occurred.
+        - err -- the exception string.
+
+        Returns:  nothing (exits program).
+       -----------------------------------------------------------------
+    """
+    # Print error information.
+    print("An interal error occurred in " + loc + ": ", err)
+    # Exit.
+    sys.exit(
+      "Please report the above error and the circumstances which caused it " +
+      "to the developer.")
+    return  # Superfluous return.
+# end function
+
+
+# Other imports.
+try:
+    import datetime
+    import os
+    import tempfile
+    import time
+
+    import io_utils
+    import logentry
+    import str_utils
+    import wl_datetime
+    import wl_help
+    import wl_ids
+    import wl_lexer
+    import wl_manual
+    import wl_parallel
+    import wl_pool
+    import wl_recur
+    import worklog
+except Exception as err:
+    _z_exc("wl_benchmark.py/module imports", err)
+# end try
+
+
+# Constants.
+ROWS = 100000
+# Screen widths the help text is laid out at.
+WIDTHS = [60, 80, 100]
+TITLES = [
+  "Office Hours", "Pick up check", "Lunch with Lisa", "Unit Brunch",
+  "Staff Meeting", "Code Review"]
+NOTES = [
+  "Regular hours...", "Reminder to pick up paycheck.", "Lunch out.",
+  "Early lunch."]
+# The rec_interval, rec_child_seq and info strings of the entries in
+#  test.csv, plus a series with exceptions (see wl_series).
+CONTAINERS = {
+  "rec_interval (none)":
+    "{unit: None, skip: None, days: None, ordinal: None, dates: None, " +
+    "end: None}",
+  "rec_interval (weekly)":
+    "{unit: 2, skip: 2, days: [3, 5], ordinal: None, dates: None, " +
+    "end: 2019-06-30}",
+  "rec_interval (monthly)":
+    "{unit: 3, skip: 1, days: None, ordinal: None, dates: [-1, 15], " +
+    "end: 2019-06-30}",
+  "rec_interval (series)":
+    "{unit: 2, skip: 1, days: [2, 4, 6], ordinal: None, dates: None, " +
+    "end: 2019-12-31, exceptions: [" + ", ".join(
+      f"2019-{month:02}-{day:02}" for month in range(1, 13)
+      for day in [7, 21]) + "]}",
+  "rec_child_seq": "(12, 17)",
+  "info":
+    "{total_entries: 65, date_format: M, time_format: 12, " +
+    "show_help: True, last_modified: 2019-03-16 17:04:00.861010}"}
+RECUR_YEARS = 50
+RULES = {
+  "daily": {"unit": 1, "skip": 1},
+  "weekly M/W/F": {"unit": 2, "skip": 1, "days": [2, 4, 6]},
+  "biweekly Tu": {"unit": 2, "skip": 2, "days": [3]},
+  "monthly 1/15/-1": {"unit": 3, "skip": 1, "dates": [1, 15, -1]},
+  "monthly 2nd/4th Tu": {
+    "unit": 3, "skip": 1, "days": [3], "ordinal": [2, 4]}}
+# The examples in Appendices B, C and D of the user manual.  The dates
+#  which are not accepted ("Apr 8th, 17", "December twenty-fifth" and
+#  "day after yesterday") are left out, as they print an error.
+PARSE_DATES = [
+  "3/15/19", "11-26-2017", "1.18.05", "June 15, 2019", "today",
+  "yesterday", "tomorrow",
+  "day after tomorrow", "Tuesday", "Fri", "Mo", "next Tuesday", "last Fri",
+  "the Monday before last", "Sat after next"]
+PARSE_TIMES = [
+  "5am", "15:40", "330 p.m.", "2.15p", "8 in the morning", "6 o'clock a.m.",
+  "11 o'clock at night", "eleven twenty-seven a.m.", "sixteen hundred",
+  "two in the afternoon", "midnight", "noon", "15 til 6 p.m.",
+  "twenty after 9 in the morning", "5 before 10am", "13 until noon",
+  "half 11 pm", "half past 3 in the morning"]
+PARSE_DURATIONS = [
+  "30 minutes", "1h", "3 hours 45 min", "0m", "eighty minutes"]
+
+
+def bench_add(tmp_dir, rows=ROWS):
+    """
+        Times adding entries to a log, one at a time (as the user adds
+         them) and all at once with WorkLog.add_many.
+
+        Adding entries one at a time sorts the indexes after each one,
+         so only a fiftieth as many entries are added that way.
+
+        Arguments:
+        - tmp_dir -- not used.
+
+        Keyword Arguments:
+        - rows -- the number of entries to add (default ROWS).
+
+        Returns:  nothing.
+       -----------------------------------------------------------------
+    """
+    try:
+        data = _log_rows(rows)
+        data.pop(0)
+        single_rows = max(rows // 50, 1)
+        for case, count in [
+          ("one at a time", single_rows), ("add_many entries", rows),
+          ("add_many dicts", rows)]:
+            wl_obj = worklog.WorkLog()
+            wl_obj.line_length = 80
+            if case == "add_many dicts":
+                items = [dict(row) for row in data[:count]]
+            else:
+                items = []
+                for row in data[:count]:
+                    entry = logentry.LogEntry()
+                    entry.from_dict(dict(row))
+                    items.append(entry)
+                # end for
+            # end if
+            if case == "one at a time":
+                elapsed = _time(lambda: _add_singly(wl_obj, items))
+            else:
+                elapsed = _time(lambda: wl_obj.add_many(items))
+            # end if
+            _report("add", case, elapsed, count)
+        # end for
+        return
+    except Exception as err:
+        _z_exc("wl_benchmark.py/bench_add", err)
+    # end try
+# end function
+
+
+def bench_clear(tmp_dir, rows=ROWS):
+    """
+        Times clearing the screen by starting a "clear" (or "cls")
+         process, as earlier versions did, and by writing escape codes,
+         and reports the time taken for each screen.
+
+        Output is sent to the null device.  Starting a process is slow,
+         so only a thousandth as many screens are cleared that way.
+
+        Arguments:
+        - tmp_dir -- not used.
+
+        Keyword Arguments:
+        - rows -- the number of screens to clear (default ROWS).
+
+        Returns:  nothing.
+       -----------------------------------------------------------------
+    """
+    try:
+        command = "cls" if os.name == "nt" else "clear"
+        command += f" > {os.devnull} 2>&1"
+        forked = max(rows // 1000, 1)
+        stdout = sys.stdout
+        with open(os.devnull, "w") as sys.stdout:
+            fork_time = _time(
+              lambda: [os.system(command) for n in range(forked)])
+            ansi_time = _time(lambda: [sys.stdout.write(
+              io_utils.CLEAR_MARKER + io_utils.CLEAR_CODES)
+              for n in range(rows)])
+        # end with
+        sys.stdout = stdout
+        _report(
+          "clear", "process", fork_time, forked,
+          f"{fork_time / forked * 1e6:,.1f} us/screen")
+        _report(
+          "clear", "escape codes", ansi_time, rows,
+          f"{ansi_time / rows * 1e6:,.3f} us/screen")
+        return
+    except Exception as err:
+        _z_exc("wl_benchmark.py/bench_clear", err)
+    # end try
+# end function
+
+
+def bench_compress(tmp_dir, rows=ROWS):
+    """
+        Times reading and writing plain and compressed log files.
+
+        Arguments:
+        - tmp_dir -- the directory in which to write the log files.
+
+        Keyword Arguments:
+        - rows -- the number of entries in the log (default ROWS).
+
+        Returns:  nothing.
+       -----------------------------------------------------------------
+    """
+    try:
+        data_list = _log_rows(rows)
+        for ext in ["csv", "csv.gz", "csv.xz"]:
+            fname = os.path.join(tmp_dir, "bench_compress." + ext)
+            elapsed = _time(lambda: io_utils.file_write(
+              fname, "csv", data_list,
+              fieldnames=logentry.LogEntry.FIELDNAMES))
+            size = os.path.getsize(fname)
+            _report("compress", f"write {ext}", elapsed, rows, f"{size:,} B")
+            elapsed = _time(lambda: io_utils.file_read(fname, filetype="csv"))
+            _report("compress", f"read {ext}", elapsed, rows, f"{size:,} B")
+        # end for
+        return
+    except Exception as err:
+        _z_exc("wl_benchmark.py/bench_compress", err)
+    # end try
+# end function
+
+
+def bench_container(tmp_dir, rows=ROWS):
+    """
+        Times converting the container strings of log entries.
+
+        Arguments:
+        - tmp_dir -- not used.
+
+        Keyword Arguments:
+        - rows -- the number of times to convert each string (default
+           ROWS).
+
+        Returns:  nothing.
+       -----------------------------------------------------------------
+    """
+    try:
+        for case, string in CONTAINERS.items():
+            elapsed = _time(lambda: [
+              str_utils.str_to_container(string) for n in range(rows)])
+            _report("container", case, elapsed, rows, f"{len(string)} chars")
+        # end for
+        return
+    except Exception as err:
+        _z_exc("wl_benchmark.py/bench_container", err)
+    # end try
+# end function
+
+
+def bench_help(tmp_dir, rows=ROWS):
+    """
+        Times creating a help object and showing one help string, with a
+         new catalog (which reads the help file, as every help object
+         used to) and with the program's shared catalog.
+
+        Arguments:
+        - tmp_dir -- not used.
+
+        Keyword Arguments:
+        - rows -- ten times the number of help objects (default ROWS).
+
+        Returns:  nothing.
+       -----------------------------------------------------------------
+    """
+    try:
+        count = max(rows // 10, 1)
+        key = next(iter(wl_help.get_catalog()))
+        elapsed = _time(lambda: [
+          wl_help.HelpCatalog()[key] for n in range(count)])
+        _report("help", "read", elapsed, count)
+        base = elapsed
+        elapsed = _time(lambda: [
+          wl_help.WlHelp().help_list[key] for n in range(count)])
+        _report("help", "shared", elapsed, count, f"{base / elapsed:.0f}x")
+        return
+    except Exception as err:
+        _z_exc("wl_benchmark.py/bench_help", err)
+    # end try
+# end function
+
+
+def bench_manual(tmp_dir, rows=ROWS):
+    """
+        Times reading the user manual and laying it out at several
+         widths, with the manual's caches emptied before each round
+         ("cold") and kept ("cached").
+
+        Arguments:
+        - tmp_dir -- not used.
+
+        Keyword Arguments:
+        - rows -- a thousand times the number of rounds (default ROWS).
+
+        Returns:  nothing.
+       -----------------------------------------------------------------
+    """
+    try:
+        rounds = max(rows // 1000, 1)
+        count = rounds * len(WIDTHS)
+        for case in ["cold", "cached"]:
+            elapsed = 0
+            for n in range(rounds):
+                if case == "cold":
+                    wl_manual.load.cache_clear()
+                    wl_manual._layout.cache_clear()
+                # end if
+                elapsed += _time(lambda: [
+                  wl_manual._layout(width) for width in WIDTHS])
+            # end for
+            lines = len(wl_manual._layout(WIDTHS[0])[0])
+            _report("manual", case, elapsed, count, f"{lines:,} lines")
+        # end for
+        return
+    except Exception as err:
+        _z_exc("wl_benchmark.py/bench_manual", err)
+    # end try
+# end function
+
+
+def bench_open(tmp_dir, rows=ROWS):
+    """
+        Times reading a log file serially and in parallel.
+
+        Arguments:
+        - tmp_dir -- the directory in which to write the log file.
+
+        Keyword Arguments:
+        - rows -- the number of entries in the log (default ROWS).
+
+        Returns:  nothing.
+       -----------------------------------------------------------------
+    """
+    try:
+        fname = os.path.join(tmp_dir, "bench_open.csv")
+        make_log(fname, rows)
+
+        def serial():
+            data = io_utils.file_read(fname, filetype="csv")
+            data.pop(0)
+            title_sort = []
+            date_sort = []
+            for row in data:
+                entry = logentry.LogEntry()
+                entry.from_dict(row)
+                title_sort.append((entry.title, entry.datetime, entry.id))
+                date_sort.append((entry.datetime, entry.title, entry.id))
+            # end for
+            title_sort.sort()
+            date_sort.sort()
+        # end function
+
+        base = _time(serial)
+        _report("open", "serial", base, rows)
+        for workers in sorted({2, 4, os.cpu_count() or 1}):
+            elapsed = _time(
+              lambda: wl_parallel.read_log(fname, workers=workers))
+            _report(
+              "open", f"{workers} workers", elapsed, rows,
+              f"{base / elapsed:.2f}x")
+        # end for
+        return
+    except Exception as err:
+        _z_exc("wl_benchmark.py/bench_open", err)
+    # end try
+# end function
+
+
+def bench_parse(tmp_dir, rows=ROWS):
+    """
+        Times parsing the date, time and duration examples in the user
+         manual.
+
+        Each kind of example is parsed three ways:  with every cache
+         emptied first ("cold"), with only the classified words cached
+         ("words"), and with the parsed strings cached as well
+         ("cached").
+
+        Arguments:
+        - tmp_dir -- not used.
+
+        Keyword Arguments:
+        - rows -- the number of strings to parse for each case (default
+           ROWS).
+
+        Returns:  nothing.
+       -----------------------------------------------------------------
+    """
+    try:
+        wl_obj = worklog.WorkLog()
+        wl_obj.line_length = 80
+        wl_obj.date_format = "M"
+        wl_obj.time_format = 12
+        cases = [
+          ("dates", PARSE_DATES,
+           lambda string: wl_datetime.parse_date_input(wl_obj, string)),
+          ("times", PARSE_TIMES,
+           lambda string: wl_datetime.parse_time_input(wl_obj, string)),
+          ("durations", PARSE_DURATIONS,
+           lambda string: wl_datetime.calc_duration_abs(wl_obj, string))]
+        for case, examples, parse in cases:
+            rounds = max(1, rows // len(examples))
+            count = rounds * len(examples)
+            for mode in ["cold", "words", "cached"]:
+                elapsed = _time(lambda: _parse_rounds(
+                  examples, parse, rounds, mode))
+                _report("parse", f"{case} ({mode})", elapsed, count)
+            # end for
+        # end for
+        return
+    except Exception as err:
+        _z_exc("wl_benchmark.py/bench_parse", err)
+    # end try
+# end function
+
+
+def bench_pool(tmp_dir, rows=ROWS):
+    """
+        Times reading log entries with and without sharing their titles
+         and notes, and reports the memory saved.
+
+        Arguments:
+        - tmp_dir -- the directory in which to write the log file.
+
+        Keyword Arguments:
+        - rows -- the number of entries in the log (default ROWS).
+
+        Returns:  nothing.
+       -----------------------------------------------------------------
+    """
+    try:
+        fname = os.path.join(tmp_dir, "bench_pool.csv")
+        make_log(fname, rows)
+        data = io_utils.file_read(fname, filetype="csv")
+        data.pop(0)
+        base = _time(lambda: _load_entries(data, None))
+        _report("pool", "fresh strings", base, rows)
+        pool = wl_pool.StringPool()
+        elapsed = _time(lambda: _load_entries(data, pool))
+        stats = pool.stats()
+        _report(
+          "pool", "pooled", elapsed, rows,
+          f"{base / elapsed:.2f}x, {stats['strings']} strings, " +
+          f"{stats['saved']:,} B saved")
+        return
+    except Exception as err:
+        _z_exc("wl_benchmark.py/bench_pool", err)
+    # end try
+# end function
+
+
+def bench_recur(tmp_dir, rows=ROWS):
+    """
+        Times calculating the dates of recurring tasks.
+
+        Each rule in RULES is expanded over RECUR_YEARS years, both by
+         the generator and by date_array (which only differs from the
+         generator if NumPy is installed).
+
+        Arguments:
+        - tmp_dir -- not used.
+
+        Keyword Arguments:
+        - rows -- not used.
+
+        Returns:  nothing.
+       -----------------------------------------------------------------
+    """
+    try:
+        start = datetime.date(2000, 1, 3)
+        end = start.replace(year=start.year + RECUR_YEARS)
+        for case, rule in RULES.items():
+            dates = []
+            elapsed = _time(lambda: dates.extend(
+              wl_recur.occurrances(start, rule, end=end)))
+            _report(
+              "recur", case, elapsed, len(dates), f"{len(dates):,} dates")
+            elapsed = _time(lambda: wl_recur.date_array(start, rule, end))
+            _report(
+              "recur", case + " (array)", elapsed, len(dates),
+              "numpy" if wl_recur.numpy is not None else "no numpy")
+        # end for
+        return
+    except Exception as err:
+        _z_exc("wl_benchmark.py/bench_recur", err)
+    # end try
+# end function
+
+
+def bench_wrap(tmp_dir, rows=ROWS):
+    """
+        Times laying out the help text at several widths, with the cache
+         of laid-out text emptied before each round ("cold") and kept
+         ("cached").
+
+        Arguments:
+        - tmp_dir -- not used.
+
+        Keyword Arguments:
+        - rows -- a thousand times the number of rounds (default ROWS).
+
+        Returns:  nothing.
+       -----------------------------------------------------------------
+    """
+    try:
+        rounds = max(rows // 1000, 1)
+        help_list = list(wl_help.WlHelp().help_list.values())
+        count = rounds * len(help_list) * len(WIDTHS)
+        for case in ["cold", "cached"]:
+            elapsed = 0
+            for n in range(rounds):
+                if case == "cold":
+                    io_utils._wrap.cache_clear()
+                # end if
+                elapsed += _time(lambda: [
+                  io_utils.print_block(text, line_length=width, ret_str=True)
+                  for width in WIDTHS for text in help_list])
+            # end for
+            _report("wrap", case, elapsed, count)
+        # end for
+        return
+    except Exception as err:
+        _z_exc("wl_benchmark.py/bench_wrap", err)
+    # end try
+# end function
+
+
+def main(args):
+    """
+        Runs the benchmarks named on the command line.
+
+        Arguments:
+        - args -- the command-line arguments (not including the script
+           name).
+
+        Returns:  nothing.
+       -----------------------------------------------------------------
+    """
+    try:
+        rows = ROWS
+        if len(args) >= 2 and args[0] == "-n":
+            rows = int(args[1])
+            args = args[2:]
+        # end if
+        names = args or list(BENCHMARKS)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for name in names:
+                if name not in BENCHMARKS:
+                    print(f"Unknown benchmark:  {name}")
+                    continue
+                # end if
+                BENCHMARKS[name](tmp_dir, rows=rows)
+            # end for
+        # end with
+        return
+    except Exception as err:
+        _z_exc("wl_benchmark.py/main", err)
+    # end try
+# end function
+
+
+def make_log(fname, rows):
+    """
+        Writes a synthetic log file.
+
+        Arguments:
+        - fname -- the name of the file to write.
+        - rows -- the number of entries to write.
+
+        Returns:  nothing.
+       -----------------------------------------------------------------
+    """
+    try:
+        io_utils.file_write(
+          fname, "csv", _log_rows(rows),
+          fieldnames=logentry.LogEntry.FIELDNAMES)
+        return
+    except Exception as err:
+        _z_exc("wl_benchmark.py/make_log", err)
+    # end try
+# end function
+
+
+def _add_singly(wl_obj, entries):
+    """
+        Adds entries to a log one at a time, as the user adds them.
+
+        Arguments:
+        - wl_obj -- the work log object.
+        - entries -- the entries to add.
+
+        Returns:  nothing.
+       -----------------------------------------------------------------
+    """
+    try:
+        for entry in entries:
+            entry.id = wl_ids.allocate(wl_obj)
+            wl_obj.strings.intern_entry(entry)
+            wl_obj._do_sort(entry)
+            wl_obj.entries.append(entry)
+            wl_obj.mark_dirty(entry)
+        # end for
+        return
+    except Exception as err:
+        _z_exc("wl_benchmark.py/_add_singly", err)
+    # end try
+# end function
+
+
+def _load_entries(data, pool):
+    """
+        Creates log entries and their sorted title index.
+
+        Arguments:
+        - data -- the list of dictionaries read from a log file.
+        - pool -- the string pool to share the entries' strings through,
+           or None.
+
+        Returns:  the title index.
+       -----------------------------------------------------------------
+    """
+    try:
+        title_sort = []
+        for row in data:
+            entry = logentry.LogEntry()
+            # The dictionary is converted in place, so it is copied.
+            entry.from_dict(dict(row))
+            if pool is not None:
+                pool.intern_entry(entry)
+            # end if
+            title_sort.append((entry.title, entry.datetime, entry.id))
+        # end for
+        title_sort.sort()
+        return title_sort
+    except Exception as err:
+        _z_exc("wl_benchmark.py/_load_entries", err)
+    # end try
+# end function
+
+
+def _log_rows(rows):
+    """
+        Builds the rows of a synthetic log file.
+
+        Arguments:
+        - rows -- the number of entries.
+
+        Returns:  a list of dictionaries, the first holding the work
+         log's info.
+       -----------------------------------------------------------------
+    """
+    try:
+        header = logentry.LogEntry()
+        header.info = {
+          "total_entries": rows, "date_format": "M", "time_format": 12,
+          "show_help": True, "last_modified": datetime.datetime(2019, 1, 1)}
+        data_list = [header.to_dict()]
+        start = datetime.datetime(2019, 1, 1, 9)
+        for n in range(rows):
+            entry = logentry.LogEntry()
+            entry.id = n + 1
+            entry.title = TITLES[n % len(TITLES)]
+            entry.datetime = start + datetime.timedelta(hours=n * 7)
+            entry.date = entry.datetime.date()
+            entry.time = entry.datetime.time()
+            entry.duration = datetime.timedelta(minutes=15 * (n % 12 + 1))
+            entry.notes = NOTES[n % len(NOTES)]
+            entry.recurring = False
+            data_list.append(entry.to_dict())
+        # end for
+        return data_list
+    except Exception as err:
+        _z_exc("wl_benchmark.py/_log_rows", err)
+    # end try
+# end function
+
+
+def _parse_rounds(examples, parse, rounds, mode):
+    """
+        Parses a list of strings repeatedly.
+
+        Arguments:
+        - examples -- the strings to parse.
+        - parse -- the function which parses a string.
+        - rounds -- the number of times to parse the list.
+        - mode -- "cold" to empty every cache before each round, "words"
+           to empty the caches of parsed strings, or "cached".
+
+        Returns:  nothing.
+       -----------------------------------------------------------------
+    """
+    try:
+        for n in range(rounds):
+            if mode == "cold":
+                wl_lexer.clear_cache()
+            # end if
+            if mode in ["cold", "words"]:
+                wl_datetime.clear_caches()
+            # end if
+            for string in examples:
+                parse(string)
+            # end for
+        # end for
+        return
+    except Exception as err:
+        _z_exc("wl_benchmark.py/_parse_rounds", err)
+    # end try
+# end function
+
+
+def _report(name, case, elapsed, rows, extra=""):
+    """
+        Prints a line of benchmark results.
+
+        Arguments:
+        - name -- the name of the benchmark.
+        - case -- the case being timed.
+        - elapsed -- the time taken, in seconds.
+        - rows -- the number of items processed.
+
+        Keyword Arguments:
+        - extra -- any other information to print (default "").
+
+        Returns:  nothing.
+       -----------------------------------------------------------------
+    """
+    rate = rows / elapsed if elapsed else float("inf")
+    print(
+      f"{name:<12}{case:<28}{elapsed:>10.3f}s{rate:>14,.0f}/s  {extra}")
+# end function
+
+
+def _time(func):
+    """
+        Times a function call.
+
+        Arguments:
+        - func -- the function to call (with no arguments).
+
+        Returns:  the time taken, in seconds.
+       -----------------------------------------------------------------
+    """
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+# end function
+
+
+# Benchmarks, by name.
+BENCHMARKS = {
+  "add": bench_add, "clear": bench_clear, "compress": bench_compress,
+  "container": bench_container, "help": bench_help, "manual": bench_manual,
+  "open": bench_open, "parse": bench_parse, "pool": bench_pool,
+  "recur": bench_recur, "wrap": bench_wrap}
+
+
+# PROGRAM STARTS HERE
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    main(sys.argv[1:])
+# end if
+# end program
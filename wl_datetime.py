@@ -7,6 +7,7 @@
     - calc_duration_rel -- calculates a duration given a task's start
        time and the user's input of an end time, and converts it to a
        timedelta object.
+    - clear_caches -- empties the caches of parsed strings.
     - conv_wkday -- converts an integer representing a day of the week
        from Python's Monday-based week to a Sunday-based week.
     - dformat -- converts a date object to a string based on the user's
@@ -14,6 +15,7 @@
     - find_weekday -- determines the day of the month on which a
        specified day of the week falls.
     - last_date -- determines the last date of a month.
+    - month_table -- gets (and caches) the calendar of a month.
     - parse_date_calendar -- parses a list of 2 or 3 elements to see if
        it contains a valid date with the month or day written out.
     - parse_date_input -- the primary date parser; takes the user's
@@ -24,17 +26,26 @@
     - parse_date_phrase -- parses the user's input to see if it is a
        word or phrase that represents a valid date; if it is, creates a
        date object.
+    - parse_dates -- parses a batch of date strings, without any
+       output.
     - parse_duration_input -- the main duration parser; takes the user's
        input of a duration or an end time and runs it through various
        parsing functions to try to interpret it.
+    - parse_durations -- parses a batch of duration strings, without
+       any output.
     - parse_time_input -- the main time parser; takes the user's input
        of a time, in any format, and formats it so that it can be
        validated.
+    - parse_times -- parses a batch of time strings, without any
+       output.
     - set_endian -- sets or resets the user's preferred date format.
     - set_time_format -- sets or resets the user's preferred time
        format.
 
     Private Functions:
+    - _batch_date -- parses one string of a batch of dates.
+    - _batch_duration -- parses one string of a batch of durations.
+    - _batch_time -- parses one string of a batch of times.
     - _check_calendar_date -- checks a set of 2 or 3 elements to see if
        they form a valid date in the user's preferred date format.
     - _check_other_endians -- checks a list of 3 numbers to see if they
@@ -44,6 +55,17 @@
        specified day of the week.
     - _create_time -- takes the user's input of a time and attempts to
        create a time object from it.
+    - _parse_date_calendar -- the parsing (without any output) for
+       parse_date_calendar.
+    - _parse_date_numeric -- the parsing (without any output) for
+       parse_date_numeric.
+    - _parse_date_phrase -- the parsing (without any output) for
+       parse_date_phrase.
+    - _parse_duration -- the parsing (without any output) for
+       calc_duration_abs.
+    - _parse_each -- parses each distinct string in a batch once.
+    - _parse_time -- the parsing (without any output) for
+       parse_time_input.
     - _z_exc -- generic exception handler.
    ---------------------------------------------------------------------
 """
@@ -78,15 +100,44 @@ def _z_exc(loc, err):
 # Other imports.
 try:
     import datetime
+    import functools
     import re
 
     import io_utils
-    import wl_resource
+    import wl_lexer
 except Exception as err:
     _z_exc("wl_datetime.py/module imports", err)
 # end try
 
 
+# Constants.
+# The number of months whose calendars are cached (400 years).
+CALENDAR_CACHE_SIZE = 4800
+# The number of parsed strings of each kind which are cached.
+PARSE_CACHE_SIZE = 512
+# Result codes for batch parsing.
+PARSED = 0
+NOT_PARSED = 1
+OTHER_FORMAT = 2
+NEGATIVE = 3
+# Dates.
+NUMERIC_DATE_PATTERN = re.compile(r"^\d{1,4}[-/.]{1}\d{1,4}[-/.]?\d{1,4}$")
+DIGITS_PATTERN = re.compile(r"\d+")
+DAY_AFTER_PATTERN = re.compile(r"day after tomorrow", re.I)
+DAY_BEFORE_PATTERN = re.compile(r"day before yesterday", re.I)
+# Times.
+AM_PATTERN = re.compile(r"([\d|\s]a\.?m?\.?$)|(morning)", re.I)
+PM_PATTERN = re.compile(
+  r"([\d|\s]p\.?m?\.?$)|(afternoon)|(evening)|(night)", re.I)
+AMPM_PATTERN = re.compile(r"\s?(a|p)?\.?m?\.?$", re.I)
+TIME_WORD_PATTERN = re.compile("|".join([
+  "\bmorning\b", "\bafternoon\b", "\bevening\b", "\bnight\b", "\bin\b",
+  "\bthe\b", "\bat\b", "\bo'clock\b", "\bpast\b"]))
+NUMERIC_TIME_PATTERN = re.compile(r"\d{1,2}(:|\.)?\d{0,2}", re.I)
+NON_DIGIT_PATTERN = re.compile(r"\D")
+TIME_PART_PATTERN = re.compile(r"\D+|\d+")
+
+
 def calc_duration_abs(wl_obj, string):
     """
         Parses a string and determines the duration it describes.
@@ -100,97 +151,10 @@ def calc_duration_abs(wl_obj, string):
        -----------------------------------------------------------------
     """
     try:
-        # If the string is "max", return the maximum timedelta.
-        if string.lower() == "max":
-            return datetime.timedelta.max
-        # end if
-        # Otherwise the string must contain one or more number/word
-        #  pairs:  a number (or number phrase) and a unit of measure.
-        #  These should (but need not be) in descending order.
-        #
-        # First, convert any numbers.
-        raw_list = wl_resource.numbers(string)
-        # Then cull unneeded elements from the list.
-        word_list = []
-        for word in raw_list:
-            if not ((word is None) or (str(word).lower() == "and")):
-                word_list.append(word)
-            # end if
-        # end for
-        # Now move through the string from left to right.
-        minutes = None
-        hours = None
-        days = None
-        ndx = 0
-        while ndx < len(word_list):
-            amt = None
-            # An inner loop adds numbers together.  If there aren't any,
-            #  amt will remain None.  (The function must differentiate
-            #  here between None and 0.)
-            while (
-              (ndx < len(word_list) and type(word_list[ndx]) in [int, float])):
-                if amt is None:
-                    amt = word_list[ndx]
-                else:
-                    amt += word_list[ndx]
-                # end if
-                ndx += 1
-            # end while
-            # If there was no amount, check for an unspaced number/unit
-            #  combination.
-            if amt is None:
-                if re.match(r"\d+m[inutes]?", word_list[ndx]):
-                    minutes = int(re.match(r"\d+", word_list[ndx]).group())
-                    ndx += 1
-                    continue
-                if re.match(r"\d+h[ours]?", word_list[ndx]):
-                    hours = int(re.match(r"\d+", word_list[ndx]).group())
-                    ndx += 1
-                    continue
-                if re.match(r"\d+d[ays]?", word_list[ndx]):
-                    days = int(re.match(r"\d+", word_list[ndx]).group())
-                    ndx += 1
-                    continue
-                # Otherwise just move to the next word.
-                ndx += 1
-                continue
-            # end if
-            # Determine the units (if not valid, just move to the next
-            #  word).  But don't do this if the previous word was the
-            #  last.
-            if ndx < len(word_list):
-                if re.match(r"m\w*", word_list[ndx]):
-                    minutes = amt
-                elif re.match(r"h\w*", word_list[ndx]):
-                    hours = amt
-                elif re.match(r"d\w*?", word_list[ndx]):
-                    days = amt
-                # end if
-                ndx += 1
-            # end if
-        # end while
-        # Having gone through the list, see if any times were found.  If
-        #  not, return None.
-        if (minutes is None) and (hours is None) and (days is None):
-            return None
-        # end if
-        # Change non-present units to zeroes.
-        if not minutes:
-            minutes = 0
-        # end if
-        if not hours:
-            hours = 0
-        # end if
-        if not days:
-            days = 0
-        # end if
-        # Create a timedelta created from the times found.  Note that
-        #  zero minutes is a valid duration, but negative durations are
-        #  not valid.
-        td = datetime.timedelta(days=days, hours=hours, minutes=minutes)
+        td = _parse_duration(string)
         # Check if the timedelta is negative.  If it is, print an error
         #  and return None.
-        if td < datetime.timedelta():
+        if td is not None and td < datetime.timedelta():
             io_utils.print_status(
               "Error", "The duration cannot be negative.",
               line_length=wl_obj.line_length)
@@ -239,6 +203,30 @@ def calc_duration_rel(wl_obj, end_time, start_time):
 # end function
 
 
+def clear_caches():
+    """
+        Empties the caches of parsed strings.
+
+        The cache of classified words (see wl_lexer) is kept.
+
+        Arguments:  none.
+
+        Returns:  nothing.
+       -----------------------------------------------------------------
+    """
+    try:
+        _parse_date_calendar.cache_clear()
+        _parse_date_numeric.cache_clear()
+        _parse_date_phrase.cache_clear()
+        _parse_duration.cache_clear()
+        _parse_time.cache_clear()
+        return
+    except Exception as err:
+        _z_exc("wl_datetime/clear_caches", err)
+    # end try
+# end function
+
+
 def conv_wkday(day, iso=False):
     """
         Converts from Monday-based weekday to Sunday-based.
@@ -313,23 +301,14 @@ def find_weekday(day, ordinal, month, year):
        -----------------------------------------------------------------
     """
     try:
-        # First determine the weekday on which the specified month starts.
-        first_day = conv_wkday(datetime.date(year, month, 1).weekday())
-        # Apply the correct formula to find the date.
-        if day == first_day:
-            date = 1 + (ordinal - 1) * 7
-        elif day > first_day:
-            date = 1 + day - first_day + (ordinal - 1) * 7
+        # Look up the dates on which the day falls in the month.  If
+        #  there are not enough of them, return None.
+        dates = month_table(month, year)[2][day]
+        if 1 <= ordinal <= len(dates):
+            return datetime.date(year, month, dates[ordinal - 1])
         else:
-            date = 1 + (7 - (first_day - day)) + (ordinal - 1) * 7
-        # end if
-        # Attempt to return a date object with the date found.  If it falls
-        #  outside the range of that particular month, return None.
-        try:
-            return datetime.date(year, month, date)
-        except ValueError:
             return None
-        # end try
+        # end if
     except Exception as err:
         _z_exc("wl_datetime/find_weekday", err)
     # end try
@@ -349,28 +328,53 @@ def last_date(month, year):
        -----------------------------------------------------------------
     """
     try:
-        # Standard months.
-        if month in [1, 3, 5, 7, 8, 10, 12]:
-            return 31
-        elif month in [4, 6, 9, 11]:
-            return 30
-        # February.
-        else:  # month == 2
-            # Rather than re-creating a complex formula, just try to
-            #  create a date object for Febuary 29 and see if it works.
-            try:
-                datetime.date(year, month, 29)
-                return 29
-            except ValueError:
-                return 28
-            # end try
-        # end if
+        return month_table(month, year)[0]
     except Exception as err:
         _z_exc("last_date", err)
     # end try
 # end function
 
 
+@functools.lru_cache(maxsize=CALENDAR_CACHE_SIZE)
+def month_table(month, year):
+    """
+        Gets the calendar of a month.
+
+        The calendar is calculated once and cached, so that parsing
+         dates and calculating the dates of recurring tasks, which look
+         up the same months over and over, do not have to work them out
+         again.
+
+        Arguments:
+        - month -- the month.
+        - year -- the year.
+
+        Returns:  a tuple of the number of days in the month, the day of
+         the week (from 1 (Sunday) to 7 (Saturday)) on which it starts,
+         and a tuple of the dates on which each day of the week falls,
+         indexed by day of the week (index 0 is empty).
+       -----------------------------------------------------------------
+    """
+    try:
+        first = datetime.date(year, month, 1)
+        if month == 12:
+            length = 31
+        else:
+            length = (first.replace(month=month + 1) - first).days
+        # end if
+        first_day = conv_wkday(first.weekday())
+        weekday_dates = [()]
+        for day in range(1, 8):
+            weekday_dates.append(
+              tuple(range(1 + (day - first_day) % 7, length + 1, 7)))
+        # end for
+        return length, first_day, tuple(weekday_dates)
+    except Exception as err:
+        _z_exc("wl_datetime/month_table", err)
+    # end try
+# end function
+
+
 def parse_date_calendar(wl_obj, word_list):
     """
         Parses a word list for a date.
@@ -386,47 +390,14 @@ def parse_date_calendar(wl_obj, word_list):
        -----------------------------------------------------------------
     """
     try:
-        # Check all the elements in every order.  If one matches, set
-        #  the work log object's date_format attribute and return the
-        #  date object.
-        if len(word_list) == 2:
-            # Month and day.  Note--don't set the date format here,
-            #  becuase it could be either big-endian or middle-endian.
-            good = _check_calendar_date(word_list[0], word_list[1])
-            if good:
-                return good
-            # end if
-            # Day and month.
-            good = _check_calendar_date(word_list[1], word_list[0])
-            if good:
-                wl_obj.date_format = "L"
-                return good
-            # end if
-        elif len(word_list) == 3:
-            # Month, day and year.
-            good = _check_calendar_date(
-              word_list[0], word_list[1], year=word_list[2])
-            if good:
-                wl_obj.date_format = "M"
-                return good
-            # end if
-            # Day, month and year.
-            good = _check_calendar_date(
-              word_list[1], word_list[0], year=word_list[2])
-            if good:
-                wl_obj.date_format = "L"
-                return good
-            # end if
-            # Year, month and day.
-            good = _check_calendar_date(
-              word_list[1], word_list[2], year=word_list[0])
-            if good:
-                wl_obj.date_format = "B"
-                return good
-            # end if
+        date, date_format = _parse_date_calendar(
+          tuple(word_list), datetime.date.today())
+        # If the words are in a particular format, set the work log
+        #  object's date_format attribute.
+        if date_format:
+            wl_obj.date_format = date_format
         # end if
-        # If nothing worked, return None.
-        return None
+        return date
     except Exception as err:
         _z_exc("wl_datetime/parse_date_calendar", err)
     # end try
@@ -448,7 +419,7 @@ def parse_date_input(wl_obj, string):
         # If the string is a standard numeric date, check to make sure
         #  it is valid.  The result will either be a date object or
         #  None.
-        if re.search(r"^\d{1,4}[-/.]{1}\d{1,4}[-/.]?\d{1,4}$", string):
+        if NUMERIC_DATE_PATTERN.search(string):
             return parse_date_numeric(wl_obj, string)
         # Otherwise check to see if it is a valid word date.  The result
         #  will still be a date object or None.
@@ -480,30 +451,17 @@ def parse_date_numeric(wl_obj, string):
         BIG_FORMAT = "%Y %B %d"
         MID_FORMAT = "%B %d, %Y"
         LIT_FORMAT = "%d %B %Y"
-        # First separate the elements of the date and convert them to
-        #  integers.
-        numbers = re.findall(r"\d+", string)
-        for x, number in enumerate(numbers):
-            numbers[x] = int(number)
-        # end for
-        # If there are only two elements, the year was omitted and
-        #  defaults to the current year.  Where the year element is
-        #  inserted depends on the format.
-        if len(numbers) == 2:
-            if wl_obj.date_format == "B":
-                numbers.insert(0, datetime.date.today().year)
-            else:
-                numbers.append(datetime.date.today().year)
-            # end if
-        # end if
-        # Now try to create a date object with the selected format.
-        entry_date = _create_date(numbers, wl_obj.date_format)
+        # Try to create a date object with the selected format.  If the
+        #  date is not valid, the formats it is valid in are returned
+        #  instead.
+        entry_date, alternatives = _parse_date_numeric(
+          string, wl_obj.date_format, datetime.date.today())
         # If it's valid, return it.
         if entry_date:
             return entry_date
-        # If it's not valid, try the other formats.
-        valid_formats, valid_dates = _check_other_endians(
-          numbers, wl_obj.date_format)
+        # end if
+        valid_formats = [ndn for ndn, date in alternatives]
+        valid_dates = [date for ndn, date in alternatives]
         # If neither of the other formats is valid, just return None.
         if valid_formats == []:
             io_utils.print_status(
@@ -562,125 +520,58 @@ def parse_date_phrase(wl_obj, string):
        -----------------------------------------------------------------
     """
     try:
-        # First break the string into a list of words.
-        word_list = re.findall(r"\b\w+\b", string)
-        # If the user included the words "the" or "of", discard it.
-        s = []
-        for word in word_list:
-            if word.lower() != "the" and word.lower() != "of":
-                s.append(word)
-            # end if
-        # end for
-        word_list = s
-        # Check according to the length of the string.
-        if len(word_list) == 1:
-            # There are three valid one-word responses, plus the days of
-            #  the week.
-            if word_list[0].lower() == "today":
-                return datetime.date.today()
-            elif word_list[0].lower() == "yesterday":
-                return datetime.date.today() - datetime.timedelta(days=1)
-            elif word_list[0].lower() == "tomorrow":
-                return datetime.date.today() + datetime.timedelta(days=1)
-            else:
-                valid = wl_resource.weekday(word_list[0])
-                # If the string is a day of the week, return the date
-                #  object that corresponds to that day of the current
-                #  week.  Else return None.
-                if valid:
-                    return _create_date_from_weekday(valid, 0)
-                else:
-                    io_utils.print_status(
-                      "Error",
-                      f"{string} could not be interpreted as a valid date.",
-                      line_length=wl_obj.line_length)
-                    return None
-                # end if
-            # end if
-        elif len(word_list) == 2:
-            # A two-word response can be a calendar date without the
-            #  year, or a phrase.  Check for a calendar date first.
-            good = parse_date_calendar(wl_obj, word_list)
-            if good:
-                return good
-            # end if
-            # Two-word date phrases all start with "this", "next", or
-            #  "last", followed by a day of the week.
-            if word_list[0].lower() == "this":
-                offset = 0
-            elif word_list[0].lower() == "last":
-                offset = -1
-            elif word_list[0].lower() == "next":
-                offset = 1
-            else:
-                io_utils.print_status(
-                  "Error",
-                  f"{string} could not be interpreted as a valid date.",
-                  line_length=wl_obj.line_length)
-                return None
-            # end if
-            valid = wl_resource.weekday(word_list[1])
-            if valid:
-                return _create_date_from_weekday(valid, offset)
-            else:
-                io_utils.print_status(
-                  "Error",
-                  f"{string} could not be interpreted as a valid date.",
-                  line_length=wl_obj.line_length)
-                return None
-            # end if
-        elif len(word_list) == 3:
-            # Three word calendar dates are a full month, day and year
-            #  (but not necessarily in that order).  Check for them.
-            good = parse_date_calendar(wl_obj, word_list)
-            if good:
-                return good
-            # end if
-            # There are two set three-word date phrases.  It's simpler
-            #  to search for them in the original string.
-            if re.search(r"day after tomorrow", string, re.I):
-                return datetime.date.today() + datetime.timedelta(days=2)
-            elif re.search(r"day before yesterday", string, re.I):
-                return datetime.date.today() - datetime.timedelta(days=2)
-            # end if
-            # Other three-word date phrases are a day of the week
-            #  followed by either "before last" or "after next".
-            valid = wl_resource.weekday(word_list[0])
-            if valid:
-                if (
-                  word_list[1].lower() == "before" and
-                  word_list[2].lower() == "last"):
-                    return _create_date_from_weekday(valid, -2)
-                elif (
-                  word_list[1].lower() == "after" and
-                  word_list[2].lower() == "next"):
-                    return _create_date_from_weekday(valid, 2)
-                else:
-                    io_utils.print_status(
-                      "Error",
-                      f"{string} could not be interpreted as a valid date.",
-                      line_length=wl_obj.line_length)
-                    return None
-                # end if
-            else:
-                io_utils.print_status(
-                  "Error",
-                  f"{string} could not be interpreted as a valid date.",
-                  line_length=wl_obj.line_length)
-                return None
-            # end if
-        else:
+        date, date_format = _parse_date_phrase(string, datetime.date.today())
+        # A calendar date sets the work log object's date_format
+        #  attribute.
+        if date_format:
+            wl_obj.date_format = date_format
+        # end if
+        if not date:
             io_utils.print_status(
               "Error", f"{string} could not be interpreted as a valid date.",
               line_length=wl_obj.line_length)
-            return None
         # end if
+        return date
     except Exception as err:
         _z_exc("wl_datetime/parse_date_phrase", err)
     # end try
 # end function
 
 
+def parse_dates(strings, date_format="M", today=None):
+    """
+        Parses a batch of date strings, without any output.
+
+        Unlike parse_date_input, nothing is printed, the user is never
+         asked to choose a date format, and no settings are changed.
+         Each distinct string is only parsed once.
+
+        Arguments:
+        - strings -- an iterable of the strings to parse.
+
+        Keyword Arguments:
+        - date_format -- the date format of numeric dates ("B", "M" or
+           "L"; default "M").
+        - today -- the date to which relative dates ("tomorrow", "next
+           Tuesday") refer (default None, for the current date).
+
+        Returns:  a list of (date, code) tuples, one for each string.
+         The code is PARSED (with a date object), NOT_PARSED or
+         OTHER_FORMAT (a numeric date which is only valid in a different
+         date format).  Unparsed dates are None.
+       -----------------------------------------------------------------
+    """
+    try:
+        if today is None:
+            today = datetime.date.today()
+        # end if
+        return _parse_each(strings, _batch_date, date_format, today)
+    except Exception as err:
+        _z_exc("wl_datetime/parse_dates", err)
+    # end try
+# end function
+
+
 def parse_duration_input(wl_obj, entry, string):
     """
         Extracts a duration from user input.
@@ -710,90 +601,79 @@ def parse_duration_input(wl_obj, entry, string):
 # end function
 
 
-def parse_time_input(wl_obj, string):
+def parse_durations(strings):
     """
-        Extracts a time from user input.
+        Parses a batch of duration strings, without any output.
+
+        Unlike parse_duration_input, end times are not accepted.  Each
+         distinct string is only parsed once.
 
         Arguments:
-        - wl_obj -- the work log object.
-        - string -- the user input.
+        - strings -- an iterable of the strings to parse.
 
-        Returns:  a time object if successful, or None.
+        Returns:  a list of (timedelta, code) tuples, one for each
+         string.  The code is PARSED (with a timedelta object),
+         NOT_PARSED or NEGATIVE.  Unparsed durations are None.
        -----------------------------------------------------------------
     """
     try:
-        # am/pm regex.
-        ampm = re.compile(r"\s?(a|p)?\.?m?\.?$", re.I)
-        # First search the entire string for an AM/PM marker.
-        pm = None
-        if re.search(r"([\d|\s]a\.?m?\.?$)|(morning)", string, re.I):
-            wl_obj.time_format = 12
-            pm = False
-        elif re.search(
-          r"([\d|\s]p\.?m?\.?$)|(afternoon)|(evening)|(night)", string,
-          re.I):
-            wl_obj.time_format = 12
-            pm = True
-        # end if
-        # Discard any am/pm markers.
-        for word in [
-          "\bmorning\b", "\bafternoon\b", "\bevening\b", "\bnight\b", "\bin\b",
-          "\bthe\b", "\bat\b", "\bo'clock\b", "\bpast\b"]:
-            string = re.sub(word, "", string, re.I)
-        # end for
-        string = ampm.sub("", string)
-        word_list = []
-        # If the string is all numbers (with or without a colon) it can
-        #  be processed directly.
-        if re.fullmatch(
-          r"\d{1,2}(:|\.)?\d{0,2}", string, re.I):
-            num_list = re.split(r"\D", string)
-            # if the first number is 3-4 digits, it can only be a
-            #  complete time.  If it is 1-2 digits, it must be an hour,
-            #  and minutes may follow.
-            #
-            # If a valid time in 24-hour format is entered, the pm flag
-            #  is ignored and the time_format attribute reset to 24.
-            #
-            # Ambiguous times in 12-hour format are assumed to be AM
-            #  unless the pm flag is set.
-            if int(num_list[0]) > 99:
-                # Break the first element into hour and minute segments
-                #  (discard the rest of the string).  Pass these to the
-                #  validating function to return a time object or None.
-                word_list.append(int(num_list[0]) // 100)
-                word_list.append(int(num_list[0]) % 100)
-                return _create_time(wl_obj, word_list, pm)
-            else:
-                # If the hour and minute elements are already separated,
-                #  just pass the original list to the validator.
-                return _create_time(wl_obj, num_list, pm)
-            # end if
-        # end if
-        # If the time isn't in a standard format...
-        # Break the input string into units.
-        raw_list = string.split(" ")
-        # Process each raw unit.
-        for raw_word in raw_list:
-            # First separate any letter/number combinations.
-            raw_word_list = re.findall(r"\D+|\d+", raw_word)
-            # If there aren't any combos, this will be a one-item list.
-            for element in raw_word_list:
-                # Add each element to the word list.
-                word_list.append(element)
-            # end for
-        # end for
-        # With the word list, return either a time object or None.
-        return _create_time(wl_obj, word_list, pm)
+        return _parse_each(strings, _batch_duration)
     except Exception as err:
-        _z_exc("wl_datetime/parse_time_input", err)
+        _z_exc("wl_datetime/parse_durations", err)
     # end try
 # end function
 
 
-def set_endian(wl_obj):
+def parse_time_input(wl_obj, string):
     """
-        Allows the user to set the preferred date format.
+        Extracts a time from user input.
+
+        Arguments:
+        - wl_obj -- the work log object.
+        - string -- the user input.
+
+        Returns:  a time object if successful, or None.
+       -----------------------------------------------------------------
+    """
+    try:
+        time, wl_obj.time_format = _parse_time(string, wl_obj.time_format)
+        return time
+    except Exception as err:
+        _z_exc("wl_datetime/parse_time_input", err)
+    # end try
+# end function
+
+
+def parse_times(strings, time_format=12):
+    """
+        Parses a batch of time strings, without any output.
+
+        Unlike parse_time_input, the time format is not changed by times
+         which can only be in the other format.  Each distinct string is
+         only parsed once.
+
+        Arguments:
+        - strings -- an iterable of the strings to parse.
+
+        Keyword Arguments:
+        - time_format -- the time format (12 or 24; default 12).
+
+        Returns:  a list of (time, code) tuples, one for each string.
+         The code is PARSED (with a time object) or NOT_PARSED (with
+         None).
+       -----------------------------------------------------------------
+    """
+    try:
+        return _parse_each(strings, _batch_time, time_format)
+    except Exception as err:
+        _z_exc("wl_datetime/parse_times", err)
+    # end try
+# end function
+
+
+def set_endian(wl_obj):
+    """
+        Allows the user to set the preferred date format.
 
         Arguments:
         - wl_obj -- the work log object.
@@ -890,40 +770,119 @@ def set_time_format(wl_obj):
 # end function
 
 
-def _check_calendar_date(month, day, year=None):
+def _batch_date(string, date_format, today):
+    """
+        Parses one string of a batch of dates.
+
+        Arguments:
+        - string -- the string to parse.
+        - date_format -- the date format of numeric dates.
+        - today -- today's date.
+
+        Returns:  a (date, code) tuple.
+       -----------------------------------------------------------------
+    """
+    try:
+        if NUMERIC_DATE_PATTERN.search(string):
+            date, alternatives = _parse_date_numeric(
+              string, date_format, today)
+            if not date and alternatives:
+                return None, OTHER_FORMAT
+            # end if
+        else:
+            date = _parse_date_phrase(string, today)[0]
+        # end if
+        if not date:
+            return None, NOT_PARSED
+        # end if
+        return date, PARSED
+    except Exception as err:
+        _z_exc("wl_datetime/_batch_date", err)
+    # end try
+# end function
+
+
+def _batch_duration(string):
+    """
+        Parses one string of a batch of durations.
+
+        Arguments:
+        - string -- the string to parse.
+
+        Returns:  a (timedelta, code) tuple.
+       -----------------------------------------------------------------
+    """
+    try:
+        td = _parse_duration(string)
+        if td is None:
+            return None, NOT_PARSED
+        elif td < datetime.timedelta():
+            return None, NEGATIVE
+        # end if
+        return td, PARSED
+    except Exception as err:
+        _z_exc("wl_datetime/_batch_duration", err)
+    # end try
+# end function
+
+
+def _batch_time(string, time_format):
+    """
+        Parses one string of a batch of times.
+
+        Arguments:
+        - string -- the string to parse.
+        - time_format -- the time format.
+
+        Returns:  a (time, code) tuple.
+       -----------------------------------------------------------------
+    """
+    try:
+        time = _parse_time(string, time_format)[0]
+        if time is None:
+            return None, NOT_PARSED
+        # end if
+        return time, PARSED
+    except Exception as err:
+        _z_exc("wl_datetime/_batch_time", err)
+    # end try
+# end function
+
+
+def _check_calendar_date(month, day, today, year=None):
     """
         Checks two or three words to see if they form a valid date.
 
         Arguments:
-        - month -- the word representing the month.
-        - day -- the word representing the day.
+        - month -- the token (see wl_lexer) representing the month.
+        - day -- the token representing the day.
+        - today -- today's date.
 
         Keyword Arguments:
-        - year -- the word representing the year.
+        - year -- the token representing the year.
 
         Returns:  a date object if successful; else None.
        -----------------------------------------------------------------
     """
     try:
-        m = wl_resource.month(month)
+        m = month.month
         if m:
-            try:
-                d = int(day)
-            except ValueError:
-                d = wl_resource.ordinal(day)
-            # end try
+            d = day.integer
+            if d is None:
+                d = day.ordinal
+            # end if
             if d:
                 if not year:
-                    y = datetime.date.today().year
+                    y = today.year
                 else:
-                    try:
-                        y = int(year)
-                        if not (1900 <= y <= 2100):
-                            return None
-                        # end if
-                    except ValueError:
+                    y = year.integer
+                    if y is None or not (1900 <= y <= 2100):
                         return None
-                    # end try
+                    # end if
+                # end if
+                # The day must fall within the month.
+                if not (1 <= d <= month_table(m, y)[0]):
+                    return None
                 # end if
                 return datetime.date(y, m, d)
             else:
@@ -1010,32 +969,40 @@ def _create_date(numbers, endian):
                 numbers[year] += 2000
             # end if
         # end if
-        # Try to create a date object with the numbers.
-        try:
-            return datetime.date(numbers[year], numbers[month], numbers[day])
-        except ValueError:
+        # Check the numbers against the calendar before creating the date
+        #  object.
+        if not (
+          datetime.MINYEAR <= numbers[year] <= datetime.MAXYEAR and
+          1 <= numbers[month] <= 12):
             return None
-        # end try
+        # end if
+        if not (
+          1 <= numbers[day] <=
+          month_table(numbers[month], numbers[year])[0]):
+            return None
+        # end if
+        return datetime.date(numbers[year], numbers[month], numbers[day])
     except Exception as err:
         _z_exc("wl_datetime/_create_date", err)
     # end try
 # end function
 
 
-def _create_date_from_weekday(weekday, offset):
+def _create_date_from_weekday(weekday, offset, today):
     """
         Creates a date given a day of the week.
 
         Arguments:
         - weekday -- the day of the week for which to create the date.
         - offset -- the week in which to create the date.
+        - today -- today's date.
 
         Returns:  a date object.
        -----------------------------------------------------------------
     """
     try:
         # First, identify the current weekday.
-        current_day = datetime.date.today().isoweekday()
+        current_day = today.isoweekday()
         # Adjust from a Monday-based week to a Sunday-based week.
         if current_day < 7:
             current_day += 1
@@ -1049,7 +1016,7 @@ def _create_date_from_weekday(weekday, offset):
         week_offset = offset * 7
         # Use timedeltas to create and return the date object.
         return (
-          datetime.date.today() + datetime.timedelta(days=day_offset) +
+          today + datetime.timedelta(days=day_offset) +
           datetime.timedelta(days=week_offset))
     except Exception as err:
         _z_exc("wl_datetime/_create_date_from_weekday", err)
@@ -1057,44 +1024,51 @@ def _create_date_from_weekday(weekday, offset):
 # end function
 
 
-def _create_time(wl_obj, num_list, pm):
+def _create_time(time_format, num_list, pm):
     """
         Creates a time from a list of words.
 
         Arguments:
-        - wl_obj -- the work log object.
+        - time_format -- the user's preferred time format.
         - num_list -- the source list.
         - pm -- flag indicating if the time is p.m.
 
-        Returns:  a time object if possible, else None.
+        Returns:  a tuple of a time object (or None if no time can be
+         created) and the time format, which is changed to match a time
+         in the other format.
        -----------------------------------------------------------------
     """
     try:
-        # Store the work log object's time_format attribute in case it
-        #  needs to be reset.
-        t_format = wl_obj.time_format
+        # Store the time format in case it needs to be reset.
+        t_format = time_format
         # First, clean up the source list, converting all numeric
-        #  strings to integers and deleting empty strings.
+        #  strings to integers and deleting empty strings.  If the time
+        #  words "noon" or "midnight" are anywhere in the list, replace
+        #  them with their numerical equivalents.
         s = []
         for element in num_list:
             # Screen out empty strings, and the colon if it is captured.
             if element and element != ":":
                 # Convert to integer if possible.
-                s.append(wl_resource.cardinal(element))
+                if type(element) == str:
+                    token = wl_lexer.classify(element)
+                    if token.lower == "noon":
+                        element = 12
+                        pm = True
+                    elif token.lower == "midnight":
+                        element = 0
+                        pm = False
+                    else:
+                        element = token.value
+                    # end if
+                # end if
+                s.append(element)
             # end if
         # end for
         num_list = s
-        # If the time words "noon" or "midnight" are anywhere in the
-        #  list, replace them with their numerical equivalents.
-        for n in range(len(num_list)):
-            if str(num_list[n]).lower() == "noon":
-                num_list[n] = 12
-                pm = True
-            elif str(num_list[n]).lower() == "midnight":
-                num_list[n] = 0
-                pm = False
-            # end if
-        # end for
+        if not num_list:
+            return None, time_format
+        # end if
         # If 1) there is only one element and it is a number, or 2) the
         #  first two elements are numbers, then it or they must
         #  represent the time (the rest of the string is treated as
@@ -1105,14 +1079,14 @@ def _create_time(wl_obj, num_list, pm):
             # Make sure the hour is valid.
             hour = int(num_list[0])
             if (hour > 23) or (hour < 0):
-                return None
+                return None, time_format
             # If the hour can only be valid in 24-hour format, ignore
-            #  the pm flag if it is set, and make sure the work log
-            #  object's time_format attribute is set to 24.
+            #  the pm flag if it is set, and make sure the time format
+            #  is set to 24.
             elif 12 < hour < 24:
-                wl_obj.time_format = 24
+                time_format = 24
             else:
-                wl_obj.time_format = 12
+                time_format = 12
                 # If the pm flag is set, convert to 24-hour time.
                 if pm and (hour < 12):
                     hour += 12
@@ -1137,13 +1111,13 @@ def _create_time(wl_obj, num_list, pm):
                 minute = 0
             elif (minute > 59) or (minute < 0):
                 # If the time is found to be invalid at this point, make
-                #  sure that any change to the time_format attribute is
-                #  undone before returning.
-                wl_obj.time_format = t_format
-                return None
+                #  sure that any change to the time format is undone
+                #  before returning.
+                time_format = t_format
+                return None, time_format
             # end if
             # Return a time object.
-            return datetime.time(hour=hour, minute=minute)
+            return datetime.time(hour=hour, minute=minute), time_format
         # Otherwise, non-numbers in the list must represent part or all
         #  of the time.
         # If the first element is the word "half" then the second must
@@ -1153,19 +1127,19 @@ def _create_time(wl_obj, num_list, pm):
             try:
                 hour = int(num_list[1])
             except (ValueError, IndexError):
-                return None
+                return None, time_format
             # end try
             # Make sure the hour is valid.
             if not (0 <= hour < 24):
-                return None
+                return None, time_format
             if (hour > 12) or (hour == 0):
-                wl_obj.time_format = 24
+                time_format = 24
             elif pm:
-                wl_obj.time_format = 12
+                time_format = 12
                 hour += 12
             # end if
             # Return a time object.
-            return datetime.time(hour=hour, minute=minute)
+            return datetime.time(hour=hour, minute=minute), time_format
         # end if
         # The other valid combination is number-word-number, with the
         #  word representing before or after.  First try to assign the
@@ -1174,11 +1148,11 @@ def _create_time(wl_obj, num_list, pm):
             hour = int(num_list[2])
             minute = int(num_list[0])
         except (ValueError, IndexError):
-            return None
+            return None, time_format
         # end try
         # Now validate both the minutes and the hour.
         if (not (0 <= hour < 24)) or (not (0 <= minute < 60)):
-            return None
+            return None, time_format
         # end if
         # If the pm flag is set, adjust the hour.
         if pm and (hour < 12):
@@ -1188,7 +1162,7 @@ def _create_time(wl_obj, num_list, pm):
         if str(num_list[1]).lower() in ["after", "past"]:
             # For after, nothing needs adjusting.  Just return the time
             #  object.
-            return datetime.time(hour=hour, minute=minute)
+            return datetime.time(hour=hour, minute=minute), time_format
         if str(num_list[1]).lower() in [
           "before", "until", "till", "til", "to"]:
             # Note that if the user enters the extremely non-standard
@@ -1198,12 +1172,423 @@ def _create_time(wl_obj, num_list, pm):
                 hour = (hour - 1) % 24
                 minute = 60 - minute
             # end if
-            return datetime.time(hour=hour, minute=minute)
+            return datetime.time(hour=hour, minute=minute), time_format
         # end if
         # If for some reason execution has fallen all the way through,
-        #  just return None
-        return None
+        #  just return None.
+        return None, time_format
     except Exception as err:
         _z_exc("wl_datetime/_create_time", err)
     # end try
 # end function
+
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_date_calendar(word_list, today):
+    """
+        Parses a word list for a date.
+
+        Sees if the list contains a date with either the month or day
+         spelled out.
+
+        Arguments:
+        - word_list -- a tuple of the words to parse.
+        - today -- today's date.
+
+        Returns:  a tuple of a date object (or None if no date is found)
+         and the date format the words are in (or None if it could be
+         either big-endian or middle-endian).
+       -----------------------------------------------------------------
+    """
+    try:
+        word_list = [wl_lexer.classify(word) for word in word_list]
+        # Check all the elements in every order.  If one matches, return
+        #  the date object and its date format.
+        if len(word_list) == 2:
+            # Month and day.  Note--don't set the date format here,
+            #  becuase it could be either big-endian or middle-endian.
+            good = _check_calendar_date(word_list[0], word_list[1], today)
+            if good:
+                return good, None
+            # end if
+            # Day and month.
+            good = _check_calendar_date(word_list[1], word_list[0], today)
+            if good:
+                return good, "L"
+            # end if
+        elif len(word_list) == 3:
+            # Month, day and year.
+            good = _check_calendar_date(
+              word_list[0], word_list[1], today, year=word_list[2])
+            if good:
+                return good, "M"
+            # end if
+            # Day, month and year.
+            good = _check_calendar_date(
+              word_list[1], word_list[0], today, year=word_list[2])
+            if good:
+                return good, "L"
+            # end if
+            # Year, month and day.
+            good = _check_calendar_date(
+              word_list[1], word_list[2], today, year=word_list[0])
+            if good:
+                return good, "B"
+            # end if
+        # end if
+        # If nothing worked, return None.
+        return None, None
+    except Exception as err:
+        _z_exc("wl_datetime/_parse_date_calendar", err)
+    # end try
+# end function
+
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_date_numeric(string, date_format, today):
+    """
+        Validates a numeric date.
+
+        Arguments:
+        - string -- the user input.
+        - date_format -- the user's preferred date format.
+        - today -- today's date.
+
+        Returns:  a tuple of a date object (or None if the date is not
+         valid in the preferred format) and a tuple of the (date format,
+         date object) pairs for the other formats in which the date is
+         valid.
+       -----------------------------------------------------------------
+    """
+    try:
+        # First separate the elements of the date and convert them to
+        #  integers.
+        numbers = DIGITS_PATTERN.findall(string)
+        for x, number in enumerate(numbers):
+            numbers[x] = int(number)
+        # end for
+        # If there are only two elements, the year was omitted and
+        #  defaults to the current year.  Where the year element is
+        #  inserted depends on the format.
+        if len(numbers) == 2:
+            if date_format == "B":
+                numbers.insert(0, today.year)
+            else:
+                numbers.append(today.year)
+            # end if
+        # end if
+        # Now try to create a date object with the selected format.
+        entry_date = _create_date(numbers, date_format)
+        # If it's valid, return it.
+        if entry_date:
+            return entry_date, ()
+        # end if
+        # If it's not valid, try the other formats.
+        valid_formats, valid_dates = _check_other_endians(
+          numbers, date_format)
+        return None, tuple(zip(valid_formats, valid_dates))
+    except Exception as err:
+        _z_exc("wl_datetime/_parse_date_numeric", err)
+    # end try
+# end function
+
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_date_phrase(string, today):
+    """
+        Checks a string to see if it contains a valid word date.
+
+        Arguments:
+        - string -- the user input.
+        - today -- today's date.
+
+        Returns:  a tuple of a date object (or None if no date is found)
+         and the date format of a calendar date (or None).
+       -----------------------------------------------------------------
+    """
+    try:
+        # First break the string into a list of classified words.  If
+        #  the user included the words "the" or "of", discard them.
+        word_list = [
+          word for word in wl_lexer.tokenize(string)
+          if word.lower != "the" and word.lower != "of"]
+        # Check according to the length of the string.
+        if len(word_list) == 1:
+            # There are three valid one-word responses (today, yesterday
+            #  and tomorrow), plus the days of the week.
+            if word_list[0].day_offset is not None:
+                return (
+                  today + datetime.timedelta(days=word_list[0].day_offset),
+                  None)
+            else:
+                valid = word_list[0].weekday
+                # If the string is a day of the week, return the date
+                #  object that corresponds to that day of the current
+                #  week.  Else return None.
+                if valid:
+                    return _create_date_from_weekday(valid, 0, today), None
+                else:
+                    return None, None
+                # end if
+            # end if
+        elif len(word_list) == 2:
+            # A two-word response can be a calendar date without the
+            #  year, or a phrase.  Check for a calendar date first.
+            good, date_format = _parse_date_calendar(
+              tuple(word.text for word in word_list), today)
+            if good:
+                return good, date_format
+            # end if
+            # Two-word date phrases all start with "this", "next", or
+            #  "last", followed by a day of the week.
+            offset = word_list[0].week_offset
+            if offset is None:
+                return None, None
+            # end if
+            valid = word_list[1].weekday
+            if valid:
+                return _create_date_from_weekday(valid, offset, today), None
+            else:
+                return None, None
+            # end if
+        elif len(word_list) == 3:
+            # Three word calendar dates are a full month, day and year
+            #  (but not necessarily in that order).  Check for them.
+            good, date_format = _parse_date_calendar(
+              tuple(word.text for word in word_list), today)
+            if good:
+                return good, date_format
+            # end if
+            # There are two set three-word date phrases.  It's simpler
+            #  to search for them in the original string.
+            if DAY_AFTER_PATTERN.search(string):
+                return today + datetime.timedelta(days=2), None
+            elif DAY_BEFORE_PATTERN.search(string):
+                return today - datetime.timedelta(days=2), None
+            # end if
+            # Other three-word date phrases are a day of the week
+            #  followed by either "before last" or "after next".
+            valid = word_list[0].weekday
+            if valid:
+                if (
+                  word_list[1].lower == "before" and
+                  word_list[2].lower == "last"):
+                    return _create_date_from_weekday(valid, -2, today), None
+                elif (
+                  word_list[1].lower == "after" and
+                  word_list[2].lower == "next"):
+                    return _create_date_from_weekday(valid, 2, today), None
+                # end if
+            # end if
+        # end if
+        return None, None
+    except Exception as err:
+        _z_exc("wl_datetime/_parse_date_phrase", err)
+    # end try
+# end function
+
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_duration(string):
+    """
+        Parses a string and determines the duration it describes.
+
+        Arguments:
+        - string -- the string to parse.
+
+        Returns:  a timedelta object (which may be negative) if a
+         duration is found; else None.
+       -----------------------------------------------------------------
+    """
+    try:
+        # If the string is "max", return the maximum timedelta.
+        if string.lower() == "max":
+            return datetime.timedelta.max
+        # end if
+        # Otherwise the string must contain one or more number/word
+        #  pairs:  a number (or number phrase) and a unit of measure.
+        #  These should (but need not be) in descending order.
+        #
+        # First, convert any numbers.
+        raw_list = wl_lexer.numbers(string)
+        # Then cull unneeded elements from the list.
+        word_list = []
+        for word in raw_list:
+            if not ((word is None) or (str(word).lower() == "and")):
+                word_list.append(word)
+            # end if
+        # end for
+        # Now move through the string from left to right.
+        minutes = None
+        hours = None
+        days = None
+        ndx = 0
+        while ndx < len(word_list):
+            amt = None
+            # An inner loop adds numbers together.  If there aren't any,
+            #  amt will remain None.  (The function must differentiate
+            #  here between None and 0.)
+            while (
+              (ndx < len(word_list) and type(word_list[ndx]) in [int, float])):
+                if amt is None:
+                    amt = word_list[ndx]
+                else:
+                    amt += word_list[ndx]
+                # end if
+                ndx += 1
+            # end while
+            # If there was no amount, check for an unspaced number/unit
+            #  combination.
+            unit = None
+            if amt is None:
+                packed = wl_lexer.classify(word_list[ndx]).packed
+                if packed:
+                    unit, amt = packed
+                # end if
+            elif ndx < len(word_list):
+                # Determine the units (if not valid, just move to the
+                #  next word).  But don't do this if the previous word
+                #  was the last.
+                unit = wl_lexer.classify(word_list[ndx]).unit
+            # end if
+            if unit == "m":
+                minutes = amt
+            elif unit == "h":
+                hours = amt
+            elif unit == "d":
+                days = amt
+            # end if
+            ndx += 1
+        # end while
+        # Having gone through the list, see if any times were found.  If
+        #  not, return None.
+        if (minutes is None) and (hours is None) and (days is None):
+            return None
+        # end if
+        # Change non-present units to zeroes.
+        if not minutes:
+            minutes = 0
+        # end if
+        if not hours:
+            hours = 0
+        # end if
+        if not days:
+            days = 0
+        # end if
+        # Create a timedelta created from the times found.  (Negative
+        #  durations are rejected by the caller.)
+        return datetime.timedelta(days=days, hours=hours, minutes=minutes)
+    except Exception as err:
+        _z_exc("wl_datetime/_parse_duration", err)
+    # end try
+# end function
+
+
+def _parse_each(strings, parse, *args):
+    """
+        Parses each distinct string in a batch once.
+
+        Leading and trailing spaces are ignored, and empty strings are
+         not parsed.
+
+        Arguments:
+        - strings -- an iterable of the strings to parse.
+        - parse -- the function which parses one string.
+        - args -- any other arguments for the parsing function.
+
+        Returns:  a list of the results, one for each string.
+       -----------------------------------------------------------------
+    """
+    try:
+        results = {}
+        result_list = []
+        for string in strings:
+            if string not in results:
+                if string.strip():
+                    results[string] = parse(string.strip(), *args)
+                else:
+                    results[string] = (None, NOT_PARSED)
+                # end if
+            # end if
+            result_list.append(results[string])
+        # end for
+        return result_list
+    except Exception as err:
+        _z_exc("wl_datetime/_parse_each", err)
+    # end try
+# end function
+
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_time(string, time_format):
+    """
+        Extracts a time from user input.
+
+        Arguments:
+        - string -- the user input.
+        - time_format -- the user's preferred time format.
+
+        Returns:  a tuple of a time object (or None if no time is found)
+         and the time format, which is changed to match a time in the
+         other format.
+       -----------------------------------------------------------------
+    """
+    try:
+        # First search the entire string for an AM/PM marker.
+        pm = None
+        if AM_PATTERN.search(string):
+            time_format = 12
+            pm = False
+        elif PM_PATTERN.search(string):
+            time_format = 12
+            pm = True
+        # end if
+        # Discard any am/pm markers.
+        string = TIME_WORD_PATTERN.sub("", string)
+        string = AMPM_PATTERN.sub("", string)
+        word_list = []
+        # If the string is all numbers (with or without a colon) it can
+        #  be processed directly.
+        if NUMERIC_TIME_PATTERN.fullmatch(string):
+            num_list = NON_DIGIT_PATTERN.split(string)
+            # if the first number is 3-4 digits, it can only be a
+            #  complete time.  If it is 1-2 digits, it must be an hour,
+            #  and minutes may follow.
+            #
+            # If a valid time in 24-hour format is entered, the pm flag
+            #  is ignored and the time_format attribute reset to 24.
+            #
+            # Ambiguous times in 12-hour format are assumed to be AM
+            #  unless the pm flag is set.
+            if int(num_list[0]) > 99:
+                # Break the first element into hour and minute segments
+                #  (discard the rest of the string).  Pass these to the
+                #  validating function to return a time object or None.
+                word_list.append(int(num_list[0]) // 100)
+                word_list.append(int(num_list[0]) % 100)
+                return _create_time(time_format, word_list, pm)
+            else:
+                # If the hour and minute elements are already separated,
+                #  just pass the original list to the validator.
+                return _create_time(time_format, num_list, pm)
+            # end if
+        # end if
+        # If the time isn't in a standard format...
+        # Break the input string into units.
+        raw_list = string.split(" ")
+        # Process each raw unit.
+        for raw_word in raw_list:
+            # First separate any letter/number combinations.
+            raw_word_list = TIME_PART_PATTERN.findall(raw_word)
+            # If there aren't any combos, this will be a one-item list.
+            for element in raw_word_list:
+                # Add each element to the word list.
+                word_list.append(element)
+            # end for
+        # end for
+        # With the word list, return either a time object or None.
+        return _create_time(time_format, word_list, pm)
+    except Exception as err:
+        _z_exc("wl_datetime/_parse_time", err)
+    # end try
+# end function
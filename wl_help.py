@@ -1,9 +1,18 @@
 """
     Contains the specification for the work log's help object.
 
+    The help text is read from its file once for the whole program, the
+     first time it is needed, and shared by every help object.  Only the
+     position of each entry is noted when the file is read; an entry's
+     text is put together the first time it is asked for.
+
     Class Definitions:
+    - HelpCatalog -- the help strings, read from a file as needed.
     - WlHelp -- the work log help object.
 
+    Public Functions:
+    - get_catalog -- gets the program's help catalog.
+
     Private Functions:
     - _z_exc -- generic exception handler.
    ---------------------------------------------------------------------
@@ -38,35 +47,152 @@ def _z_exc(loc, err):
 
 # Other imports.
 try:
+    import collections.abc
+    import functools
     import re
+
     import io_utils
 except Exception as err:
     _z_exc("wl_help.py/module imports", err)
 # end try
 
 
+# Constants.
+HELP_FILE = "wl_help.txt"
+
+
+class HelpCatalog(collections.abc.Mapping):
+    """
+        The help strings, read from a file as needed.
+
+        The catalog is a read-only mapping of help keys to help strings.
+         The file is read the first time the catalog is used, and each
+         string is put together the first time it is asked for.
+
+        Attributes:
+        - filename -- the name of the help text file.
+
+        Private Methods:
+        - _load -- reads the file and finds the entries in it.
+
+        Magic Methods:
+        - __init__ -- creates a catalog for a file, without reading it.
+        - __getitem__, __iter__, __len__ -- the mapping protocol.
+       -----------------------------------------------------------------
+    """
+
+    def __init__(self, fname=HELP_FILE):
+        """
+            Creates a catalog for a help text file.
+
+            Keyword Arguments:
+            - fname -- the name of the file (default HELP_FILE).
+           -------------------------------------------------------------
+        """
+        self.filename = fname
+        self._lines = None
+        self._index = {}
+        self._entries = {}
+    # end method
+
+    def __getitem__(self, key):
+        """Returns a help string, putting it together if necessary."""
+        try:
+            return self._entries[key]
+        except KeyError:
+            self._load()
+            # An unknown key raises KeyError, as a dictionary would.
+            start, count = self._index[key]
+            # Each line ends with a carriage return and line feed.  The
+            #  "Â"s are removed for a particular IDE which doesn't like
+            #  to import text files properly.
+            help_entry = "".join(
+              line.replace("Â", "")[:-2] + " "
+              for line in self._lines[start:start + count])
+            self._entries[key] = help_entry
+            return help_entry
+        # end try
+    # end method
+
+    def __iter__(self):
+        """Returns an iterator of the help keys."""
+        self._load()
+        return iter(self._index)
+    # end method
+
+    def __len__(self):
+        """Returns the number of help strings."""
+        self._load()
+        return len(self._index)
+    # end method
+
+    def _load(self):
+        """
+            Reads the help text file and finds the entries in it.
+
+            Nothing is done if the file has already been read.
+
+            Arguments:  none.
+
+            Returns:  nothing.
+           -------------------------------------------------------------
+        """
+        try:
+            if self._lines is not None:
+                return
+            # end if
+            # Open the help text file.
+            try:
+                with open(self.filename, newline="") as file:
+                    # Read the entire file into a list.
+                    input_list = file.readlines()
+                # end with
+            except Exception as err:
+                print(f"Error loading help text:  {err}")
+            # end try
+            # Discard the first line (because the beginning of the file can
+            #  be corrupted, the first line is a dummy line).
+            del input_list[0]
+            # Note where each entry starts, and how many lines it takes.
+            for l in range(len(input_list)):
+                # Title lines begin with an underscore.
+                if input_list[l][0] == "_":
+                    # Title lines contain the help entry title and the
+                    #  number of lines the entry takes.  The simplest way
+                    #  to process this is to break the line at the comma.
+                    temp_list = input_list[l].split(", ")
+                    # The entry's key in the help dictionary is the first
+                    #  element, and the entry starts on the next line.
+                    self._index[temp_list[0]] = (l + 1, int(temp_list[1]))
+                # end if (the loop will skip to the next title line)
+            # end for
+            self._lines = input_list
+            return
+        except Exception as err:
+            _z_exc("wl_help.py/HelpCatalog/_load", err)
+        # end try
+    # end method
+
+# end class
+
+
 class WlHelp:
     """
         Object which handles help strings for the work log script.
 
         Attributes:
-        - help_list -- a list of help strings.
+        - help_list -- the help strings (the program's HelpCatalog).
 
         Public Methods:
         - print_help -- prints a specified help string.
 
-        Private Methods:
-        - _load_help -- initializes the help_list attribute from a file.
-
         Magic Methods:
-        - __init__ -- initalizes the help object via _load_help.
+        - __init__ -- initalizes the help object with the help catalog.
        -----------------------------------------------------------------
     """
 
-    help_list = {}
-
     def __init__(self):
-        self._load_help()
+        self.help_list = get_catalog()
 
     def print_help(
       self, show_help, title, label, format_list=[], line_length=80):
@@ -90,22 +216,15 @@ class WlHelp:
         try:
             # Get the specified help entry.
             help_entry = self.help_list[label]
-            # Print the header line.
-            print("\n-=-=-{Info/Help}", end="")
-            char = "-"
-            for n in range(16, line_length):
-                print(char, end="")
-                if char == "-":
-                    char = "="
-                else:
-                    char = "-"
-                # end if
-            # end for
-            print()
+            # Compose the help box, and print it all at once.
+            screen = io_utils.ScreenBuffer()
+            # The header line.
+            screen.write()
+            screen.rule(line_length, label="Info/Help")
             # If help is turned on, print the help string, and instructions
             #  to turn help off.
             if show_help:
-                print(title, "\n" + ("-" * line_length))
+                screen.write(title, "\n" + ("-" * line_length))
                 # Check if there are substitutions to be made.
                 if format_list:
                     # Go through each value and insert it.
@@ -115,86 +234,43 @@ class WlHelp:
                         #  with the next value.
                         help_entry = p.sub(item, help_entry, count=1)
                     # end for
-                    # Now print the modified entry.
-                    io_utils.print_block(help_entry, line_length=line_length)
-                # Otherwise just print the help entry.
-                else:
-                    io_utils.print_block(help_entry, line_length=line_length)
                 # end if
-                print("-" * line_length, "\nEnter [-h] to hide help.")
+                # Now add the entry.
+                screen.write(
+                  io_utils.print_block(
+                    help_entry, line_length=line_length, ret_str=True),
+                  end="")
+                screen.write("-" * line_length, "\nEnter [-h] to hide help.")
             # Otherwise, print instructions to turn help on.
             else:
-                print("Enter [-h] to show help.")
-            # Print footer line.
-            char = "-"
-            for n in range(line_length):
-                print(char, end="")
-                if char == "-":
-                    char = "="
-                else:
-                    char = "-"
-                # end if
-            # end for
-            print()
+                screen.write("Enter [-h] to show help.")
+            # The footer line.
+            screen.rule(line_length)
+            screen.flush()
             return
         except Exception as err:
             _z_exc("wl_help.py/WlHelp/print_help", err)
         # end try
     # end method
+# end class
 
-    def _load_help(self):
-        """
-            Loads help text strings from an external file, "help.txt".
 
-            Arguments:  none
+@functools.lru_cache(maxsize=None)
+def get_catalog():
+    """
+        Gets the program's help catalog.
 
-            Returns:  nothing
-           -------------------------------------------------------------
-        """
-        try:
-            # Open the help text file.
-            try:
-                with open("wl_help.txt", newline="") as file:
-                    # Read the entire file into a temporary list.
-                    input_list = file.readlines()
-                # end with
-            except Exception as err:
-                print(f"Error loading help text:  {err}")
-            # end try
-            # Discard the first line (because the beginning of the file can
-            #  be corrupted, the first line is a dummy line).
-            del input_list[0]
-            # Clean-up:  this line is here for a particular IDE which
-            #  doesn't like to import text files properly.
-            for l in range(len(input_list)):
-                input_list[l] = input_list[l].replace("Â", "")
-            # end for
-            # Read through the list, concatenating each help string and
-            #  adding it to the help object dictionary.
-            for l in range(len(input_list)):
-                # Title lines begin with an underscore.
-                if input_list[l][0] == "_":
-                    # Title lines contain the help entry title and the
-                    #  number of lines the entry takes.  The simplest way
-                    #  to process this is to break the line at the comma.
-                    temp_list = input_list[l].split(", ")
-                    # The entry's key in the help dictionary is the first
-                    #  element.
-                    help_key = temp_list[0]
-                    # The second element is how many lines to read.  (The
-                    #  entry starts on the next line, so the index is 1-
-                    #  based.)
-                    help_entry = ""
-                    for x in range(1, int(temp_list[1]) + 1):
-                        help_entry += input_list[l + x][:-2] + " "
-                    # end for
-                    # Set the key and value in the help dictionary.
-                    self.help_list[help_key] = help_entry
-                # end if (the loop will skip to the next title line)
-            # end for
-            return
-        except Exception as err:
-            _z_exc("wl_help.py/WlHelp/_load_help", err)
-        # end try
-    # end method
-# end class
+        The same catalog is returned every time, so the help text file
+         is only read once.
+
+        Arguments:  none.
+
+        Returns:  a HelpCatalog object.
+       -----------------------------------------------------------------
+    """
+    try:
+        return HelpCatalog()
+    except Exception as err:
+        _z_exc("wl_help.py/get_catalog", err)
+    # end try
+# end function
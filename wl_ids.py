@@ -0,0 +1,342 @@
+"""
+    Contains functions to assign and look up the IDs of log entries.
+
+    The work log object hands out entry IDs in order, starting from 0;
+     its next_id attribute holds the next ID to assign, and is saved
+     with the log's info.  IDs are never reused, so they are unique, and
+     since they are small and dense the log's slots attribute can find
+     an entry by its ID with a single list index.  The slots are built
+     the first time they are needed, and kept up to date as entries are
+     added and deleted (see WorkLog.mark_dirty).  The occurrances of
+     rule-based series have negative IDs (see wl_series), and are never
+     given a slot.
+
+    Logs saved by earlier versions have random IDs, and no next_id.
+     When such a log is opened in full, its entries are renumbered in
+     order (updating the series which refer to them), and the log is
+     marked as changed so that the new IDs are saved.  Lazily-read and
+     sharded logs are not renumbered, since that would read every entry
+     (the largest ID of a sharded log is found from its manifest);
+     IDs are assigned to them from above the largest existing ID, but
+     that next_id is not saved (see WorkLog.dense_ids), so the log is
+     still renumbered the next time it is opened in full.  A full log
+     whose saved next_id is far beyond its number of entries is also
+     renumbered, rather than given slots for every ID up to next_id.
+
+    Public Functions:
+    - allocate -- assigns the next entry ID.
+    - allocate_many -- assigns a block of entry IDs.
+    - get_slots -- gets the work log object's ID slots, building them
+       if necessary.
+    - lookup -- finds a stored entry by its ID.
+    - migrate -- sets up the IDs of a log saved by an earlier version.
+    - remove -- removes an entry from the work log object's slots.
+    - update -- adds an entry to the work log object's slots.
+
+    Private Functions:
+    - _renumber -- gives every entry in a log a new ID, in order.
+    - _z_exc -- generic exception handler.
+   ---------------------------------------------------------------------
+"""
+
+
+# Import sys.
+import sys
+
+
+def _z_exc(loc, err):
+    """
+        Catch-all exception handler.
+
+        Arguments:
+        - loc -- string naming the module/function/method in which the
+           exception occurred.
+        - err -- the exception string.
+
+        Returns:  nothing (exits program).
+       -----------------------------------------------------------------
+    """
+    # Print error information.
+    print("An interal error occurred in " + loc + ": ", err)
+    # Exit.
+    sys.exit(
+      "Please report the above error and the circumstances which caused it " +
+      "to the developer.")
+    return  # Superfluous return.
+# end function
+
+
+# Other imports.
+try:
+    import io_utils
+    import wl_lazylog
+    import wl_shard
+except Exception as err:
+    _z_exc("wl_ids.py/module imports", err)
+# end try
+
+
+# Constants.
+TITLE_SORT = 0
+DATE_SORT = 1
+ENTRY_ID = 2
+# The most IDs by which a log's next_id may exceed its number of
+#  entries before the log is renumbered.
+MAX_GAP = 100000
+
+
+def allocate(wl_obj):
+    """
+        Assigns the next entry ID.
+
+        Arguments:
+        - wl_obj -- the work log object.
+
+        Returns:  the ID.
+       -----------------------------------------------------------------
+    """
+    try:
+        entry_id = wl_obj.next_id
+        wl_obj.next_id += 1
+        return entry_id
+    except Exception as err:
+        _z_exc("wl_ids.py/allocate", err)
+    # end try
+# end function
+
+
+def allocate_many(wl_obj, count):
+    """
+        Assigns a block of entry IDs.
+
+        Arguments:
+        - wl_obj -- the work log object.
+        - count -- the number of IDs.
+
+        Returns:  a range of the IDs.
+       -----------------------------------------------------------------
+    """
+    try:
+        id_range = range(wl_obj.next_id, wl_obj.next_id + count)
+        wl_obj.next_id += count
+        return id_range
+    except Exception as err:
+        _z_exc("wl_ids.py/allocate_many", err)
+    # end try
+# end function
+
+
+def get_slots(wl_obj):
+    """
+        Gets the work log object's ID slots.
+
+        The slots are a list, indexed by ID, of the log's stored entries
+         (None for IDs which have been deleted).  They are built from the
+         log's entries the first time they are needed.
+
+        Arguments:
+        - wl_obj -- the work log object.
+
+        Returns:  the list of slots.
+       -----------------------------------------------------------------
+    """
+    try:
+        if wl_obj.slots is None:
+            wl_obj.slots = [None] * wl_obj.next_id
+            for entry in wl_obj.entries:
+                update(wl_obj, entry)
+            # end for
+        # end if
+        return wl_obj.slots
+    except Exception as err:
+        _z_exc("wl_ids.py/get_slots", err)
+    # end try
+# end function
+
+
+def lookup(wl_obj, entry_id):
+    """
+        Finds a stored entry by its ID.
+
+        Only for logs whose entries are held in a list; lazily-read and
+         sharded logs keep indexes of their own.
+
+        Arguments:
+        - wl_obj -- the work log object.
+        - entry_id -- the ID of the entry to find.
+
+        Returns:  the entry matching the ID, or None if there was no
+         match.
+       -----------------------------------------------------------------
+    """
+    try:
+        slots = get_slots(wl_obj)
+        if type(entry_id) == int and 0 <= entry_id < len(slots):
+            return slots[entry_id]
+        # end if
+        # An ID outside the slots can't have been assigned by the log,
+        #  but the entries are checked in case it was set elsewhere.
+        for entry in wl_obj.entries:
+            if entry.id == entry_id:
+                return entry
+            # end if
+        # end for
+        return None
+    except Exception as err:
+        _z_exc("wl_ids.py/lookup", err)
+    # end try
+# end function
+
+
+def migrate(wl_obj):
+    """
+        Sets up the IDs of a log saved by an earlier version.
+
+        Nothing is done if the log already has a next_id, unless it is
+         too far beyond the number of entries for the IDs to be dense.
+
+        Arguments:
+        - wl_obj -- the work log object, which has just been opened.
+
+        Returns:  nothing.
+       -----------------------------------------------------------------
+    """
+    try:
+        if (
+          wl_obj.next_id is not None and
+          wl_obj.next_id - len(wl_obj.entries) <= MAX_GAP):
+            return
+        # end if
+        if isinstance(wl_obj.entries, wl_lazylog.LazyEntryList):
+            entry_ids = [item[ENTRY_ID] for item in wl_obj.sorts[TITLE_SORT]]
+        elif isinstance(wl_obj.entries, wl_shard.ShardedEntryList):
+            # The manifest holds the highest ID in each shard; if it was
+            #  written by an earlier version, every shard is read.
+            if wl_obj.entries.shard_ranges is None:
+                wl_obj.entries.load_all()
+                entry_ids = [
+                  item[ENTRY_ID] for item in wl_obj.sorts[TITLE_SORT]]
+            else:
+                entry_ids = [
+                  high for low, high in wl_obj.entries.shard_ranges.values()]
+            # end if
+        else:
+            _renumber(wl_obj)
+            if wl_obj.entries:
+                io_utils.print_status(
+                  "Status", "The log's entries have been given new IDs.  " +
+                  "Save the log to keep them.",
+                  line_length=wl_obj.line_length)
+            # end if
+            return
+        # end if
+        wl_obj.next_id = max(entry_ids, default=-1) + 1
+        wl_obj.dense_ids = False
+        return
+    except Exception as err:
+        _z_exc("wl_ids.py/migrate", err)
+    # end try
+# end function
+
+
+def remove(wl_obj, entry):
+    """
+        Removes an entry from the work log object's ID slots.
+
+        Nothing is done if the slots have not been built.
+
+        Arguments:
+        - wl_obj -- the work log object.
+        - entry -- the entry.
+
+        Returns:  nothing.
+       -----------------------------------------------------------------
+    """
+    try:
+        if wl_obj.slots is not None and 0 <= entry.id < len(wl_obj.slots):
+            wl_obj.slots[entry.id] = None
+        # end if
+        return
+    except Exception as err:
+        _z_exc("wl_ids.py/remove", err)
+    # end try
+# end function
+
+
+def update(wl_obj, entry):
+    """
+        Adds an entry to the work log object's ID slots.
+
+        Nothing is done if the slots have not been built, or if the
+         entry's ID was not assigned by the log.
+
+        Arguments:
+        - wl_obj -- the work log object.
+        - entry -- the entry.
+
+        Returns:  nothing.
+       -----------------------------------------------------------------
+    """
+    try:
+        if wl_obj.slots is None or not 0 <= entry.id < wl_obj.next_id:
+            return
+        # end if
+        if entry.id >= len(wl_obj.slots):
+            wl_obj.slots.extend([None] * (entry.id + 1 - len(wl_obj.slots)))
+        # end if
+        wl_obj.slots[entry.id] = entry
+        return
+    except Exception as err:
+        _z_exc("wl_ids.py/update", err)
+    # end try
+# end function
+
+
+def _renumber(wl_obj):
+    """
+        Gives every entry in a log a new ID, in order.
+
+        The entries of series refer to their parents by ID, and so do the
+         log's list of series; these are updated to match.  The old IDs
+         are recorded as deleted, and the new ones as changed, so that a
+         database-backed log replaces every row when it is saved.
+
+        Arguments:
+        - wl_obj -- the work log object.
+
+        Returns:  nothing.
+       -----------------------------------------------------------------
+    """
+    try:
+        new_ids = {}
+        for n, entry in enumerate(wl_obj.entries):
+            new_ids.setdefault(entry.id, n)
+        # end for
+        wl_obj.deleted.update(new_ids)
+        for n, entry in enumerate(wl_obj.entries):
+            entry.id = n
+            if entry.rec_parent in new_ids:
+                entry.rec_parent = new_ids[entry.rec_parent]
+            # end if
+        # end for
+        wl_obj.series = [
+          new_ids[parent_id] for parent_id in wl_obj.series
+          if parent_id in new_ids]
+        # The sort indexes hold the IDs, so they are built again.
+        wl_obj.sorts[TITLE_SORT][:] = sorted(
+          (entry.title, entry.datetime, entry.id) for entry in wl_obj.entries)
+        wl_obj.sorts[DATE_SORT][:] = sorted(
+          (entry.datetime, entry.title, entry.id) for entry in wl_obj.entries)
+        wl_obj.next_id = len(wl_obj.entries)
+        wl_obj.dirty.update(range(wl_obj.next_id))
+        # Indexes built on the old IDs are rebuilt when next needed.
+        wl_obj.overlaps = None
+        wl_obj.slots = None
+        if wl_obj.entries:
+            wl_obj.changed = True
+        # end if
+        return
+    except Exception as err:
+        _z_exc("wl_ids.py/_renumber", err)
+    # end try
+# end function
@@ -0,0 +1,768 @@
+"""
+    Contains functions and a class to read a work log file lazily.
+
+    In lazy mode, a log file is memory-mapped rather than read.  Only
+     the position of each row and the values needed for the sort indexes
+     and the index of the times tasks occupy are read when the file is
+     opened; the rest of an entry is decoded from the file the first
+     time it is needed.
+
+    Class Definitions:
+    - LazyEntryList -- a list of log entries backed by a mapped file.
+
+    Public Functions:
+    - open_log -- maps a log file and builds its indexes.
+    - save_log -- writes a lazily-read log back to its file.
+    - set_open_mode -- allows the user to choose whether log files are
+       read in full or lazily.
+
+    Private Functions:
+    - _z_exc -- generic exception handler.
+   ---------------------------------------------------------------------
+"""
+
+
+# Import sys.
+import sys
+
+
+def _z_exc(loc, err):
+    """
+        Catch-all exception handler.
+
+        Arguments:
+        - loc -- string naming the module/function/method in which the
+           exception occurred.
+        - err -- the exception string.
+
+        Returns:  nothing (exits program).
+       -----------------------------------------------------------------
+    """
+    # Print error information.
+    print("An interal error occurred in " + loc + ": ", err)
+    # Exit.
+    sys.exit(
+      "Please report the above error and the circumstances which caused it " +
+      "to the developer.")
+    return  # Superfluous return.
+# end function
+
+
+# Other imports.
+try:
+    import collections.abc
+    import csv
+    import datetime
+    import locale
+    import mmap
+    import os
+
+    import io_utils
+    import logentry
+    import wl_pool
+except Exception as err:
+    _z_exc("wl_lazylog.py/module imports", err)
+# end try
+
+
+# Constants.
+FULL = "full"
+LAZY = "lazy"
+TITLE_SORT = 0
+DATE_SORT = 1
+# The fields read from every row when a file is opened.
+KEY_FIELDS = ("id", "title", "datetime", "duration")
+
+
+class LazyEntryList(collections.abc.MutableSequence):
+    """
+        A list of log entries, backed by a memory-mapped log file.
+
+        Items are either row numbers (for entries which have not been
+         decoded from the file) or LogEntry objects (for entries which
+         have been added since the file was read).  Decoded entries are
+         cached, so that the same object is returned every time.
+
+        Attributes:
+        - filename -- the name of the mapped file.
+        - fieldnames -- the field names read from the file's first row.
+        - header -- the dictionary holding the work log's info (the
+           first data row of the file).
+        - failed -- the number of rows which could not be indexed.
+
+        Public Methods:
+        - index -- finds the position of an entry.
+        - insert -- inserts an entry (required by MutableSequence).
+        - intervals -- returns the times occupied by every entry.
+        - iter_dicts -- yields every entry as a dictionary of strings.
+        - lookup -- finds an entry by its ID.
+        - release -- closes the mapped file.
+        - remap -- maps the file again after it has been rewritten.
+        - sort_keys -- returns the sort index tuples for every entry.
+
+        Private Methods:
+        - _build_index -- finds the rows and sort keys in the file.
+        - _decode -- creates a log entry from a row in the file.
+        - _read_row -- reads the fields of a row in the file.
+        - _split -- splits a row in the file into fields.
+        - _split_leading -- splits only the first fields of a row in
+           the file.
+
+        Magic Methods:
+        - __init__ -- maps a file and builds the index.
+        - __delitem__, __getitem__, __len__, __setitem__ -- the
+           sequence protocol.
+       -----------------------------------------------------------------
+    """
+
+    def __init__(self, fname, encoding=None, pool=None):
+        """
+            Maps a log file and builds its row index.
+
+            Arguments:
+            - fname -- the name of the file to map.
+
+            Keyword Arguments:
+            - encoding -- the encoding of the file (default is the same
+               encoding io_utils.file_read uses).
+            - pool -- the work log's string pool, which the strings of
+               decoded entries are shared through (default None, for a
+               pool of the list's own).
+           -------------------------------------------------------------
+        """
+        self.filename = fname
+        self.encoding = encoding or locale.getpreferredencoding(False)
+        if pool is None:
+            pool = wl_pool.StringPool()
+        # end if
+        self._pool = pool
+        self.fieldnames = []
+        self.header = {}
+        self.failed = 0
+        self._file = None
+        self._map = None
+        self._offsets = []
+        self._row_ids = []
+        self._keys = []
+        self._durations = []
+        self._items = []
+        self._decoded = {}
+        self._ids = {}
+        self._build_index()
+    # end method
+
+    def __delitem__(self, ndx):
+        """Deletes an entry from the list."""
+        try:
+            # Deleting a slice is done one entry at a time.
+            if type(ndx) == slice:
+                for n in sorted(range(*ndx.indices(len(self))), reverse=True):
+                    del self[n]
+                # end for
+                return
+            # end if
+            item = self._items[ndx]
+            if type(item) == int:
+                self._ids.pop(self._row_ids[item], None)
+                self._decoded.pop(item, None)
+            # end if
+            del self._items[ndx]
+        except IndexError:
+            raise
+        except Exception as err:
+            _z_exc("wl_lazylog.py/LazyEntryList/__delitem__", err)
+        # end try
+    # end method
+
+    def __getitem__(self, ndx):
+        """Returns an entry, decoding it from the file if necessary."""
+        try:
+            if type(ndx) == slice:
+                return [self[n] for n in range(*ndx.indices(len(self)))]
+            # end if
+            item = self._items[ndx]
+            if type(item) == int:
+                return self._decode(item)
+            # end if
+            return item
+        except IndexError:
+            raise
+        except Exception as err:
+            _z_exc("wl_lazylog.py/LazyEntryList/__getitem__", err)
+        # end try
+    # end method
+
+    def __len__(self):
+        """Returns the number of entries."""
+        return len(self._items)
+    # end method
+
+    def __setitem__(self, ndx, entry):
+        """Replaces an entry in the list."""
+        try:
+            item = self._items[ndx]
+            if type(item) == int:
+                self._ids.pop(self._row_ids[item], None)
+                self._decoded.pop(item, None)
+            # end if
+            self._items[ndx] = entry
+        except IndexError:
+            raise
+        except Exception as err:
+            _z_exc("wl_lazylog.py/LazyEntryList/__setitem__", err)
+        # end try
+    # end method
+
+    def index(self, entry, start=0, stop=None):
+        """
+            Finds the position of an entry.
+
+            Overrides the MutableSequence method, which would decode
+             every entry in the list.
+
+            Arguments:
+            - entry -- the entry to find.
+
+            Keyword Arguments:
+            - start, stop -- the range of positions to search.
+
+            Returns:  the position of the entry.
+           -------------------------------------------------------------
+        """
+        try:
+            if stop is None:
+                stop = len(self._items)
+            # end if
+            # An entry decoded from the file is found by its row number.
+            row = self._ids.get(getattr(entry, "id", None))
+            if row is not None and self._decoded.get(row) is entry:
+                return self._items.index(row, start, stop)
+            # end if
+            for n in range(start, stop):
+                if self._items[n] is entry:
+                    return n
+                # end if
+            # end for
+            raise ValueError("entry is not in list")
+        except ValueError:
+            raise
+        except Exception as err:
+            _z_exc("wl_lazylog.py/LazyEntryList/index", err)
+        # end try
+    # end method
+
+    def insert(self, ndx, entry):
+        """
+            Inserts an entry into the list.
+
+            Arguments:
+            - ndx -- the position at which to insert the entry.
+            - entry -- the entry to insert.
+
+            Returns:  nothing.
+           -------------------------------------------------------------
+        """
+        try:
+            self._items.insert(ndx, entry)
+            return
+        except Exception as err:
+            _z_exc("wl_lazylog.py/LazyEntryList/insert", err)
+        # end try
+    # end method
+
+    def intervals(self):
+        """
+            Returns the times occupied by every entry.
+
+            Entries which have not been decoded are not decoded; their
+             times come from the values read when the file was opened.
+
+            Arguments:  none.
+
+            Returns:  a list of (ID, start, end) tuples, leaving out
+             entries with no duration.
+           -------------------------------------------------------------
+        """
+        try:
+            interval_list = []
+            for item in self._items:
+                if type(item) == int and item not in self._decoded:
+                    title, dt, entry_id = self._keys[item]
+                    duration = self._durations[item]
+                else:
+                    if type(item) == int:
+                        item = self._decoded[item]
+                    # end if
+                    entry_id, dt, duration = (
+                      item.id, item.datetime, item.duration)
+                # end if
+                if dt and type(duration) == datetime.timedelta and duration:
+                    interval_list.append((entry_id, dt, dt + duration))
+                # end if
+            # end for
+            return interval_list
+        except Exception as err:
+            _z_exc("wl_lazylog.py/LazyEntryList/intervals", err)
+        # end try
+    # end method
+
+    def iter_dicts(self):
+        """
+            Yields every entry as a dictionary of strings.
+
+            Entries which have not been decoded are copied straight from
+             the file.
+
+            Arguments:  none.
+
+            Returns:  a generator of dictionaries.
+           -------------------------------------------------------------
+        """
+        try:
+            for item in self._items:
+                if type(item) != int:
+                    yield item.to_dict()
+                elif item in self._decoded:
+                    yield self._decoded[item].to_dict()
+                else:
+                    yield self._read_row(item)
+                # end if
+            # end for
+        except Exception as err:
+            _z_exc("wl_lazylog.py/LazyEntryList/iter_dicts", err)
+        # end try
+    # end method
+
+    def lookup(self, entry_id):
+        """
+            Finds an entry by its ID.
+
+            Arguments:
+            - entry_id -- the ID of the entry to find.
+
+            Returns:  the entry, or None if there is no match.
+           -------------------------------------------------------------
+        """
+        try:
+            row = self._ids.get(entry_id)
+            if row is not None:
+                return self._decode(row)
+            # end if
+            # Entries added since the file was read are not in the
+            #  index.
+            for item in self._items:
+                if type(item) != int and item.id == entry_id:
+                    return item
+                # end if
+            # end for
+            return None
+        except Exception as err:
+            _z_exc("wl_lazylog.py/LazyEntryList/lookup", err)
+        # end try
+    # end method
+
+    def release(self):
+        """
+            Closes the mapped file.
+
+            Arguments:  none.
+
+            Returns:  nothing.
+           -------------------------------------------------------------
+        """
+        try:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            # end if
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            # end if
+            return
+        except Exception as err:
+            _z_exc("wl_lazylog.py/LazyEntryList/release", err)
+        # end try
+    # end method
+
+    def remap(self):
+        """
+            Maps the file again after it has been rewritten.
+
+            The file must hold the entries in the same order as the
+             list.  Entries which have already been decoded are kept.
+
+            Arguments:  none.
+
+            Returns:  nothing.
+           -------------------------------------------------------------
+        """
+        try:
+            entries = [
+              self._decoded.get(item) if type(item) == int else item
+              for item in self._items]
+            self.release()
+            self._build_index()
+            # Keep the decoded entries, which may be held elsewhere.
+            for row, entry in enumerate(entries):
+                if entry is not None and row < len(self._items):
+                    self._decoded[row] = entry
+                # end if
+            # end for
+            return
+        except Exception as err:
+            _z_exc("wl_lazylog.py/LazyEntryList/remap", err)
+        # end try
+    # end method
+
+    def sort_keys(self):
+        """
+            Returns the sort index tuples for every entry.
+
+            Arguments:  none.
+
+            Returns:  a list of (title, datetime, id) tuples and a list
+             of (datetime, title, id) tuples, both unsorted.
+           -------------------------------------------------------------
+        """
+        try:
+            title_sort = []
+            date_sort = []
+            for item in self._items:
+                if type(item) == int:
+                    title, dt, entry_id = self._keys[item]
+                else:
+                    title, dt, entry_id = item.title, item.datetime, item.id
+                # end if
+                title_sort.append((title, dt, entry_id))
+                date_sort.append((dt, title, entry_id))
+            # end for
+            return title_sort, date_sort
+        except Exception as err:
+            _z_exc("wl_lazylog.py/LazyEntryList/sort_keys", err)
+        # end try
+    # end method
+
+    def _build_index(self):
+        """
+            Maps the file and finds the rows and sort keys in it.
+
+            Arguments:  none.
+
+            Returns:  nothing.
+           -------------------------------------------------------------
+        """
+        try:
+            self._file = open(self.filename, "rb")
+            self._map = mmap.mmap(
+              self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            # Skip blank rows, as the csv reader does.
+            self._offsets = [
+              (start, end) for start, end in io_utils.row_offsets(self._map)
+              if self._map[start:end].strip()]
+            self._row_ids = []
+            self._keys = []
+            self._durations = []
+            self._items = []
+            self._decoded = {}
+            self._ids = {}
+            self.failed = 0
+            if not self._offsets:
+                return
+            # end if
+            # The first row holds the field names, and the second the
+            #  work log's info.
+            self.fieldnames = self._split(self._offsets.pop(0))
+            if self._offsets:
+                self.header = dict(
+                  zip(self.fieldnames, self._split(self._offsets.pop(0))))
+            # end if
+            # Only the fields needed for the indexes (and the duration,
+            #  for the index of the times tasks occupy) are read.  They
+            #  come before the notes in a log file, so the rest of each
+            #  row is not split at all.
+            columns = [
+              self.fieldnames.index(name) if name in self.fieldnames
+              else None for name in KEY_FIELDS]
+            count = max(
+              (col for col in columns if col is not None), default=-1) + 1
+            # A dummy entry does the type conversions, so that the sort
+            #  keys match those of decoded entries.
+            convert = logentry.LogEntry()._convert_dict_key
+            for row in range(len(self._offsets)):
+                values = self._split_leading(self._offsets[row], count)
+                fields = {
+                  name: values[col] for name, col in zip(KEY_FIELDS, columns)
+                  if col is not None and col < len(values)}
+                entry_id = convert(fields.get("id"))
+                dt = convert(fields.get("datetime"))
+                # Rows that can't be decoded are left out, as they are
+                #  when a file is read in full.
+                if type(entry_id) != int or type(dt) != datetime.datetime:
+                    self.failed += 1
+                    self._row_ids.append(None)
+                    self._keys.append(None)
+                    self._durations.append(None)
+                    continue
+                # end if
+                self._row_ids.append(entry_id)
+                title = self._pool.intern(convert(fields.get("title")))
+                self._keys.append((title, dt, entry_id))
+                self._durations.append(convert(fields.get("duration")))
+                self._ids[entry_id] = row
+                self._items.append(row)
+            # end for
+            return
+        except (OSError, ValueError):
+            raise
+        except Exception as err:
+            _z_exc("wl_lazylog.py/LazyEntryList/_build_index", err)
+        # end try
+    # end method
+
+    def _decode(self, row):
+        """
+            Creates a log entry from a row in the file.
+
+            Arguments:
+            - row -- the row number.
+
+            Returns:  the log entry object.
+           -------------------------------------------------------------
+        """
+        try:
+            entry = self._decoded.get(row)
+            if entry is None:
+                entry = logentry.LogEntry()
+                entry.from_dict(self._read_row(row))
+                self._pool.intern_entry(entry)
+                self._decoded[row] = entry
+            # end if
+            return entry
+        except Exception as err:
+            _z_exc("wl_lazylog.py/LazyEntryList/_decode", err)
+        # end try
+    # end method
+
+    def _read_row(self, row):
+        """
+            Reads a row in the file.
+
+            Arguments:
+            - row -- the row number.
+
+            Returns:  a dictionary of strings, as read by
+             io_utils.file_read.
+           -------------------------------------------------------------
+        """
+        try:
+            return dict(zip(self.fieldnames, self._split(self._offsets[row])))
+        except Exception as err:
+            _z_exc("wl_lazylog.py/LazyEntryList/_read_row", err)
+        # end try
+    # end method
+
+    def _split(self, span):
+        """
+            Splits a row in the file into fields.
+
+            Arguments:
+            - span -- the (start, end) offsets of the row.
+
+            Returns:  a list of strings.
+           -------------------------------------------------------------
+        """
+        try:
+            start, end = span
+            text = self._map[start:end].decode(self.encoding)
+            return next(csv.reader([text]))
+        except Exception as err:
+            _z_exc("wl_lazylog.py/LazyEntryList/_split", err)
+        # end try
+    # end method
+
+    def _split_leading(self, span, count):
+        """
+            Splits only the first fields of a row in the file.
+
+            The fields are found in the mapped file, and only they are
+             decoded; the rest of the row is not looked at.
+
+            Arguments:
+            - span -- the (start, end) offsets of the row.
+            - count -- the number of fields to split.
+
+            Returns:  a list of up to count strings, as the csv reader
+             would read them.
+           -------------------------------------------------------------
+        """
+        try:
+            start, end = span
+            buf = self._map
+            # The new line at the end of the row is not part of the last
+            #  field.
+            while end > start and buf[end - 1:end] in (b"\n", b"\r"):
+                end -= 1
+            # end while
+            fields = []
+            pos = start
+            while len(fields) < count and pos <= end:
+                if buf[pos:pos + 1] == b'"':
+                    # A quoted field runs to the next quote mark that is
+                    #  not doubled.
+                    parts = []
+                    pos += 1
+                    while True:
+                        close = buf.find(b'"', pos, end)
+                        if close == -1:
+                            parts.append(buf[pos:end])
+                            pos = end
+                            break
+                        # end if
+                        parts.append(buf[pos:close])
+                        pos = close + 1
+                        if buf[pos:pos + 1] != b'"':
+                            break
+                        # end if
+                        parts.append(b'"')
+                        pos += 1
+                    # end while
+                    field = b"".join(parts)
+                    comma = buf.find(b",", pos, end)
+                else:
+                    comma = buf.find(b",", pos, end)
+                    field = buf[pos:end if comma == -1 else comma]
+                # end if
+                fields.append(field.decode(self.encoding))
+                pos = end + 1 if comma == -1 else comma + 1
+            # end while
+            return fields
+        except Exception as err:
+            _z_exc("wl_lazylog.py/LazyEntryList/_split_leading", err)
+        # end try
+    # end method
+# end class
+
+
+def open_log(fname, line_length=80, pool=None):
+    """
+        Maps a log file and builds its indexes.
+
+        Arguments:
+        - fname -- the name of the log file.
+
+        Keyword Arguments:
+        - line_length -- the width of the screen in characters (default
+           80).
+        - pool -- the work log's string pool (default None).
+
+        Returns:  a LazyEntryList, or None if the file could not be
+         opened.
+       -----------------------------------------------------------------
+    """
+    try:
+        try:
+            entries = LazyEntryList(fname, pool=pool)
+        except (OSError, ValueError) as err:
+            # An empty file can't be mapped.
+            io_utils.print_status(
+              "Error", f"An error occured while reading the file:  {err}",
+              line_length=line_length)
+            return None
+        # end try
+        if not entries.header:
+            entries.release()
+            return None
+        # end if
+        return entries
+    except Exception as err:
+        _z_exc("wl_lazylog.py/open_log", err)
+    # end try
+# end function
+
+
+def save_log(entries, header, fieldnames, line_length=80):
+    """
+        Writes a lazily-read log back to its file.
+
+        The log is written to a temporary file, because entries which
+         have not been decoded are copied from the mapped file.  The
+         temporary file then replaces the original, which is mapped
+         again.
+
+        Arguments:
+        - entries -- the LazyEntryList holding the log's entries.
+        - header -- a dictionary holding the work log's info.
+        - fieldnames -- the field names to write.
+
+        Keyword Arguments:
+        - line_length -- the width of the screen in characters (default
+           80).
+
+        Returns:  True if successful, else False.
+       -----------------------------------------------------------------
+    """
+    try:
+        fname = entries.filename
+        temp_fname = fname + ".tmp"
+
+        def rows():
+            yield header
+            yield from entries.iter_dicts()
+        # end function
+
+        if not io_utils.file_write(
+          temp_fname, "csv", rows(), fieldnames=fieldnames,
+          line_length=line_length):
+            return False
+        # end if
+        entries.release()
+        os.replace(temp_fname, fname)
+        entries.remap()
+        return True
+    except Exception as err:
+        _z_exc("wl_lazylog.py/save_log", err)
+    # end try
+# end function
+
+
+def set_open_mode(wl_obj):
+    """
+        Allows the user to choose whether log files are read in full or
+         lazily.
+
+        Arguments:
+        - wl_obj -- the work log object.
+
+        Returns:  nothing
+       -----------------------------------------------------------------
+    """
+    try:
+        # Build message.
+        if wl_obj.open_mode == LAZY:
+            msg = "Log files are currently read as needed (large logs)."
+        else:  # wl_obj.open_mode == FULL
+            msg = "Log files are currently read in full (normal)."
+        # end if
+        # Print status.
+        io_utils.print_status(
+          "Status", msg, go=True, line_length=wl_obj.line_length)
+        # Display menu and get response.
+        response = io_utils.menu(
+          ["Read Log Files in Full (Normal)",
+           "Read Log Files as Needed (Large Logs)"], keystroke_list="#")
+        # If the user chose to quit, just return without changing
+        #  anything.
+        if response == 0:
+            return
+        # Else set the open_mode attribute to the user's choice.
+        elif response == 1:
+            wl_obj.open_mode = FULL
+        else:  # response == 2
+            wl_obj.open_mode = LAZY
+        # end if
+        return
+    except Exception as err:
+        _z_exc("wl_lazylog.py/set_open_mode", err)
+    # end try
+# end function
@@ -0,0 +1,344 @@
+"""
+    Contains a class and functions to classify the words of date, time
+     and duration phrases.
+
+    Each word is classified once, and the result cached:  whether it is
+     a number (as a numeral or a number word), an ordinal, a month, a day
+     of the week, a unit of time, or a relative word such as "tomorrow"
+     or "next".  The grammars in wl_datetime read these classifications
+     instead of matching each word against the word lists again, so that
+     a phrase made of words which have been seen before is parsed
+     without any pattern matching.
+
+    Class Definitions:
+    - Token -- a classified word.
+
+    Public Functions:
+    - classify -- classifies (and caches) a word.
+    - clear_cache -- empties the cache of classified words.
+    - numbers -- converts the number words and phrases in a string.
+    - tokenize -- splits a string into classified words.
+
+    Private Functions:
+    - _prefixes -- builds (and caches) a table of the prefixes of a list
+       of names.
+    - _word_value -- converts (and caches) a word to a number.
+    - _z_exc -- generic exception handler.
+   ---------------------------------------------------------------------
+"""
+
+
+# Import sys.
+import sys
+
+
+def _z_exc(loc, err):
+    """
+        Catch-all exception handler.
+
+        Arguments:
+        - loc -- string naming the module/function/method in which the
+           exception occurred.
+        - err -- the exception string.
+
+        Returns:  nothing (exits program).
+       -----------------------------------------------------------------
+    """
+    # Print error information.
+    print("An interal error occurred in " + loc + ": ", err)
+    # Exit.
+    sys.exit(
+      "Please report the above error and the circumstances which caused it " +
+      "to the developer.")
+    return  # Superfluous return.
+# end function
+
+
+# Other imports.
+try:
+    import functools
+    import re
+
+    import wl_resource
+except Exception as err:
+    _z_exc("wl_lexer.py/module imports", err)
+# end try
+
+
+# Constants.
+# The number of classified words which are cached.
+TOKEN_CACHE_SIZE = 2048
+WORD_PATTERN = re.compile(r"\b\w+\b")
+# Number phrases.
+NEGATIVE_PATTERN = re.compile(r"(^-)|(\s-)")
+NUMBER_SPLIT_PATTERN = re.compile(r"\s|-")
+ARTICLE_PATTERN = re.compile(r"an?$")
+FRACTION_PATTERN = re.compile(r"\d+/\d+")
+DENOMINATORS = (
+  (re.compile(r"half"), 2), (re.compile(r"thirds?"), 3),
+  (re.compile(r"(fourths?|quarters?)"), 4))
+# Units of time, written after a number ("3h", "45min").
+PACKED_PATTERNS = (
+  ("m", re.compile(r"(\d+)m[inutes]?")), ("h", re.compile(r"(\d+)h[ours]?")),
+  ("d", re.compile(r"(\d+)d[ays]?")))
+# Relative words, and the number of days or weeks they move the date.
+RELATIVE_DAYS = {"yesterday": -1, "today": 0, "tomorrow": 1}
+RELATIVE_WEEKS = {"last": -1, "this": 0, "next": 1}
+
+
+class Token:
+    """
+        A classified word.
+
+        Attributes:
+        - text -- the word.
+        - lower -- the word in lower case.
+        - integer -- the word as an integer if it is a numeral, else
+           None.
+        - value -- the word as an integer if it is a numeral or number
+           word, else the word itself.
+        - ordinal -- the word as an integer if it is an ordinal, else
+           None.
+        - month -- the month (1-12) if the word is a month name or the
+           beginning of one (at least 3 letters), else None.  Only plain
+           words are checked.
+        - weekday -- the day of the week (Sunday-based) if the word is a
+           day name or the beginning of one (at least 2 letters), else
+           None.  Only plain words are checked.
+        - unit -- "m", "h" or "d" if the word could be a unit of time,
+           else None.
+        - packed -- a tuple of a unit and an amount if the word is a
+           number with a unit of time attached, else None.
+        - day_offset -- the number of days from today if the word is a
+           relative day, else None.
+        - week_offset -- the number of weeks from this week if the word
+           is "this", "last" or "next", else None.
+
+        Magic Methods:
+        - __init__ -- classifies a word.
+        - __repr__ -- returns a representation of the token.
+       -----------------------------------------------------------------
+    """
+
+    def __init__(self, text):
+        """
+            Classifies a word.
+
+            Arguments:
+            - text -- the word.
+
+            Returns:  a token.
+           -------------------------------------------------------------
+        """
+        try:
+            self.text = text
+            self.lower = text.lower()
+            try:
+                self.integer = int(text)
+            except ValueError:
+                self.integer = None
+            # end try
+            self.value = wl_resource.cardinal(text)
+            self.ordinal = wl_resource.ordinal(text)
+            # Month and day names can be abbreviated to any beginning
+            #  which is long enough to tell them apart.  Only plain words
+            #  (letters and numerals) are checked.
+            self.month = None
+            self.weekday = None
+            if WORD_PATTERN.fullmatch(text):
+                title = text.title()
+                if len(text) >= 3:
+                    self.month = _prefixes(tuple(wl_resource.MONTHS)).get(
+                      title)
+                # end if
+                if len(text) >= 2:
+                    self.weekday = _prefixes(tuple(wl_resource.DAYS)).get(
+                      title)
+                # end if
+            # end if
+            self.unit = None
+            if text[:1] in ["m", "h", "d"]:
+                self.unit = text[:1]
+            # end if
+            self.packed = None
+            for unit, pattern in PACKED_PATTERNS:
+                match = pattern.match(text)
+                if match:
+                    self.packed = (unit, int(match.group(1)))
+                    break
+                # end if
+            # end for
+            self.day_offset = RELATIVE_DAYS.get(self.lower)
+            self.week_offset = RELATIVE_WEEKS.get(self.lower)
+        except Exception as err:
+            _z_exc("wl_lexer.py/Token/__init__", err)
+        # end try
+    # end method
+
+    def __repr__(self):
+        """Returns a representation of the token."""
+        return f"Token({self.text!r})"
+    # end method
+
+# end class
+
+
+@functools.lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def classify(word):
+    """
+        Classifies a word.
+
+        Arguments:
+        - word -- the word.
+
+        Returns:  a Token object.
+       -----------------------------------------------------------------
+    """
+    try:
+        return Token(word)
+    except Exception as err:
+        _z_exc("wl_lexer.py/classify", err)
+    # end try
+# end function
+
+
+def clear_cache():
+    """
+        Empties the cache of classified words.
+
+        Arguments:  none.
+
+        Returns:  nothing.
+       -----------------------------------------------------------------
+    """
+    try:
+        classify.cache_clear()
+        _word_value.cache_clear()
+        return
+    except Exception as err:
+        _z_exc("wl_lexer.py/clear_cache", err)
+    # end try
+# end function
+
+
+def numbers(string):
+    """
+        Converts the number words and phrases in a string to integers or
+         floats.
+
+        Arguments:
+        - string -- the string to convert.
+
+        Returns:  a list of the words in the string, with number words
+         and phrases converted to integers or floats.  A number which is
+         the numerator of the fraction after it is replaced by None.
+       -----------------------------------------------------------------
+    """
+    try:
+        # Before splitting the string, distinguish between "-" as a
+        #  hyphen, and "-" as a negative sign.  Assume that negative
+        #  numbers are preceded by a space (or are at the beginning of
+        #  the string), and replace any negative "-"s with a flag.
+        string = NEGATIVE_PATTERN.sub(r" ~", string)
+        value_list = []
+        for word in NUMBER_SPLIT_PATTERN.split(string):
+            value, den = _word_value(word)
+            # If a denominator was found, see if the previous word is a
+            #  numerator; use it and then delete it if it is, else set
+            #  the numerator to 1.
+            if den:
+                if value_list and type(value_list[-1]) == int:
+                    num = value_list[-1]
+                    value_list[-1] = None
+                else:
+                    num = 1
+                # end if
+                value = num / den
+            # end if
+            value_list.append(value)
+        # end for
+        return value_list
+    except Exception as err:
+        _z_exc("wl_lexer.py/numbers", err)
+    # end try
+# end function
+
+
+def tokenize(string):
+    """
+        Splits a string into classified words.
+
+        Arguments:
+        - string -- the string to split.
+
+        Returns:  a list of Token objects, one for each word (punctuation
+         and spaces are discarded).
+       -----------------------------------------------------------------
+    """
+    try:
+        return [classify(word) for word in WORD_PATTERN.findall(string)]
+    except Exception as err:
+        _z_exc("wl_lexer.py/tokenize", err)
+    # end try
+# end function
+
+
+@functools.lru_cache(maxsize=None)
+def _prefixes(names):
+    """
+        Builds a table of the prefixes of a list of names.
+
+        Arguments:
+        - names -- a tuple of the names.
+
+        Returns:  a dictionary of every beginning of every name, and the
+         index of the first name which begins with it.
+       -----------------------------------------------------------------
+    """
+    try:
+        table = {}
+        for n, name in enumerate(names):
+            for x in range(1, len(name) + 1):
+                table.setdefault(name[:x], n)
+            # end for
+        # end for
+        return table
+    except Exception as err:
+        _z_exc("wl_lexer.py/_prefixes", err)
+    # end try
+# end function
+
+
+@functools.lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def _word_value(word):
+    """
+        Converts a word of a number phrase to a number.
+
+        Arguments:
+        - word -- the word, with a leading "~" for a negative sign.
+
+        Returns:  a tuple of the word (converted to an integer or float
+         if it is a number, a fraction, "a" or "an") and the denominator
+         it stands for ("half", "third", etc.), or 0.
+       -----------------------------------------------------------------
+    """
+    try:
+        # If the flag is found, restore the "-".
+        value = wl_resource.cardinal(word.replace("~", "-"))
+        if ARTICLE_PATTERN.match(str(value)):
+            value = 1
+        elif FRACTION_PATTERN.match(str(value)):
+            elements = value.split("/")
+            value = int(elements[0]) / int(elements[1])
+        # end if
+        # Look for the more common denominator words.
+        for pattern, den in DENOMINATORS:
+            if pattern.match(str(value)):
+                return value, den
+            # end if
+        # end for
+        return value, 0
+    except Exception as err:
+        _z_exc("wl_lexer.py/_word_value", err)
+    # end try
+# end function
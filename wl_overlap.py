@@ -0,0 +1,707 @@
+"""
+    Contains a class and functions to find tasks whose times overlap.
+
+    Each task occupies the time from its datetime to its datetime plus
+     its duration.  The work log object's overlaps attribute holds an
+     index of these intervals for its stored entries; it is built the
+     first time it is needed, and kept up to date as entries are added,
+     edited and deleted (see WorkLog.mark_dirty).  The index of a lazy
+     log is built from the values read when the file was opened, and
+     that of a sharded log from the shards which have been loaded; the
+     shards which may hold tasks overlapping a new task are loaded when
+     it is checked, and added to the index.  The occurrances of
+     rule-based series are not stored, so they are created from their
+     rules (see wl_series) for the time being checked.
+
+    Class Definitions:
+    - IntervalIndex -- an index of time intervals.
+
+    Public Functions:
+    - add_many -- adds many entries to the work log object's index at
+       once.
+    - find_conflicts -- finds the tasks which overlap a new task or
+       series.
+    - get_index -- gets the work log object's interval index, building
+       it if necessary.
+    - remove -- removes an entry from the work log object's index.
+    - update -- adds or updates an entry in the work log object's index.
+    - warn -- warns the user if a new task or series overlaps other
+       tasks.
+
+    Private Functions:
+    - _fix -- updates the latest end held by an index node.
+    - _interval -- gets the interval occupied by a task.
+    - _z_exc -- generic exception handler.
+   ---------------------------------------------------------------------
+"""
+
+
+# Import sys.
+import sys
+
+
+def _z_exc(loc, err):
+    """
+        Catch-all exception handler.
+
+        Arguments:
+        - loc -- string naming the module/function/method in which the
+           exception occurred.
+        - err -- the exception string.
+
+        Returns:  nothing (exits program).
+       -----------------------------------------------------------------
+    """
+    # Print error information.
+    print("An interal error occurred in " + loc + ": ", err)
+    # Exit.
+    sys.exit(
+      "Please report the above error and the circumstances which caused it " +
+      "to the developer.")
+    return  # Superfluous return.
+# end function
+
+
+# Other imports.
+try:
+    import datetime
+    import functools
+    import random
+
+    import io_utils
+    import wl_lazylog
+    import wl_resource
+    import wl_search
+    import wl_series
+    import wl_shard
+except Exception as err:
+    _z_exc("wl_overlap.py/module imports", err)
+# end try
+
+
+# Constants.
+# The largest number of overlapping tasks listed in a warning.
+MAX_LISTED = 5
+# The fields of a node in an interval index.
+START = 0
+END = 1
+ITEM_ID = 2
+PRIORITY = 3
+LEFT = 4
+RIGHT = 5
+LATEST = 6
+# An index is built again, rather than added to, when it is given more
+#  than one new interval for every this many it holds.
+REBUILD_FRACTION = 8
+
+
+class IntervalIndex:
+    """
+        An index of time intervals.
+
+        The intervals are kept in a treap (a binary search tree balanced
+         by random priorities), ordered by their start times.  Each node
+         also holds the latest end of any interval below it, so a search
+         skips every subtree whose intervals all end before the time
+         searched.  Adding or removing an interval takes O(log n) steps,
+         and finding the k intervals which overlap a time takes
+         O(log n + k) steps (roughly; at worst O(k log n)).
+
+        Each node is a list of [start, end, ID, priority, left, right,
+         latest end].
+
+        Public Methods:
+        - add -- adds an interval.
+        - add_many -- adds many intervals at once.
+        - overlapping -- finds the intervals which overlap a time.
+        - remove -- removes an interval.
+
+        Private Methods:
+        - _build -- builds a balanced tree from sorted intervals.
+        - _erase -- removes a node from a subtree.
+        - _insert -- adds a node to a subtree.
+        - _merge -- joins two subtrees.
+        - _split -- splits a subtree at a key.
+
+        Magic Methods:
+        - __init__ -- creates an index.
+        - __len__ -- returns the number of intervals.
+       -----------------------------------------------------------------
+    """
+
+    def __init__(self, items=()):
+        """
+            Returns an index.
+
+            Keyword Arguments:
+            - items -- (ID, start, end) tuples of the intervals to add
+               (default none).
+           -------------------------------------------------------------
+        """
+        self._root = None
+        self._spans = {}
+        self.add_many(items)
+    # end method
+
+    def __len__(self):
+        """Returns the number of intervals."""
+        return len(self._spans)
+    # end method
+
+    def add(self, item_id, start, end):
+        """
+            Adds an interval, replacing any interval with the same ID.
+
+            Arguments:
+            - item_id -- the ID of the interval's entry.
+            - start -- the start of the interval.
+            - end -- the end of the interval (not included).
+
+            Returns:  nothing.
+           -------------------------------------------------------------
+        """
+        try:
+            self.remove(item_id)
+            self._spans[item_id] = (start, end)
+            self._root = self._insert(
+              self._root, [start, end, item_id, random.random(), None, None,
+                           end])
+            return
+        except Exception as err:
+            _z_exc("wl_overlap.py/IntervalIndex/add", err)
+        # end try
+    # end method
+
+    def add_many(self, items):
+        """
+            Adds many intervals at once.
+
+            If there are only a few, they are added one at a time;
+             otherwise the tree is built again, which takes O(n) steps
+             plus the time to sort the new intervals.
+
+            Arguments:
+            - items -- (ID, start, end) tuples of the intervals.  Any
+               interval with the same ID as one of them is replaced.
+
+            Returns:  nothing.
+           -------------------------------------------------------------
+        """
+        try:
+            items = list(items)
+            if len(items) * REBUILD_FRACTION <= len(self._spans):
+                for item_id, start, end in items:
+                    self.add(item_id, start, end)
+                # end for
+                return
+            # end if
+            for item_id, start, end in items:
+                self._spans[item_id] = (start, end)
+            # end for
+            self._root = self._build(sorted(
+              (start, item_id, end)
+              for item_id, (start, end) in self._spans.items()))
+            return
+        except Exception as err:
+            _z_exc("wl_overlap.py/IntervalIndex/add_many", err)
+        # end try
+    # end method
+
+    def overlapping(self, start, end):
+        """
+            Finds the intervals which overlap a time.
+
+            Arguments:
+            - start -- the start of the time.
+            - end -- the end of the time (not included).
+
+            Returns:  a list of the IDs of the overlapping intervals, in
+             order of their start times.
+           -------------------------------------------------------------
+        """
+        try:
+            id_list = []
+
+            def visit(node):
+                # Nothing below ends after the start of the time.
+                if node is None or node[LATEST] <= start:
+                    return
+                # end if
+                visit(node[LEFT])
+                # Nothing to the right starts before its end.
+                if node[START] < end:
+                    if node[END] > start:
+                        id_list.append(node[ITEM_ID])
+                    # end if
+                    visit(node[RIGHT])
+                # end if
+                return
+            # end function
+
+            visit(self._root)
+            return id_list
+        except Exception as err:
+            _z_exc("wl_overlap.py/IntervalIndex/overlapping", err)
+        # end try
+    # end method
+
+    def remove(self, item_id):
+        """
+            Removes an interval.
+
+            Arguments:
+            - item_id -- the ID of the interval's entry.
+
+            Returns:  nothing.
+           -------------------------------------------------------------
+        """
+        try:
+            span = self._spans.pop(item_id, None)
+            if span is not None:
+                self._root = self._erase(self._root, (span[0], item_id))
+            # end if
+            return
+        except Exception as err:
+            _z_exc("wl_overlap.py/IntervalIndex/remove", err)
+        # end try
+    # end method
+
+    def _build(self, items):
+        """
+            Builds a balanced tree from sorted intervals.
+
+            The priorities are drawn at random and handed out from the
+             top of the tree down, so the tree is a valid treap.
+
+            Arguments:
+            - items -- (start, ID, end) tuples, sorted.
+
+            Returns:  the root node.
+           -------------------------------------------------------------
+        """
+        try:
+            def build(first, last):
+                if first >= last:
+                    return None
+                # end if
+                mid = (first + last) // 2
+                start, item_id, end = items[mid]
+                node = [start, end, item_id, 0.0, build(first, mid),
+                        build(mid + 1, last), end]
+                _fix(node)
+                return node
+            # end function
+
+            root = build(0, len(items))
+            priorities = sorted(
+              (random.random() for item in items), reverse=True)
+            level = [root] if root else []
+            n = 0
+            while level:
+                next_level = []
+                for node in level:
+                    node[PRIORITY] = priorities[n]
+                    n += 1
+                    next_level += [
+                      child for child in (node[LEFT], node[RIGHT]) if child]
+                # end for
+                level = next_level
+            # end while
+            return root
+        except Exception as err:
+            _z_exc("wl_overlap.py/IntervalIndex/_build", err)
+        # end try
+    # end method
+
+    def _erase(self, node, key):
+        """
+            Removes a node from a subtree.
+
+            Arguments:
+            - node -- the root of the subtree.
+            - key -- the (start, ID) of the node to remove.
+
+            Returns:  the new root of the subtree.
+           -------------------------------------------------------------
+        """
+        if node is None:
+            return None
+        # end if
+        node_key = (node[START], node[ITEM_ID])
+        if node_key == key:
+            return self._merge(node[LEFT], node[RIGHT])
+        elif key < node_key:
+            node[LEFT] = self._erase(node[LEFT], key)
+        else:
+            node[RIGHT] = self._erase(node[RIGHT], key)
+        # end if
+        _fix(node)
+        return node
+    # end method
+
+    def _insert(self, node, new):
+        """
+            Adds a node to a subtree.
+
+            Arguments:
+            - node -- the root of the subtree.
+            - new -- the node to add.
+
+            Returns:  the new root of the subtree.
+           -------------------------------------------------------------
+        """
+        if node is None:
+            return new
+        # end if
+        key = (new[START], new[ITEM_ID])
+        if new[PRIORITY] > node[PRIORITY]:
+            new[LEFT], new[RIGHT] = self._split(node, key)
+            _fix(new)
+            return new
+        elif key < (node[START], node[ITEM_ID]):
+            node[LEFT] = self._insert(node[LEFT], new)
+        else:
+            node[RIGHT] = self._insert(node[RIGHT], new)
+        # end if
+        _fix(node)
+        return node
+    # end method
+
+    def _merge(self, left, right):
+        """
+            Joins two subtrees, every key in the first being smaller.
+
+            Arguments:
+            - left, right -- the roots of the subtrees.
+
+            Returns:  the root of the joined subtree.
+           -------------------------------------------------------------
+        """
+        if left is None:
+            return right
+        elif right is None:
+            return left
+        elif left[PRIORITY] > right[PRIORITY]:
+            left[RIGHT] = self._merge(left[RIGHT], right)
+            _fix(left)
+            return left
+        else:
+            right[LEFT] = self._merge(left, right[LEFT])
+            _fix(right)
+            return right
+        # end if
+    # end method
+
+    def _split(self, node, key):
+        """
+            Splits a subtree at a key.
+
+            Arguments:
+            - node -- the root of the subtree.
+            - key -- the (start, ID) at which to split.
+
+            Returns:  the roots of the subtrees of smaller keys and of
+             larger keys.
+           -------------------------------------------------------------
+        """
+        if node is None:
+            return None, None
+        # end if
+        if (node[START], node[ITEM_ID]) < key:
+            node[RIGHT], right = self._split(node[RIGHT], key)
+            _fix(node)
+            return node, right
+        else:
+            left, node[LEFT] = self._split(node[LEFT], key)
+            _fix(node)
+            return left, node
+        # end if
+    # end method
+# end class
+
+
+def add_many(wl_obj, entry_list):
+    """
+        Adds many entries to the work log object's interval index at
+         once.
+
+        Nothing is done if the index has not been built.  This is used
+         for entries added in bulk, and for the entries of a newly
+         loaded shard.
+
+        Arguments:
+        - wl_obj -- the work log object.
+        - entry_list -- the entries.
+
+        Returns:  nothing.
+       -----------------------------------------------------------------
+    """
+    try:
+        if wl_obj.overlaps is not None:
+            wl_obj.overlaps.add_many(
+              (entry.id, *_interval(entry)) for entry in entry_list
+              if _interval(entry) and not wl_series.is_occurrance(entry))
+        # end if
+        return
+    except Exception as err:
+        _z_exc("wl_overlap.py/add_many", err)
+    # end try
+# end function
+
+
+def find_conflicts(wl_obj, entry, date_list=None):
+    """
+        Finds the tasks which overlap a new task or series.
+
+        Arguments:
+        - wl_obj -- the work log object.
+        - entry -- the new task (or the parent of the new series).
+
+        Keyword Arguments:
+        - date_list -- the other dates of the series (default None).
+
+        Returns:  a list of the overlapping entries, in date order.
+         Occurrances of rule-based series are included.
+       -----------------------------------------------------------------
+    """
+    try:
+        index = get_index(wl_obj)
+        # The times occupied by the task (and by the rest of its series).
+        length = entry.duration or datetime.timedelta(0)
+        if not length:
+            return []
+        # end if
+        time = entry.datetime.time()
+        spans = [(entry.datetime, entry.datetime + length)]
+        for date in date_list or []:
+            start = datetime.datetime.combine(date, time)
+            spans.append((start, start + length))
+        # end for
+        # Only the shards which may hold overlapping tasks are loaded
+        #  (which adds their entries to the index).
+        if isinstance(wl_obj.entries, wl_shard.ShardedEntryList):
+            wl_obj.entries.load_window(
+              min(span[0] for span in spans), max(span[1] for span in spans))
+        # end if
+        # Stored entries are found in the index.  Occurrances are
+        #  created for the whole span of the series, and put in an index
+        #  of their own.
+        conflict_ids = []
+        for start, end in spans:
+            conflict_ids += index.overlapping(start, end)
+        # end for
+        occ_dict = {}
+        for occ in wl_series.occurrances(
+          wl_obj, start=spans[0][0] - wl_series.longest(wl_obj),
+          end=spans[-1][1]):
+            if _interval(occ):
+                occ_dict[occ.id] = occ
+            # end if
+        # end for
+        occ_index = IntervalIndex(
+          (occ.id, *_interval(occ)) for occ in occ_dict.values())
+        if occ_index:
+            for start, end in spans:
+                conflict_ids += occ_index.overlapping(start, end)
+            # end for
+        # end if
+        # Each overlapping task is only listed once, and the new task
+        #  does not overlap itself.
+        conflict_list = []
+        for entry_id in set(conflict_ids) - {entry.id}:
+            if entry_id in occ_dict:
+                conflict_list.append(occ_dict[entry_id])
+            else:
+                conflict_list.append(
+                  wl_search.lookup_entry_by_id(wl_obj, entry_id))
+            # end if
+        # end for
+        conflict_list.sort(key=lambda ent: (ent.datetime, ent.title))
+        return conflict_list
+    except Exception as err:
+        _z_exc("wl_overlap.py/find_conflicts", err)
+    # end try
+# end function
+
+
+def get_index(wl_obj):
+    """
+        Gets the work log object's interval index.
+
+        The index is built from the log's entries the first time it is
+         needed.  The rows of a lazy log are not decoded, and the
+         shards of a sharded log are not loaded; a sharded log's index
+         holds the shards loaded so far, and gets the others as they
+         are loaded.
+
+        Arguments:
+        - wl_obj -- the work log object.
+
+        Returns:  the interval index.
+       -----------------------------------------------------------------
+    """
+    try:
+        if wl_obj.overlaps is None:
+            if isinstance(wl_obj.entries, wl_lazylog.LazyEntryList):
+                interval_list = wl_obj.entries.intervals()
+            else:
+                entry_list = wl_obj.entries
+                if isinstance(entry_list, wl_shard.ShardedEntryList):
+                    entry_list = entry_list.loaded()
+                    wl_obj.entries.on_load = functools.partial(
+                      add_many, wl_obj)
+                # end if
+                interval_list = [
+                  (entry.id, *_interval(entry)) for entry in entry_list
+                  if _interval(entry)]
+            # end if
+            wl_obj.overlaps = IntervalIndex(interval_list)
+        # end if
+        return wl_obj.overlaps
+    except Exception as err:
+        _z_exc("wl_overlap.py/get_index", err)
+    # end try
+# end function
+
+
+def remove(wl_obj, entry):
+    """
+        Removes an entry from the work log object's interval index.
+
+        Nothing is done if the index has not been built.
+
+        Arguments:
+        - wl_obj -- the work log object.
+        - entry -- the entry.
+
+        Returns:  nothing.
+       -----------------------------------------------------------------
+    """
+    try:
+        if wl_obj.overlaps is not None:
+            wl_obj.overlaps.remove(entry.id)
+        # end if
+        return
+    except Exception as err:
+        _z_exc("wl_overlap.py/remove", err)
+    # end try
+# end function
+
+
+def update(wl_obj, entry):
+    """
+        Adds or updates an entry in the work log object's interval index.
+
+        Nothing is done if the index has not been built.  Entries with no
+         duration do not occupy any time, and are left out.
+
+        Arguments:
+        - wl_obj -- the work log object.
+        - entry -- the entry.
+
+        Returns:  nothing.
+       -----------------------------------------------------------------
+    """
+    try:
+        if wl_obj.overlaps is None or wl_series.is_occurrance(entry):
+            return
+        # end if
+        interval = _interval(entry)
+        if interval:
+            wl_obj.overlaps.add(entry.id, *interval)
+        else:
+            wl_obj.overlaps.remove(entry.id)
+        # end if
+        return
+    except Exception as err:
+        _z_exc("wl_overlap.py/update", err)
+    # end try
+# end function
+
+
+def warn(wl_obj, entry, date_list=None):
+    """
+        Warns the user if a new task or series overlaps other tasks.
+
+        Arguments:
+        - wl_obj -- the work log object.
+        - entry -- the new task (or the parent of the new series).
+
+        Keyword Arguments:
+        - date_list -- the other dates of the series (default None).
+
+        Returns:  the number of overlapping tasks.
+       -----------------------------------------------------------------
+    """
+    try:
+        conflict_list = find_conflicts(wl_obj, entry, date_list=date_list)
+        if not conflict_list:
+            return 0
+        # end if
+        if date_list:
+            msg = "This series overlaps "
+        else:
+            msg = "This task overlaps "
+        # end if
+        if len(conflict_list) == 1:
+            msg += "1 other task:  "
+        else:
+            msg += f"{len(conflict_list)} other tasks:  "
+        # end if
+        msg += "; ".join(
+          f"{ent.title} (" +
+          f"{wl_resource.format_string(wl_obj, ent.datetime, short=True)})"
+          for ent in conflict_list[:MAX_LISTED])
+        if len(conflict_list) > MAX_LISTED:
+            msg += f"; and {len(conflict_list) - MAX_LISTED} more"
+        # end if
+        io_utils.print_status(
+          "Warning", msg + ".", go=True, line_length=wl_obj.line_length)
+        return len(conflict_list)
+    except Exception as err:
+        _z_exc("wl_overlap.py/warn", err)
+    # end try
+# end function
+
+
+def _fix(node):
+    """
+        Updates the latest end held by an index node.
+
+        Arguments:
+        - node -- the node, whose children are up to date.
+
+        Returns:  nothing.
+       -----------------------------------------------------------------
+    """
+    latest = node[END]
+    for child in (node[LEFT], node[RIGHT]):
+        if child is not None and child[LATEST] > latest:
+            latest = child[LATEST]
+        # end if
+    # end for
+    node[LATEST] = latest
+    return
+# end function
+
+
+def _interval(entry):
+    """
+        Gets the interval occupied by a task.
+
+        Arguments:
+        - entry -- the log entry.
+
+        Returns:  a tuple of the start and end of the interval, or None
+         if the task has no datetime or duration.
+       -----------------------------------------------------------------
+    """
+    try:
+        if not entry.datetime or not entry.duration:
+            return None
+        # end if
+        return entry.datetime, entry.datetime + entry.duration
+    except Exception as err:
+        _z_exc("wl_overlap.py/_interval", err)
+    # end try
+# end function
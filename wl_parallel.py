@@ -0,0 +1,299 @@
+"""
+    Contains functions to read a large work log file in parallel.
+
+    The file is mapped rather than read, and split into chunks at row
+     boundaries (newlines which are not inside quoted fields), found in
+     a single pass over the file.  Each chunk is decoded into log entry
+     objects by a separate process.  Each process also returns its
+     entries' sort index tuples, already sorted, and the sorted runs are
+     merged once all of the chunks have been decoded.
+
+    Public Functions:
+    - read_log -- reads and decodes a log file in parallel.
+    - use_parallel -- checks whether a log file should be read in
+       parallel.
+
+    Private Functions:
+    - _chunk_bounds -- finds the row boundaries at which to split a
+       file.
+    - _decode_chunk -- decodes the rows in one chunk of a file (run in
+       a worker process).
+    - _row_end -- finds the end of the row containing an offset.
+    - _z_exc -- generic exception handler.
+   ---------------------------------------------------------------------
+"""
+
+
+# Import sys.
+import sys
+
+
+def _z_exc(loc, err):
+    """
+        Catch-all exception handler.
+
+        Arguments:
+        - loc -- string naming the module/function/method in which the
+           exception occurred.
+        - err -- the exception string.
+
+        Returns:  nothing (exits program).
+       -----------------------------------------------------------------
+    """
+    # Print error information.
+    print("An interal error occurred in " + loc + ": ", err)
+    # Exit.
+    sys.exit(
+      "Please report the above error and the circumstances which caused it " +
+      "to the developer.")
+    return  # Superfluous return.
+# end function
+
+
+# Other imports.
+try:
+    import concurrent.futures
+    import csv
+    import heapq
+    import io
+    import locale
+    import mmap
+    import os
+
+    import io_utils
+    import logentry
+except Exception as err:
+    _z_exc("wl_parallel.py/module imports", err)
+# end try
+
+
+# Constants.
+# Files smaller than this are read faster by a single process.
+MIN_BYTES = 4 * 1024 * 1024
+# Each worker gets this many chunks, so that uneven chunks balance out.
+CHUNKS_PER_WORKER = 4
+
+
+def read_log(fname, workers=None, line_length=80):
+    """
+        Reads and decodes a log file in parallel.
+
+        Arguments:
+        - fname -- the name of the log file.
+
+        Keyword Arguments:
+        - workers -- the number of worker processes (default is the
+           number of CPUs).
+        - line_length -- the width of the screen in characters (default
+           80).
+
+        Returns:  a tuple containing the dictionary holding the work
+         log's info, the list of entries (in file order), the title and
+         date sort indexes (both sorted), and the number of rows which
+         could not be decoded; or None if the file could not be read.
+       -----------------------------------------------------------------
+    """
+    try:
+        encoding = locale.getpreferredencoding(False)
+        try:
+            file = open(fname, "rb")
+        except OSError as err:
+            io_utils.print_status(
+              "Error", f"An error occured while reading the file:  {err}",
+              line_length=line_length)
+            return None
+        # end try
+        # The parent process only needs to find the row boundaries, so
+        #  the file is mapped rather than read into memory.
+        with file:
+            try:
+                data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                return None
+            # end try
+            with data:
+                # The first row holds the field names, and the second the
+                #  work log's info.  The parent process reads both.
+                names_end = _row_end(data, 0, 0)
+                info_end = _row_end(data, names_end, names_end)
+                head = list(csv.reader(
+                  io.StringIO(data[:info_end].decode(encoding), newline="")))
+                if len(head) < 2:
+                    return None
+                # end if
+                fieldnames, info = head[0], dict(zip(head[0], head[1]))
+                # Split the rest of the file into chunks.
+                workers = workers or os.cpu_count() or 1
+                bounds = _chunk_bounds(
+                  data, info_end, workers * CHUNKS_PER_WORKER)
+            # end with
+        # end with
+        entries = []
+        title_runs = []
+        date_runs = []
+        failed = 0
+        with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+            jobs = [
+              pool.submit(
+                _decode_chunk, fname, start, end, fieldnames, encoding)
+              for start, end in bounds]
+            # Collect the results in file order.
+            for job in jobs:
+                chunk_entries, chunk_failed, title_run, date_run = (
+                  job.result())
+                entries.extend(chunk_entries)
+                failed += chunk_failed
+                title_runs.append(title_run)
+                date_runs.append(date_run)
+            # end for
+        # end with
+        # Merge the sorted runs.
+        title_sort = list(heapq.merge(*title_runs))
+        date_sort = list(heapq.merge(*date_runs))
+        return info, entries, title_sort, date_sort, failed
+    except Exception as err:
+        _z_exc("wl_parallel.py/read_log", err)
+    # end try
+# end function
+
+
+def use_parallel(fname):
+    """
+        Checks whether a log file should be read in parallel.
+
+        Arguments:
+        - fname -- the name of the log file.
+
+        Returns:  True if the file is large enough and there is more
+         than one CPU, else False.  A compressed file can't be split
+         into chunks, so it is always read by a single process.
+       -----------------------------------------------------------------
+    """
+    try:
+        if (os.cpu_count() or 1) < 2 or io_utils.is_compressed(fname):
+            return False
+        # end if
+        try:
+            return os.path.getsize(fname) >= MIN_BYTES
+        except OSError:
+            return False
+        # end try
+    except Exception as err:
+        _z_exc("wl_parallel.py/use_parallel", err)
+    # end try
+# end function
+
+
+def _chunk_bounds(data, start, chunks):
+    """
+        Finds the row boundaries at which to split a file.
+
+        Arguments:
+        - data -- the contents of the file (bytes, or a memory map).
+        - start -- the offset of the first row to include.
+        - chunks -- the number of chunks wanted.
+
+        Returns:  a list of (start, end) tuples; there may be fewer than
+         the number of chunks wanted, but none are empty.
+       -----------------------------------------------------------------
+    """
+    try:
+        bounds = []
+        size = max((len(data) - start) // chunks, 1)
+        while start < len(data):
+            end = _row_end(data, start, min(start + size, len(data)) - 1)
+            bounds.append((start, end))
+            start = end
+        # end while
+        return bounds
+    except Exception as err:
+        _z_exc("wl_parallel.py/_chunk_bounds", err)
+    # end try
+# end function
+
+
+def _decode_chunk(fname, start, end, fieldnames, encoding):
+    """
+        Decodes the rows in one chunk of a file.
+
+        Runs in a worker process.  The chunk is read from the file,
+         rather than passed from the parent process, to save copying it.
+
+        Arguments:
+        - fname -- the name of the log file.
+        - start -- the offset of the start of the chunk.
+        - end -- the offset of the end of the chunk.
+        - fieldnames -- the field names read from the first row.
+        - encoding -- the encoding of the file.
+
+        Returns:  a tuple containing the decoded entries, the number of
+         rows which could not be decoded, and the title and date sort
+         index tuples for the entries (both sorted).
+       -----------------------------------------------------------------
+    """
+    try:
+        with open(fname, "rb") as file:
+            file.seek(start)
+            text = file.read(end - start).decode(encoding)
+        # end with
+        entries = []
+        failed = 0
+        title_run = []
+        date_run = []
+        reader = csv.DictReader(
+          io.StringIO(text, newline=""), fieldnames=fieldnames)
+        for row in reader:
+            entry = logentry.LogEntry()
+            if entry.from_dict(row):
+                entries.append(entry)
+                title_run.append((entry.title, entry.datetime, entry.id))
+                date_run.append((entry.datetime, entry.title, entry.id))
+            else:
+                failed += 1
+            # end if
+        # end for
+        title_run.sort()
+        date_run.sort()
+        return entries, failed, title_run, date_run
+    except Exception as err:
+        _z_exc("wl_parallel.py/_decode_chunk", err)
+    # end try
+# end function
+
+
+def _row_end(data, start, pos):
+    """
+        Finds the end of the row containing an offset.
+
+        A newline only ends a row if there are an even number of quote
+         marks before it in the file.  There are an even number before
+         the start of any row, so only the quote marks from the start of
+         an earlier row need to be counted.
+
+        Arguments:
+        - data -- the contents of the file (bytes, or a memory map).
+        - start -- the offset of the start of a row at or before pos.
+        - pos -- the offset.
+
+        Returns:  the offset just past the newline which ends the row,
+         or the length of the data if the row is the last.
+       -----------------------------------------------------------------
+    """
+    try:
+        # A memory map has no count method, so slices are counted.
+        quotes = data[start:pos].count(b'"')
+        while True:
+            nl = data.find(b"\n", pos)
+            if nl == -1:
+                return len(data)
+            # end if
+            quotes += data[pos:nl].count(b'"')
+            pos = nl + 1
+            if quotes % 2 == 0:
+                return pos
+            # end if
+        # end while
+    except Exception as err:
+        _z_exc("wl_parallel.py/_row_end", err)
+    # end try
+# end function
@@ -0,0 +1,199 @@
+"""
+    Contains a class to share the strings held by log entries.
+
+    Many entries share the same title and notes; every occurrance of a
+     recurring series, for example, and the many rows of a log kept from
+     a few routine tasks.  Reading a file creates a new string for every
+     value in every row, however.  The work log object's strings
+     attribute holds a pool of the titles and notes of its entries, and
+     each entry is given the pooled copy of its strings when it is read
+     or added, so that only one copy of each string is kept.  Comparing
+     shared strings is also quicker, since a string is always equal to
+     itself; this speeds up sorting the title index.
+
+    Class Definitions:
+    - StringPool -- a pool of shared strings.
+
+    Private Functions:
+    - _z_exc -- generic exception handler.
+   ---------------------------------------------------------------------
+"""
+
+
+# Import sys.
+import sys
+
+
+def _z_exc(loc, err):
+    """
+        Catch-all exception handler.
+
+        Arguments:
+        - loc -- string naming the module/function/method in which the
+           exception occurred.
+        - err -- the exception string.
+
+        Returns:  nothing (exits program).
+       -----------------------------------------------------------------
+    """
+    # Print error information.
+    print("An interal error occurred in " + loc + ": ", err)
+    # Exit.
+    sys.exit(
+      "Please report the above error and the circumstances which caused it " +
+      "to the developer.")
+    return  # Superfluous return.
+# end function
+
+
+# Constants.
+# The attributes of a log entry which are pooled.
+POOLED_ATTRS = ("title", "notes")
+# The positions of the title in the title and date sort index tuples.
+TITLE_KEY = (0, 1)
+
+
+class StringPool:
+    """
+        A pool of shared strings.
+
+        Attributes:
+        - shared -- the number of strings which have been replaced by
+           pooled copies.
+        - saved -- the number of bytes taken by the strings which were
+           replaced.
+
+        Public Methods:
+        - intern -- returns the pooled copy of a string.
+        - intern_entry -- replaces a log entry's strings with their
+           pooled copies.
+        - intern_sorts -- replaces the titles in a pair of sort indexes
+           with their pooled copies.
+        - stats -- returns the pool's statistics.
+
+        Magic Methods:
+        - __init__ -- creates an empty pool.
+        - __len__ -- returns the number of strings in the pool.
+       -----------------------------------------------------------------
+    """
+
+    def __init__(self):
+        """
+            Returns an empty pool.
+           -------------------------------------------------------------
+        """
+        self.shared = 0
+        self.saved = 0
+        self._strings = {}
+    # end method
+
+    def __len__(self):
+        """Returns the number of strings in the pool."""
+        return len(self._strings)
+    # end method
+
+    def intern(self, string):
+        """
+            Returns the pooled copy of a string.
+
+            The string is added to the pool if there is no copy of it.
+
+            Arguments:
+            - string -- the string.  Empty strings, and values which are
+               not strings, are returned as they are.
+
+            Returns:  the pooled copy of the string.
+           -------------------------------------------------------------
+        """
+        try:
+            if not string or type(string) != str:
+                return string
+            # end if
+            pooled = self._strings.setdefault(string, string)
+            if pooled is not string:
+                self.shared += 1
+                self.saved += sys.getsizeof(string)
+            # end if
+            return pooled
+        except Exception as err:
+            _z_exc("wl_pool.py/StringPool/intern", err)
+        # end try
+    # end method
+
+    def intern_entry(self, entry):
+        """
+            Replaces a log entry's title and notes with their pooled
+             copies.
+
+            Arguments:
+            - entry -- the log entry.
+
+            Returns:  the entry.
+           -------------------------------------------------------------
+        """
+        try:
+            for attr in POOLED_ATTRS:
+                setattr(entry, attr, self.intern(getattr(entry, attr)))
+            # end for
+            return entry
+        except Exception as err:
+            _z_exc("wl_pool.py/StringPool/intern_entry", err)
+        # end try
+    # end method
+
+    def intern_sorts(self, sorts):
+        """
+            Replaces the titles in a pair of sort indexes with their
+             pooled copies.
+
+            Needed when the index tuples were not built from pooled
+             entries (as when a file is decoded by several processes).
+             The titles are not counted in the statistics, as they are
+             normally the same strings as the entries' titles.
+
+            Arguments:
+            - sorts -- the title and date sort indexes.  The indexes are
+               changed in place, and stay in order.
+
+            Returns:  nothing.
+           -------------------------------------------------------------
+        """
+        try:
+            for sort_list, key in zip(sorts, TITLE_KEY):
+                for ndx, item in enumerate(sort_list):
+                    title = self._strings.setdefault(item[key], item[key])
+                    if title is not item[key]:
+                        sort_list[ndx] = (
+                          item[:key] + (title,) + item[key + 1:])
+                    # end if
+                # end for
+            # end for
+            return
+        except Exception as err:
+            _z_exc("wl_pool.py/StringPool/intern_sorts", err)
+        # end try
+    # end method
+
+    def stats(self):
+        """
+            Returns the pool's statistics.
+
+            Arguments:  none.
+
+            Returns:  a dictionary of the number of distinct strings in
+             the pool ("strings"), the number of strings replaced by
+             pooled copies ("shared"), and the number of bytes those
+             strings took ("saved").  The memory is only freed once
+             nothing else refers to the replaced strings.
+           -------------------------------------------------------------
+        """
+        try:
+            return {
+              "strings": len(self._strings), "shared": self.shared,
+              "saved": self.saved}
+        except Exception as err:
+            _z_exc("wl_pool.py/StringPool/stats", err)
+        # end try
+    # end method
+
+# end class
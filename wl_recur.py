@@ -0,0 +1,646 @@
+"""
+    Contains a generator which calculates the dates on which a recurring
+     task falls.
+
+    The dates are calculated directly from the recurrance rule (the
+     rec_interval attribute of a log entry), rather than by testing each
+     day or month in turn:  daily and weekly dates are a fixed number of
+     days apart, and the dates in each month are looked up in the
+     month's calendar (wl_datetime.month_table).
+
+    The recurrance rule is governed by five flags:
+    * unit:  This is the base unit; daily, weekly, or monthly.
+    * skip:  This denotes how often to skip the base unit.  For example,
+       if a task is flagged to recur on Tuesdays, a value of [2] for
+       skip would change the recurrance to every other Tuesday.
+    * days:  Only relevant if unit is weekly or monthly.  Day(s) of the
+       week for the task to recur.  Can be from [1] (Sunday) to [7]
+       (Saturday).
+    * ordinal:  Only relevant if unit is monthly and days of the week
+       are specified; indicates on which weekdays the task should recur.
+       For example, if days is Tuesday, [1, 3] for ordinal indicates the
+       first and third Tuesdays of each month.
+    * dates:  Only relevant if unit is monthly; denotes days of the
+       month that the task should recur.  Can be from [1] to [31] for
+       absolute dates, and from [-1] to [-31] for dates relative to the
+       end of the month; dates before the first day or after the last
+       day of any particular month are ignored.
+
+    Rules are compiled (their defaults filled in, and the offsets of
+     weekly rules worked out) once, and the compiled rules are cached,
+     so that expanding the same rule again does not repeat the work.
+
+    If NumPy is installed, rules can also be expanded all at once into
+     arrays of numpy.datetime64 dates, which is much faster when many
+     long series are expanded together.
+
+    Public Functions:
+    - compile_rule -- gets the compiled form of a recurrance rule.
+    - count -- calculates the number of dates produced by a recurrance
+       rule up to an end date.
+    - date_array -- calculates all of the dates produced by a recurrance
+       rule up to an end date, as an array if NumPy is installed.
+    - date_list -- converts the result of date_array to a list of
+       dates.
+    - expand_many -- calculates the dates produced by several
+       recurrance rules.
+    - occurrances -- generates the dates produced by a recurrance rule.
+    - page -- calculates a run of the dates produced by a recurrance
+       rule, without calculating the dates before it.
+
+    Private Functions:
+    - _array_monthly -- calculates the dates of a monthly rule as an
+       array.
+    - _compile -- compiles (and caches) a recurrance rule.
+    - _daily -- generates the dates of a daily rule.
+    - _month_days -- generates the days on which a monthly rule falls
+       in each month.
+    - _monthly -- generates the dates of a monthly rule.
+    - _week_offsets -- finds the offsets from the start of a weekly
+       rule's first dates.
+    - _weekly -- generates the dates of a weekly rule.
+    - _z_exc -- generic exception handler.
+   ---------------------------------------------------------------------
+"""
+
+
+# Import sys.
+import sys
+
+
+def _z_exc(loc, err):
+    """
+        Catch-all exception handler.
+
+        Arguments:
+        - loc -- string naming the module/function/method in which the
+           exception occurred.
+        - err -- the exception string.
+
+        Returns:  nothing (exits program).
+       -----------------------------------------------------------------
+    """
+    # Print error information.
+    print("An interal error occurred in " + loc + ": ", err)
+    # Exit.
+    sys.exit(
+      "Please report the above error and the circumstances which caused it " +
+      "to the developer.")
+    return  # Superfluous return.
+# end function
+
+
+# Other imports.
+try:
+    import datetime
+    import functools
+    import itertools
+
+    import wl_datetime
+except Exception as err:
+    _z_exc("wl_recur.py/module imports", err)
+# end try
+# NumPy is optional.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+# end try
+
+
+# Constants.
+DAILY = 1
+WEEKLY = 2
+MONTHLY = 3
+# The number of compiled rules which are cached.
+RULE_CACHE_SIZE = 1024
+
+
+def compile_rule(start, rec_interval):
+    """
+        Gets the compiled form of a recurrance rule.
+
+        Arguments:
+        - start -- the date of the first task in the series.
+        - rec_interval -- the recurrance rule.
+
+        Returns:  a tuple of the unit, the skip, the offsets from the
+         start of a weekly rule's first dates, and the dates, days and
+         ordinal of a monthly rule, with the defaults filled in.
+       -----------------------------------------------------------------
+    """
+    try:
+        return _compile(
+          start, rec_interval["unit"], rec_interval.get("skip") or 1,
+          tuple(rec_interval.get("days") or ()),
+          tuple(rec_interval.get("ordinal") or ()),
+          tuple(rec_interval.get("dates") or ()))
+    except Exception as err:
+        _z_exc("wl_recur.py/compile_rule", err)
+    # end try
+# end function
+
+
+def count(start, rec_interval, end):
+    """
+        Calculates the number of dates produced by a recurrance rule.
+
+        Daily and weekly rules are counted arithmetically; monthly rules
+         are counted month by month, without creating any dates.
+
+        Arguments:
+        - start -- the date of the first task in the series (which is
+           not counted).
+        - rec_interval -- the recurrance rule.
+        - end -- the last date on which the task can recur.
+
+        Returns:  the number of dates.
+       -----------------------------------------------------------------
+    """
+    try:
+        unit, skip, offsets, dates, days, ordinal = compile_rule(
+          start, rec_interval)
+        span = (end - start).days
+        if unit == DAILY:
+            return max(span, 0) // skip
+        elif unit == WEEKLY:
+            return sum(
+              (span - offset) // (7 * skip) + 1
+              for offset in offsets if offset <= span)
+        else:
+            total = 0
+            for year, month, month_days in _month_days(
+              start, skip, dates, days, ordinal):
+                if (year, month) < (end.year, end.month):
+                    total += len(month_days)
+                else:
+                    if (year, month) == (end.year, end.month):
+                        total += sum(1 for day in month_days if day <= end.day)
+                    # end if
+                    return total
+                # end if
+            # end for
+            return total
+        # end if
+    except Exception as err:
+        _z_exc("wl_recur.py/count", err)
+    # end try
+# end function
+
+
+def date_array(start, rec_interval, end):
+    """
+        Calculates all of the dates produced by a recurrance rule.
+
+        Arguments:
+        - start -- the date of the first task in the series (which is
+           not included).
+        - rec_interval -- the recurrance rule.
+        - end -- the last date on which the task can recur.
+
+        Returns:  a sorted array of numpy.datetime64 dates if NumPy is
+         installed, else a list of dates.
+       -----------------------------------------------------------------
+    """
+    try:
+        if numpy is None:
+            return list(occurrances(start, rec_interval, end=end))
+        # end if
+        unit, skip, offsets, dates, days, ordinal = compile_rule(
+          start, rec_interval)
+        first = numpy.datetime64(start, "D")
+        last = numpy.datetime64(end, "D")
+        if unit == DAILY:
+            return numpy.arange(first + skip, last + 1, skip)
+        elif unit == WEEKLY:
+            # Each of the days repeats at the same interval.
+            return numpy.sort(numpy.concatenate([
+              numpy.arange(first + offset, last + 1, 7 * skip)
+              for offset in offsets]))
+        else:
+            return _array_monthly(start, end, skip, dates, days, ordinal)
+        # end if
+    except Exception as err:
+        _z_exc("wl_recur.py/date_array", err)
+    # end try
+# end function
+
+
+def date_list(dates):
+    """
+        Converts the result of date_array to a list of dates.
+
+        Arguments:
+        - dates -- an array or list of dates.
+
+        Returns:  a list of datetime.date objects.
+       -----------------------------------------------------------------
+    """
+    try:
+        if numpy is not None and isinstance(dates, numpy.ndarray):
+            return dates.tolist()
+        # end if
+        return list(dates)
+    except Exception as err:
+        _z_exc("wl_recur.py/date_list", err)
+    # end try
+# end function
+
+
+def expand_many(rules):
+    """
+        Calculates the dates produced by several recurrance rules.
+
+        Arguments:
+        - rules -- a list of (start, rec_interval, end) tuples.
+
+        Returns:  a list containing the result of date_array for each
+         rule.
+       -----------------------------------------------------------------
+    """
+    try:
+        return [date_array(start, rule, end) for start, rule, end in rules]
+    except Exception as err:
+        _z_exc("wl_recur.py/expand_many", err)
+    # end try
+# end function
+
+
+def occurrances(start, rec_interval, end=None, count=None):
+    """
+        Generates the dates produced by a recurrance rule.
+
+        Arguments:
+        - start -- the date of the first task in the series (which is
+           not itself generated).
+        - rec_interval -- the recurrance rule.
+
+        Keyword Arguments:
+        - end -- the last date on which the task can recur (default
+           None).
+        - count -- the largest number of dates to generate (default
+           None).  If neither end nor count is given, the generator
+           does not stop.
+
+        Returns:  a generator of dates, in order.
+       -----------------------------------------------------------------
+    """
+    try:
+        unit, skip, offsets, dates, days, ordinal = compile_rule(
+          start, rec_interval)
+        if unit == DAILY:
+            date_iter = _daily(start, skip)
+        elif unit == WEEKLY:
+            date_iter = _weekly(start, skip, offsets)
+        else:
+            date_iter = _monthly(start, skip, dates, days, ordinal)
+        # end if
+        if count is not None:
+            date_iter = itertools.islice(date_iter, count)
+        # end if
+        for date in date_iter:
+            if end is not None and date > end:
+                return
+            # end if
+            yield date
+        # end for
+    except Exception as err:
+        _z_exc("wl_recur.py/occurrances", err)
+    # end try
+# end function
+
+
+def page(start, rec_interval, index, size, end):
+    """
+        Calculates a run of the dates produced by a recurrance rule.
+
+        The dates before the run are not calculated:  daily and weekly
+         dates are found arithmetically, and monthly rules skip whole
+         months at a time.
+
+        Arguments:
+        - start -- the date of the first task in the series (which is
+           not included).
+        - rec_interval -- the recurrance rule.
+        - index -- the position of the first date of the run (the first
+           date produced by the rule is 0).
+        - size -- the largest number of dates in the run.
+        - end -- the last date on which the task can recur.
+
+        Returns:  a list of dates, in order.
+       -----------------------------------------------------------------
+    """
+    try:
+        unit, skip, offsets, dates, days, ordinal = compile_rule(
+          start, rec_interval)
+        if unit in [DAILY, WEEKLY]:
+            stop = min(index + size, count(start, rec_interval, end))
+        # end if
+        if unit == DAILY:
+            return [
+              start + datetime.timedelta(days=skip * (n + 1))
+              for n in range(index, stop)]
+        elif unit == WEEKLY:
+            return [
+              start + datetime.timedelta(
+                days=offsets[n % len(offsets)] +
+                n // len(offsets) * 7 * skip)
+              for n in range(index, stop)]
+        # end if
+        page_list = []
+        n = 0
+        for year, month, month_days in _month_days(
+          start, skip, dates, days, ordinal):
+            if (year, month) > (end.year, end.month):
+                return page_list
+            # end if
+            # Skip whole months until the run starts.
+            if n + len(month_days) <= index:
+                n += len(month_days)
+                continue
+            # end if
+            for day in month_days:
+                if n >= index:
+                    date = datetime.date(year, month, day)
+                    if date > end:
+                        return page_list
+                    # end if
+                    page_list.append(date)
+                    if len(page_list) == size:
+                        return page_list
+                    # end if
+                # end if
+                n += 1
+            # end for
+        # end for
+        return page_list
+    except Exception as err:
+        _z_exc("wl_recur.py/page", err)
+    # end try
+# end function
+
+
+def _array_monthly(start, end, skip, dates, days, ordinal):
+    """
+        Calculates the dates of a monthly rule as an array.
+
+        Arguments:
+        - start -- the date of the first task in the series.
+        - end -- the last date on which the task can recur.
+        - skip -- the number of months between the months in which the
+           task recurs.
+        - dates -- days of the month on which the task recurs, or None.
+        - days -- days of the week (Sunday-based) on which the task
+           recurs, or None.
+        - ordinal -- which of those weekdays in the month the task
+           recurs on.
+
+        Returns:  a sorted array of numpy.datetime64 dates.
+       -----------------------------------------------------------------
+    """
+    try:
+        months = numpy.arange(
+          numpy.datetime64(start, "M"), numpy.datetime64(end, "M") + 1, skip)
+        firsts = months.astype("datetime64[D]")
+        lengths = ((months + 1).astype("datetime64[D]") - firsts).astype(int)
+        parts = []
+        if days:
+            # The Monday-based weekday on which each month starts (the
+            #  first day of 1970 was a Thursday).
+            first_days = (firsts.astype("int64") + 3) % 7
+            for day in days:
+                for ordl in ordinal:
+                    offsets = (
+                      ((day - 2) % 7 - first_days) % 7 + (ordl - 1) * 7)
+                    valid = offsets < lengths
+                    parts.append(firsts[valid] + offsets[valid])
+                # end for
+            # end for
+        else:
+            for date in dates:
+                # Negative dates count back from the end of the month
+                #  (-1 is the last day).
+                if date > 0:
+                    offsets = numpy.full_like(lengths, date - 1)
+                else:
+                    offsets = lengths + date
+                # end if
+                valid = (offsets >= 0) & (offsets < lengths)
+                parts.append(firsts[valid] + offsets[valid])
+            # end for
+        # end if
+        result = numpy.unique(numpy.concatenate(parts))
+        return result[
+          (result > numpy.datetime64(start, "D")) &
+          (result <= numpy.datetime64(end, "D"))]
+    except Exception as err:
+        _z_exc("wl_recur.py/_array_monthly", err)
+    # end try
+# end function
+
+
+@functools.lru_cache(maxsize=RULE_CACHE_SIZE)
+def _compile(start, unit, skip, days, ordinal, dates):
+    """
+        Compiles a recurrance rule.
+
+        Arguments:
+        - start -- the date of the first task in the series.
+        - unit, skip, days, ordinal, dates -- the rule, with lists
+           converted to tuples.
+
+        Returns:  the compiled rule (see compile_rule).
+       -----------------------------------------------------------------
+    """
+    try:
+        offsets = ()
+        if unit == WEEKLY:
+            # The default is the weekday of the original task.
+            days = days or ((start.weekday() + 1) % 7 + 1,)
+            offsets = tuple(_week_offsets(start, skip, days))
+        elif unit == MONTHLY:
+            # The default is the date of the original task.
+            if not dates and not days:
+                dates = (start.day,)
+            # end if
+            ordinal = ordinal or (1,)
+        # end if
+        return unit, skip, offsets, dates, days, ordinal
+    except Exception as err:
+        _z_exc("wl_recur.py/_compile", err)
+    # end try
+# end function
+
+
+def _daily(start, skip):
+    """
+        Generates the dates of a daily rule.
+
+        Arguments:
+        - start -- the date of the first task in the series.
+        - skip -- the number of days between dates.
+
+        Returns:  a generator of dates.
+       -----------------------------------------------------------------
+    """
+    try:
+        interval = datetime.timedelta(days=skip)
+        date = start + interval
+        while True:
+            yield date
+            date += interval
+        # end while
+    except OverflowError:
+        return
+    except Exception as err:
+        _z_exc("wl_recur.py/_daily", err)
+    # end try
+# end function
+
+
+def _month_days(start, skip, dates, days, ordinal):
+    """
+        Generates the days on which a monthly rule falls in each month.
+
+        Arguments:
+        - start -- the date of the first task in the series.
+        - skip -- the number of months between the months in which the
+           task recurs.
+        - dates -- days of the month on which the task recurs, or None.
+        - days -- days of the week (Sunday-based) on which the task
+           recurs, or None.
+        - ordinal -- which of those weekdays in the month the task
+           recurs on.
+
+        Returns:  a generator of tuples of the year, the month, and a
+         sorted list of the days in the month (after the date of the
+         first task).
+       -----------------------------------------------------------------
+    """
+    try:
+        year = start.year
+        month = start.month
+        while True:
+            length, _, weekday_dates = wl_datetime.month_table(month, year)
+            if days:
+                month_dates = {
+                  weekday_dates[day][ordl - 1] for day in days
+                  for ordl in ordinal if 0 < ordl <= len(weekday_dates[day])}
+            else:
+                # Negative dates count back from the end of the month
+                #  (-1 is the last day).
+                month_dates = {
+                  date if date > 0 else length + date + 1 for date in dates}
+            # end if
+            month_days = [
+              day for day in sorted(month_dates) if 0 < day <= length]
+            if (year, month) == (start.year, start.month):
+                month_days = [day for day in month_days if day > start.day]
+            # end if
+            yield year, month, month_days
+            # Move on by the number of months to skip.
+            month += skip
+            year += (month - 1) // 12
+            month = (month - 1) % 12 + 1
+            if year > datetime.MAXYEAR:
+                return
+            # end if
+        # end while
+    except Exception as err:
+        _z_exc("wl_recur.py/_month_days", err)
+    # end try
+# end function
+
+
+def _monthly(start, skip, dates, days, ordinal):
+    """
+        Generates the dates of a monthly rule.
+
+        Arguments:
+        - start -- the date of the first task in the series.
+        - skip -- the number of months between the months in which the
+           task recurs.
+        - dates -- days of the month on which the task recurs, or None.
+        - days -- days of the week (Sunday-based) on which the task
+           recurs, or None.
+        - ordinal -- which of those weekdays in the month the task
+           recurs on.
+
+        Returns:  a generator of dates.
+       -----------------------------------------------------------------
+    """
+    try:
+        for year, month, month_days in _month_days(
+          start, skip, dates, days, ordinal):
+            for day in month_days:
+                yield datetime.date(year, month, day)
+            # end for
+        # end for
+    except Exception as err:
+        _z_exc("wl_recur.py/_monthly", err)
+    # end try
+# end function
+
+
+def _week_offsets(start, skip, days):
+    """
+        Finds the offsets from the start of a weekly rule's first dates.
+
+        A day later in the week than the original task falls in the
+         same week; a day earlier in the week, or the same day, falls in
+         the next week that the task recurs.
+
+        Arguments:
+        - start -- the date of the first task in the series.
+        - skip -- the number of weeks between the weeks in which the
+           task recurs.
+        - days -- days of the week (Sunday-based) on which the task
+           recurs.
+
+        Returns:  a sorted list of numbers of days.
+       -----------------------------------------------------------------
+    """
+    try:
+        interval = 7 * skip
+        start_day = (start.weekday() + 1) % 7 + 1
+        return sorted({
+          day - start_day if day > start_day else
+          day - start_day + interval for day in days})
+    except Exception as err:
+        _z_exc("wl_recur.py/_week_offsets", err)
+    # end try
+# end function
+
+
+def _weekly(start, skip, offsets):
+    """
+        Generates the dates of a weekly rule.
+
+        Arguments:
+        - start -- the date of the first task in the series.
+        - skip -- the number of weeks between the weeks in which the
+           task recurs.
+        - offsets -- the offsets from the start of the first dates (see
+           _week_offsets).
+
+        Returns:  a generator of dates.
+       -----------------------------------------------------------------
+    """
+    try:
+        # All of the first dates fall within one interval, so adding the
+        #  interval to each in turn keeps them in order.
+        date = start
+        step = datetime.timedelta(days=7 * skip)
+        offsets = [datetime.timedelta(days=offset) for offset in offsets]
+        while True:
+            for offset in offsets:
+                yield date + offset
+            # end for
+            date += step
+        # end while
+    except OverflowError:
+        return
+    except Exception as err:
+        _z_exc("wl_recur.py/_weekly", err)
+    # end try
+# end function
@@ -65,6 +65,7 @@ try:
     import io_utils
     import str_utils
     import wl_datetime
+    import wl_lexer
     import wl_resource
 except Exception as err:
     _z_exc("wl_resource.py/module imports", err)
@@ -423,6 +424,8 @@ def numbers(string):
     """-----------------------------------------------------------------
         Converts a number name/phrase to an integer or float.
 
+        The words are converted by wl_lexer, which caches them.
+
         Arguments:
         - string -- the word to parse.
 
@@ -431,49 +434,7 @@ def numbers(string):
        -----------------------------------------------------------------
     """
     try:
-        # Before splitting the string, distinguish between "-" as a
-        #  hyphen, and "-" as a negative sign.  Assume that negative
-        #  numbers are preceded by a space (or are at the beginning of
-        #  the string), and replace any negative "-"s with a flag.
-        string = re.sub(r"(^-)|(\s-)", r" ~", string)
-        # Divide the string into words.
-        wORD_LIST = re.split(r"\s|-", string)
-        # First convert all whole numbers into integers, and all
-        #  fractions to floats.  Also convert "a" and "an" to 1.
-        for x in range(len(wORD_LIST)):
-            # If the flag is found, restore the "-".
-            wORD_LIST[x] = re.sub(r"~", r"-", wORD_LIST[x])
-            wORD_LIST[x] = cardinal(wORD_LIST[x])
-            if re.match(r"an?$", str(wORD_LIST[x])):
-                wORD_LIST[x] = 1
-            elif re.match(r"\d+/\d+", str(wORD_LIST[x])):
-                elements = wORD_LIST[x].split("/")
-                wORD_LIST[x] = int(elements[0]) / int(elements[1])
-            # end if
-            den = 0
-            # Look for the more common denominator words.
-            if re.match(r"half", str(wORD_LIST[x])):
-                den = 2
-            elif re.match(r"thirds?", str(wORD_LIST[x])):
-                den = 3
-            elif re.match(r"(fourths?|quarters?)", str(wORD_LIST[x])):
-                den = 4
-            # end if
-            # If a denominator was found...
-            if den:
-                # See if the previous word is a numerator, use it and
-                #  then delete it; if it's not, set  the numerator to 1.
-                if type(wORD_LIST[x - 1]) == int:
-                    num = wORD_LIST[x - 1]
-                    wORD_LIST[x - 1] = None
-                else:
-                    num = 1
-                # end if
-                # Calculate the float.
-                wORD_LIST[x] = num / den
-            # end if
-        # end for
-        return wORD_LIST
+        return wl_lexer.numbers(string)
     except Exception as err:
         _z_exc("wl_resource.py/numbers", err)
     # end try
@@ -572,48 +533,35 @@ def print_header(wl_obj):
     try:
         # Clear the screen.
         io_utils.clear_screen()
-        # Print the header line.
-        char = "-"
-        for n in range(wl_obj.line_length):
-            print(char, end="")
-            if char == "-":
-                char = "="
-            else:
-                char = "-"
-            # end if
-        # end for
-        print()
-        # Print the title line.
-        print("Work Log 1.01", end="")
-        print("Steven Tagawa".rjust(wl_obj.line_length - 13))
-        print("-" * wl_obj.line_length)
-        print("File: ", wl_obj.filename, end="")
+        # Compose the header, and print it all at once.
+        screen = io_utils.ScreenBuffer()
+        # The header line.
+        screen.rule(wl_obj.line_length)
+        # The title line.
+        screen.write("Work Log 1.01", end="")
+        screen.write("Steven Tagawa".rjust(wl_obj.line_length - 13))
+        screen.write("-" * wl_obj.line_length)
+        screen.write("File: ", wl_obj.filename, end="")
         if wl_obj.changed is True:
-            print("   !NOT SAVED!")
+            screen.write("   !NOT SAVED!")
         else:
-            print()
+            screen.write()
         # end if
-        print("Last saved:  ", end="")
+        screen.write("Last saved:  ", end="")
         if wl_obj.last_modified:
-            print(format_string(wl_obj, wl_obj.last_modified, short=True))
+            screen.write(
+              format_string(wl_obj, wl_obj.last_modified, short=True))
         else:
-            print("Never")
+            screen.write("Never")
         # end if
-        print("-" * wl_obj.line_length)
+        screen.write("-" * wl_obj.line_length)
         # Reset the total entries here.
         wl_obj.total_entries = len(wl_obj.entries)
-        print("Total Entries: ", wl_obj.total_entries)
-        # Print the footer line.
-        char = "-"
-        for n in range(wl_obj.line_length):
-            print(char, end="")
-            if char == "-":
-                char = "="
-            else:
-                char = "-"
-            # end if
-        # end for
-        print("\n")
+        screen.write("Total Entries: ", wl_obj.total_entries)
+        # The footer line.
+        screen.rule(wl_obj.line_length)
+        screen.write()
+        screen.flush()
         return
     except Exception as err:
         _z_exc("wl_resource.py/print_header", err)
@@ -621,26 +569,37 @@ def print_header(wl_obj):
 # end function
 
 
-def print_nav(q=False, b=False):
+def print_nav(q=False, b=False, screen=None):
     """
         Tells the user how to quit or go back.
 
         Keyword arguments:
         - q -- print quit instruction (default False).
         - b -- print back instruction (default False).
+        - screen -- a screen buffer to add the instructions to, rather
+           than printing them (default None).
 
         Returns:  nothing.
        -----------------------------------------------------------------
     """
     try:
-        print()
+        if screen is None:
+            screen = io_utils.ScreenBuffer()
+            go = True
+        else:
+            go = False
+        # end if
+        screen.write()
         if b:
-            print("Enter [-b] to go back.", end="")
+            screen.write("Enter [-b] to go back.", end="")
         # end if
         if q:
-            print("Enter [-q] to abort.", end="")
+            screen.write("Enter [-q] to abort.", end="")
+        # end if
+        screen.write()
+        if go:
+            screen.flush()
         # end if
-        print()
         return
     except Exception as err:
         _z_exc("wl_resource.py/print_nav", err)
@@ -0,0 +1,367 @@
+"""
+    Contains functions to convert recurrance rules to and from iCalendar
+     (RFC 5545) RRULE strings.
+
+    The rec_interval attribute of a log entry maps onto RRULE parts as
+     follows:
+    * unit:  FREQ (DAILY, WEEKLY or MONTHLY).
+    * skip:  INTERVAL.
+    * days:  BYDAY.  For monthly rules, each day is written with its
+       ordinals (for example, 1TU,3TU for the first and third Tuesdays).
+    * dates:  BYMONTHDAY.
+    * end:  UNTIL (a date).  COUNT is also read, if the date of the
+       first task is known.
+
+    Weekly rules count their weeks from Sunday, but RRULEs count them
+     from WKST, which is Monday if it is not given.  So WKST=SU is
+     written for any rule with an INTERVAL, and a weekly RRULE with an
+     INTERVAL and any other WKST is only read if its weeks fall the same
+     way either way (see _same_weeks).
+
+    RRULEs which cannot be expressed as a rec_interval (other
+     frequencies, BYMONTH, BYSETPOS, different ordinals for different
+     days, and so on) are not converted.
+
+    Parsed RRULE strings are cached, so that the same rule can be read
+     again without parsing it.
+
+    Public Functions:
+    - from_rrule -- converts an RRULE string to a recurrance rule.
+    - to_rrule -- converts a recurrance rule to an RRULE string.
+
+    Private Functions:
+    - _parse -- splits (and caches) an RRULE string into its parts.
+    - _parse_until -- converts an UNTIL value to a date.
+    - _same_weeks -- checks whether the days of a weekly rule fall in
+       the same weeks counted from Sunday as from another day.
+    - _z_exc -- generic exception handler.
+   ---------------------------------------------------------------------
+"""
+
+
+# Import sys.
+import sys
+
+
+def _z_exc(loc, err):
+    """
+        Catch-all exception handler.
+
+        Arguments:
+        - loc -- string naming the module/function/method in which the
+           exception occurred.
+        - err -- the exception string.
+
+        Returns:  nothing (exits program).
+       -----------------------------------------------------------------
+    """
+    # Print error information.
+    print("An interal error occurred in " + loc + ": ", err)
+    # Exit.
+    sys.exit(
+      "Please report the above error and the circumstances which caused it " +
+      "to the developer.")
+    return  # Superfluous return.
+# end function
+
+
+# Other imports.
+try:
+    import datetime
+    import functools
+    import re
+
+    import wl_recur
+except Exception as err:
+    _z_exc("wl_rrule.py/module imports", err)
+# end try
+
+
+# Constants.
+FREQS = {
+  wl_recur.DAILY: "DAILY", wl_recur.WEEKLY: "WEEKLY",
+  wl_recur.MONTHLY: "MONTHLY"}
+# Days of the week, from 1 (Sunday) to 7 (Saturday).
+WEEKDAYS = ("SU", "MO", "TU", "WE", "TH", "FR", "SA")
+# The day on which an RRULE's weeks start, if it has no WKST.
+DEFAULT_WKST = "MO"
+# The parts which can be converted.
+PARTS = ["FREQ", "INTERVAL", "BYDAY", "BYMONTHDAY", "UNTIL", "COUNT", "WKST"]
+BYDAY_PATTERN = re.compile(r"\+?(\d?)(SU|MO|TU|WE|TH|FR|SA)")
+UNTIL_PATTERN = re.compile(r"(\d{4})(\d{2})(\d{2})(T\d{6}Z?)?")
+# The number of parsed RRULE strings which are cached.
+RRULE_CACHE_SIZE = 256
+
+
+def from_rrule(string, start=None):
+    """
+        Converts an RRULE string to a recurrance rule.
+
+        Arguments:
+        - string -- the RRULE, with or without the "RRULE:" prefix.
+
+        Keyword Arguments:
+        - start -- the date of the first task in the series (default
+           None).  Only needed if the RRULE has a COUNT, or is weekly
+           with an INTERVAL, days and a WKST other than Sunday.
+
+        Returns:  a rec_interval dictionary if successful, else None.
+       -----------------------------------------------------------------
+    """
+    try:
+        string = string.strip().upper()
+        if string.startswith("RRULE:"):
+            string = string[6:]
+        # end if
+        parts = _parse(string)
+        if parts is None:
+            return None
+        # end if
+        parts = dict(parts)
+        rec_interval = {
+          "unit": None, "skip": 1, "days": None, "ordinal": None,
+          "dates": None, "end": None}
+        # Frequency.
+        for unit, freq in FREQS.items():
+            if parts.get("FREQ") == freq:
+                rec_interval["unit"] = unit
+            # end if
+        # end for
+        if not rec_interval["unit"]:
+            return None
+        # end if
+        # Interval.
+        if "INTERVAL" in parts:
+            if not parts["INTERVAL"].isdigit() or int(parts["INTERVAL"]) < 1:
+                return None
+            # end if
+            rec_interval["skip"] = int(parts["INTERVAL"])
+        # end if
+        # Days of the week.
+        if "BYDAY" in parts:
+            if rec_interval["unit"] == wl_recur.DAILY:
+                return None
+            # end if
+            ordinals = {}
+            for item in parts["BYDAY"].split(","):
+                match = BYDAY_PATTERN.fullmatch(item)
+                if not match:
+                    return None
+                # end if
+                day = WEEKDAYS.index(match.group(2)) + 1
+                ordinals.setdefault(day, set())
+                if match.group(1):
+                    ordinals[day].add(int(match.group(1)))
+                # end if
+            # end for
+            rec_interval["days"] = sorted(ordinals)
+            ordinal_sets = list(ordinals.values())
+            if rec_interval["unit"] == wl_recur.WEEKLY:
+                if any(ordinal_sets):
+                    return None
+                # end if
+            else:
+                # Each day must fall on the same weeks of the month, and
+                #  a monthly rule cannot recur every week.
+                if (
+                  any(ordl != ordinal_sets[0] for ordl in ordinal_sets) or
+                  not ordinal_sets[0] or
+                  not ordinal_sets[0] <= {1, 2, 3, 4, 5}):
+                    return None
+                # end if
+                rec_interval["ordinal"] = sorted(ordinal_sets[0])
+            # end if
+        # end if
+        # Start of the week.
+        wkst = parts.get("WKST", DEFAULT_WKST)
+        if wkst not in WEEKDAYS:
+            return None
+        # end if
+        if (
+          rec_interval["unit"] == wl_recur.WEEKLY and
+          rec_interval["skip"] > 1 and rec_interval["days"] and
+          not _same_weeks(rec_interval["days"], wkst, start)):
+            return None
+        # end if
+        # Days of the month.
+        if "BYMONTHDAY" in parts:
+            if rec_interval["unit"] != wl_recur.MONTHLY or "BYDAY" in parts:
+                return None
+            # end if
+            try:
+                dates = [int(date) for date in parts["BYMONTHDAY"].split(",")]
+            except ValueError:
+                return None
+            # end try
+            if not all(1 <= abs(date) <= 31 for date in dates):
+                return None
+            # end if
+            rec_interval["dates"] = dates
+        # end if
+        # End date.
+        if "UNTIL" in parts and "COUNT" in parts:
+            return None
+        elif "UNTIL" in parts:
+            rec_interval["end"] = _parse_until(parts["UNTIL"])
+            if not rec_interval["end"]:
+                return None
+            # end if
+        elif "COUNT" in parts:
+            # The count includes the first task.
+            if (
+              not start or not parts["COUNT"].isdigit() or
+              int(parts["COUNT"]) < 1):
+                return None
+            # end if
+            rec_interval["end"] = start
+            for date in wl_recur.occurrances(
+              start, rec_interval, count=int(parts["COUNT"]) - 1):
+                rec_interval["end"] = date
+            # end for
+        # end if
+        return rec_interval
+    except Exception as err:
+        _z_exc("wl_rrule.py/from_rrule", err)
+    # end try
+# end function
+
+
+def to_rrule(rec_interval):
+    """
+        Converts a recurrance rule to an RRULE string.
+
+        Arguments:
+        - rec_interval -- the recurrance rule.
+
+        Returns:  the RRULE string, without the "RRULE:" prefix.
+       -----------------------------------------------------------------
+    """
+    try:
+        parts = ["FREQ=" + FREQS[rec_interval["unit"]]]
+        skip = rec_interval.get("skip") or 1
+        if skip > 1:
+            # Weeks are counted from Sunday, which RRULEs do not assume.
+            parts.append(f"INTERVAL={skip}")
+            parts.append("WKST=SU")
+        # end if
+        days = rec_interval.get("days")
+        if rec_interval["unit"] == wl_recur.WEEKLY and days:
+            parts.append(
+              "BYDAY=" + ",".join(WEEKDAYS[day - 1] for day in days))
+        elif rec_interval["unit"] == wl_recur.MONTHLY:
+            if days:
+                # A monthly rule without ordinals recurs on the first of
+                #  each day.
+                parts.append("BYDAY=" + ",".join(
+                  f"{ordl}{WEEKDAYS[day - 1]}" for day in days
+                  for ordl in rec_interval.get("ordinal") or [1]))
+            elif rec_interval.get("dates"):
+                parts.append("BYMONTHDAY=" + ",".join(
+                  str(date) for date in rec_interval["dates"]))
+            # end if
+        # end if
+        if rec_interval.get("end"):
+            parts.append("UNTIL=" + rec_interval["end"].strftime("%Y%m%d"))
+        # end if
+        return ";".join(parts)
+    except Exception as err:
+        _z_exc("wl_rrule.py/to_rrule", err)
+    # end try
+# end function
+
+
+@functools.lru_cache(maxsize=RRULE_CACHE_SIZE)
+def _parse(string):
+    """
+        Splits an RRULE string into its parts.
+
+        Arguments:
+        - string -- the RRULE, in upper case, without the "RRULE:"
+           prefix.
+
+        Returns:  a tuple of (name, value) tuples if every part can be
+         converted, else None.
+       -----------------------------------------------------------------
+    """
+    try:
+        parts = []
+        for part in string.split(";"):
+            name, sep, value = part.partition("=")
+            if not sep or name not in PARTS or not value:
+                return None
+            # end if
+            parts.append((name, value))
+        # end for
+        # Each part may only appear once.
+        if len({name for name, value in parts}) < len(parts):
+            return None
+        # end if
+        return tuple(parts)
+    except Exception as err:
+        _z_exc("wl_rrule.py/_parse", err)
+    # end try
+# end function
+
+
+def _parse_until(value):
+    """
+        Converts an UNTIL value to a date.
+
+        Arguments:
+        - value -- the value; a date, or a date and time.
+
+        Returns:  a date object if successful, else None.
+       -----------------------------------------------------------------
+    """
+    try:
+        match = UNTIL_PATTERN.fullmatch(value)
+        if not match:
+            return None
+        # end if
+        try:
+            return datetime.date(
+              int(match.group(1)), int(match.group(2)), int(match.group(3)))
+        except ValueError:
+            return None
+        # end try
+    except Exception as err:
+        _z_exc("wl_rrule.py/_parse_until", err)
+    # end try
+# end function
+
+
+def _same_weeks(days, wkst, start):
+    """
+        Checks whether the days of a weekly rule fall in the same weeks
+         when the weeks start on Sunday as when they start on wkst.
+
+        They do if the days, and the day of the first task, are either
+         all before wkst in a week starting on Sunday, or all on or
+         after it.
+
+        Arguments:
+        - days -- days of the week (Sunday-based) on which the task
+           recurs.
+        - wkst -- the RRULE's start of the week ("SU" to "SA").
+        - start -- the date of the first task in the series, or None if
+           it is not known.
+
+        Returns:  True if the weeks are the same, else False.
+       -----------------------------------------------------------------
+    """
+    try:
+        first = WEEKDAYS.index(wkst) + 1
+        if first == 1:
+            return True
+        # end if
+        if not start:
+            return False
+        # end if
+        all_days = set(days) | {(start.weekday() + 1) % 7 + 1}
+        return (
+          all(day < first for day in all_days) or
+          all(day >= first for day in all_days))
+    except Exception as err:
+        _z_exc("wl_rrule.py/_same_weeks", err)
+    # end try
+# end function
@@ -2,6 +2,8 @@
     Contains functions to find entries based on user's criteria.
 
     Public Functions:
+    - lookup_entries_by_date -- finds the stored entries within a range
+       of datetimes.
     - lookup_entry_by_id - finds an entry in the work log given its id
        number.
     - search_by_date -- searches for entries matching a datetime or
@@ -27,10 +29,20 @@
     - _get_date -- gets a date from the user.
     - _get_duration -- gets a duration from the user.
     - _get_time - gets a time from the user.
+    - _load_shards -- loads the shards of a sharded log that a search
+       needs.
+    - _lookup_entries_by_id -- finds the entries matching a list of
+       IDs.
     - _match_item -- compares a search term to an entry to see if it
        matches.
+    - _match_re -- checks whether an entry matches a regular
+       expression.
+    - _merge_series -- merges the occurrances of recurring series into
+       a list of matching entries.
     - _parse_string_text -- converts the user's search terms into a
        list that can be used as search criteria.
+    - _use_db -- checks whether a search can be run against the work
+       log's database.
     - _z_exc -- generic exception handler.
    ---------------------------------------------------------------------
 """
@@ -64,12 +76,19 @@ def _z_exc(loc, err):
 
 # Other imports.
 try:
+    import bisect
     import datetime
+    import heapq
     import re
 
     import io_utils
     import wl_datetime
+    import wl_ids
+    import wl_lazylog
     import wl_resource
+    import wl_series
+    import wl_shard
+    import wl_sqlite
     import wl_viewedit
 except Exception as err:
     _z_exc("wl_search.py/module imports", err)
@@ -90,6 +109,41 @@ ENTRY_ID = 2
 TITLE = 1
 NOTES = 2
 BOTH = 3
+DB = "db"
+
+
+def lookup_entries_by_date(wl_obj, start_date, end_date):
+    """
+        Finds the stored entries within a range of datetimes.
+
+        Only the entries in the range are read from a lazily-read log
+         (and only the shards for the range are loaded from a sharded
+         log).  Occurrances of rule-based series are not included.
+
+        Arguments:
+        - wl_obj -- the work log object.
+        - start_date -- the first datetime in the range.
+        - end_date -- the last datetime in the range.
+
+        Returns:  a list of entries, in date order.
+       -----------------------------------------------------------------
+    """
+    try:
+        _load_shards(wl_obj, start_date, end_date)
+        date_sort = wl_obj.sorts[DATE_SORT]
+        id_list = []
+        for ndx in range(
+          bisect.bisect_left(date_sort, (start_date,)), len(date_sort)):
+            if date_sort[ndx][SORT_KEY] > end_date:
+                break
+            # end if
+            id_list.append(date_sort[ndx][ENTRY_ID])
+        # end for
+        return _lookup_entries_by_id(wl_obj, id_list)
+    except Exception as err:
+        _z_exc("wl_search.py/lookup_entries_by_date", err)
+    # end try
+# end function
 
 
 def lookup_entry_by_id(wl_obj, entry_id):
@@ -105,15 +159,20 @@ def lookup_entry_by_id(wl_obj, entry_id):
        -----------------------------------------------------------------
     """
     try:
-        # Since the entry IDs aren't in any order, we have to just go
-        #  through the entire list until a match is found.
-        for entry in wl_obj.entries:
-            if entry.id == entry_id:
-                return entry
-            # end if
-        # end for
-        # If no match, return None.
-        return None
+        # Occurrances of a recurring series which haven't been stored
+        #  are created from the series' rule.
+        if type(entry_id) == int and entry_id < 0:
+            return wl_series.lookup(wl_obj, entry_id)
+        # end if
+        # Lazily-read and sharded logs keep their own indexes of IDs.
+        if isinstance(
+          wl_obj.entries,
+          (wl_lazylog.LazyEntryList, wl_shard.ShardedEntryList)):
+            return wl_obj.entries.lookup(entry_id)
+        # end if
+        # Otherwise the ID is the entry's position in the log's index
+        #  of IDs.
+        return wl_ids.lookup(wl_obj, entry_id)
     except Exception as err:
         _z_exc("wl_search.py/lookup_entry_by_id", err)
     # end try
@@ -241,16 +300,15 @@ def search_by_date(wl_obj):
                 return return_list
             # To view all dates, create a list of unique dates.
             else:
-                return_list = []
-                # Iterate through the sorted list.
-                for entry in wl_obj.sorts[DATE_SORT]:
-                    # Convert datetime to date and append all unique
-                    #  dates.
-                    if entry[SORT_KEY].date() not in return_list:
-                        return_list.append(entry[SORT_KEY].date())
-                    # end if
+                _load_shards(wl_obj)
+                # Collect the unique dates in a set, then sort them once.
+                date_set = {
+                  entry[SORT_KEY].date() for entry in wl_obj.sorts[DATE_SORT]}
+                # Add the dates of recurring series' occurrances.
+                for entry in wl_series.occurrances(wl_obj):
+                    date_set.add(entry.date)
                 # end for
-                return return_list
+                return sorted(date_set)
             # end if
         # end while
     except Exception as err:
@@ -639,6 +697,17 @@ def _find_entries_date(wl_obj, start_date, end_date):
        -----------------------------------------------------------------
     """
     try:
+        # A database-backed log can use its index, as long as there are
+        #  no unsaved changes.
+        if _use_db(wl_obj):
+            return _merge_series(
+              _lookup_entries_by_id(
+                wl_obj, wl_sqlite.find_ids_by_date(
+                  wl_obj.filename, start_date, end_date)),
+              wl_series.occurrances(wl_obj, start_date, end_date), DATE_SORT)
+        # end if
+        # A sharded log only needs the shards for the dates searched.
+        _load_shards(wl_obj, start_date, end_date)
         return_list = []
         # NOTE:  Because the work logs used by this program are not
         #  likely to contain a large number of entries, the program uses
@@ -658,7 +727,9 @@ def _find_entries_date(wl_obj, start_date, end_date):
                 break
             # end if
         # end for
-        return return_list
+        return _merge_series(
+          return_list, wl_series.occurrances(wl_obj, start_date, end_date),
+          DATE_SORT)
     except Exception as err:
         _z_exc("wl_search.py/_find_entries_date", err)
     # end try
@@ -679,6 +750,20 @@ def _find_entries_duration(wl_obj, min_duration, max_duration):
        -----------------------------------------------------------------
     """
     try:
+        # Every occurrance of a recurring series has the same duration.
+        occ_list = wl_series.occurrances(
+          wl_obj, match=lambda parent: (
+            min_duration <= parent.duration <= max_duration))
+        # A database-backed log can use its index, as long as there are
+        #  no unsaved changes.
+        if _use_db(wl_obj):
+            return _merge_series(
+              _lookup_entries_by_id(
+                wl_obj, wl_sqlite.find_ids_by_duration(
+                  wl_obj.filename, min_duration, max_duration)),
+              occ_list, DATE_SORT)
+        # end if
+        _load_shards(wl_obj)
         return_list = []
         # Since entries aren't indexed by duration, the search needs to
         #  be brute-force, and can't be direct.  But using the date-
@@ -695,7 +780,7 @@ def _find_entries_duration(wl_obj, min_duration, max_duration):
             # end if
         # end for
         # Return the list.
-        return return_list
+        return _merge_series(return_list, occ_list, DATE_SORT)
     except Exception as err:
         _z_exc("wl_search.py/_find_entries_duration", err)
     # end try
@@ -716,6 +801,7 @@ def _find_entries_re(wl_obj, pattern, fields):
        -----------------------------------------------------------------
     """
     try:
+        _load_shards(wl_obj)
         return_list = []
         # If the user has specified a case-insensitive search--
         # Make sure the pattern is valid.
@@ -738,16 +824,24 @@ def _find_entries_re(wl_obj, pattern, fields):
                 return []
             # end try
         # end if
-        for entry in wl_obj.entries:
-            if (
-              ((fields in [TITLE, BOTH]) and
-               (re.search(pattern, entry.title))) or
-              ((fields in [NOTES, BOTH]) and
-               (re.search(pattern, entry.notes)))):
+        # Go through the log in title order.  A search of the titles
+        #  alone checks the titles in the sort index, so that only the
+        #  matching entries are read.
+        for item in wl_obj.sorts[TITLE_SORT]:
+            if fields == TITLE and not re.search(pattern, item[SORT_KEY]):
+                continue
+            # end if
+            entry = lookup_entry_by_id(wl_obj, item[ENTRY_ID])
+            if _match_re(pattern, entry, fields):
                 return_list.append(entry)
             # end if
         # end for
-        return return_list
+        # Every occurrance of a recurring series has the same title and
+        #  notes.
+        return _merge_series(
+          return_list, wl_series.occurrances(
+            wl_obj, match=lambda parent: _match_re(pattern, parent, fields)),
+          TITLE_SORT)
     except Exception as err:
         _z_exc("wl_search.py/find_entries_re", err)
     # end try
@@ -769,6 +863,7 @@ def _find_entries_text(wl_obj, string, fields, mode):
        -----------------------------------------------------------------
     """
     try:
+        _load_shards(wl_obj)
         # Set the mode selector.
         if mode == 2:
             wildcard = True
@@ -786,7 +881,12 @@ def _find_entries_text(wl_obj, string, fields, mode):
                 return_list.append(current)
             # end if
         # end for
-        return return_list
+        # Every occurrance of a recurring series has the same title and
+        #  notes.
+        return _merge_series(
+          return_list, wl_series.occurrances(
+            wl_obj, match=lambda parent: _match_item(query, parent, fields)),
+          TITLE_SORT)
     except Exception as err:
         _z_exc("wl_search.py/find_entries_text", err)
     # end try
@@ -1012,6 +1112,64 @@ def _get_time(wl_obj, t_type, date, start=None):
 # end function
 
 
+def _load_shards(wl_obj, start_date=None, end_date=None):
+    """
+        Loads the shards of a sharded log that a search needs.
+
+        Does nothing if the log is not sharded.
+
+        Arguments:
+        - wl_obj -- the work log object.
+
+        Keyword Arguments:
+        - start_date -- the first date searched (default None, which
+           loads every shard).
+        - end_date -- the last date searched (default None).
+
+        Returns:  nothing.
+       -----------------------------------------------------------------
+    """
+    try:
+        if not isinstance(wl_obj.entries, wl_shard.ShardedEntryList):
+            return
+        elif start_date is None:
+            wl_obj.entries.load_all()
+        else:
+            wl_obj.entries.load_range(start_date, end_date)
+        # end if
+        return
+    except Exception as err:
+        _z_exc("wl_search.py/_load_shards", err)
+    # end try
+# end function
+
+
+def _lookup_entries_by_id(wl_obj, id_list):
+    """
+        Finds the entries matching a list of IDs.
+
+        Arguments:
+        - wl_obj -- the work log object.
+        - id_list -- the IDs of the entries to find.
+
+        Returns:  a list of entries, in the same order as the IDs.
+       -----------------------------------------------------------------
+    """
+    try:
+        return_list = []
+        for entry_id in id_list:
+            entry = lookup_entry_by_id(wl_obj, entry_id)
+            if entry:
+                return_list.append(entry)
+            # end if
+        # end for
+        return return_list
+    except Exception as err:
+        _z_exc("wl_search.py/_lookup_entries_by_id", err)
+    # end try
+# end function
+
+
 def _match_item(item, entry, mode):
     """
         Looks for a match between a query and a log entry's title,
@@ -1070,6 +1228,63 @@ def _match_item(item, entry, mode):
 # end function
 
 
+def _match_re(pattern, entry, fields):
+    """
+        Checks whether an entry matches a regular expression.
+
+        Arguments:
+        - pattern -- the compiled regular expression.
+        - entry -- the entry to check.
+        - fields -- the field(s) to search.
+
+        Returns:  True if the entry matches, else False.
+       -----------------------------------------------------------------
+    """
+    try:
+        return bool(
+          ((fields in [TITLE, BOTH]) and
+           (re.search(pattern, entry.title))) or
+          ((fields in [NOTES, BOTH]) and
+           (re.search(pattern, entry.notes))))
+    except Exception as err:
+        _z_exc("wl_search.py/_match_re", err)
+    # end try
+# end function
+
+
+def _merge_series(return_list, occ_list, sort):
+    """
+        Merges the occurrances of recurring series into a list of
+         matching entries.
+
+        Arguments:
+        - return_list -- the matching entries, in title or date order.
+        - occ_list -- the matching occurrances, in date order.
+        - sort -- the order of the entries (TITLE_SORT or DATE_SORT).
+
+        Returns:  a list containing the entries and occurrances, in the
+         same order as the entries.
+       -----------------------------------------------------------------
+    """
+    try:
+        if not occ_list:
+            return return_list
+        # end if
+        if sort == TITLE_SORT:
+            occ_list.sort(key=lambda entry: (entry.title, entry.datetime))
+            return list(heapq.merge(
+              return_list, occ_list,
+              key=lambda entry: (entry.title, entry.datetime)))
+        # end if
+        return list(heapq.merge(
+          return_list, occ_list,
+          key=lambda entry: (entry.datetime, entry.title)))
+    except Exception as err:
+        _z_exc("wl_search.py/_merge_series", err)
+    # end try
+# end function
+
+
 def _parse_search_text(string, wildcard=False):
     """
         Takes a string containing search terms and formats it for the
@@ -1219,3 +1434,26 @@ def _parse_search_text(string, wildcard=False):
         _z_exc("wl_search.py/_parse_search_text", err)
     # end try
 # end function
+
+
+def _use_db(wl_obj):
+    """
+        Checks whether a search can be run against the log's database.
+
+        The database can only be searched if the log is stored in one,
+         and there are no unsaved changes (otherwise the search would
+         miss them).
+
+        Arguments:
+        - wl_obj -- the work log object.
+
+        Returns:  True if the database can be searched, else False.
+       -----------------------------------------------------------------
+    """
+    try:
+        return (
+          wl_obj.backend == DB and not wl_obj.dirty and not wl_obj.deleted)
+    except Exception as err:
+        _z_exc("wl_search.py/_use_db", err)
+    # end try
+# end function
@@ -0,0 +1,678 @@
+"""
+    Contains functions to manage rule-based recurring series of tasks.
+
+    A series is stored as a single entry (the parent) whose rec_interval
+     attribute holds the rule for the series, plus a list of exceptions:
+     dates on which the rule does not produce an occurrance, because the
+     occurrance has been deleted or stored as an entry of its own.  The
+     other occurrances are not stored; they are created as they are
+     needed by searches, and only stored (materialized) when one of them
+     is edited.
+
+    Each occurrance is numbered by its place in the full list of dates
+     produced by the rule, and keeps that number even if other
+     occurrances are deleted.  An occurrance which has not been stored
+     has a negative ID, made from its parent's ID and its number.
+
+    Public Functions:
+    - add_exception -- stops the rule for a series from producing an
+       occurrance on a date.
+    - add_series -- makes an entry the parent of a rule-based series.
+    - children -- finds the stored entries of a series.
+    - end_series -- removes a series from the work log's list of
+       series.
+    - is_occurrance -- checks whether an entry is an occurrance which
+       has not been stored.
+    - is_series -- checks whether an entry is the parent of a rule-based
+       series.
+    - longest -- gets the longest duration of any series' tasks.
+    - lookup -- finds an occurrance given its ID.
+    - materialize -- stores a single occurrance as an entry.
+    - materialize_all -- stores all of a series' occurrances as entries.
+    - occurrances -- creates the occurrances of all series in the work
+       log, within a date range.
+    - refresh -- gets the current version of an entry which may have
+       been materialized.
+    - remove_occurrance -- deletes a single occurrance from a series.
+
+    Private Functions:
+    - _cached_dates -- calculates (and caches) the dates produced by a
+       recurrance rule.
+    - _dates -- gets the dates produced by a series' rule.
+    - _occurrance -- creates one occurrance of a series.
+    - _parents -- gets the parent entries of all of the work log's
+       series.
+    - _split_id -- splits an occurrance's ID into its parent's ID and
+       its number.
+    - _store -- adds a copy of an occurrance to the work log.
+    - _z_exc -- generic exception handler.
+   ---------------------------------------------------------------------
+"""
+
+
+# Import sys.
+import sys
+
+
+def _z_exc(loc, err):
+    """
+        Catch-all exception handler.
+
+        Arguments:
+        - loc -- string naming the module/function/method in which the
+           exception occurred.
+        - err -- the exception string.
+
+        Returns:  nothing (exits program).
+       -----------------------------------------------------------------
+    """
+    # Print error information.
+    print("An interal error occurred in " + loc + ": ", err)
+    # Exit.
+    sys.exit(
+      "Please report the above error and the circumstances which caused it " +
+      "to the developer.")
+    return  # Superfluous return.
+# end function
+
+
+# Other imports.
+try:
+    import bisect
+    import datetime
+    import functools
+
+    import logentry
+    import wl_ids
+    import wl_lazylog
+    import wl_recur
+    import wl_search
+    import wl_shard
+except Exception as err:
+    _z_exc("wl_series.py/module imports", err)
+# end try
+
+
+# Constants.
+TITLE_SORT = 0
+DATE_SORT = 1
+# The largest number of occurrances in a series (a daily series would
+#  need to run for over 2,700 years to reach it).
+MAX_OCCURRANCES = 10 ** 6
+
+
+def add_exception(parent, date):
+    """
+        Stops the rule for a series from producing an occurrance.
+
+        Arguments:
+        - parent -- the parent entry of the series.
+        - date -- the date of the occurrance.
+
+        Returns:  nothing.
+       -----------------------------------------------------------------
+    """
+    try:
+        exceptions = parent.rec_interval.get("exceptions") or []
+        if date not in exceptions:
+            exceptions.append(date)
+            exceptions.sort()
+        # end if
+        parent.rec_interval["exceptions"] = exceptions
+        return
+    except Exception as err:
+        _z_exc("wl_series.py/add_exception", err)
+    # end try
+# end function
+
+
+def add_series(wl_obj, entry, date_list):
+    """
+        Makes an entry the parent of a rule-based series.
+
+        Arguments:
+        - wl_obj -- the work log object.
+        - entry -- the entry, whose rec_interval attribute has been set.
+        - date_list -- the dates produced by the entry's rule.
+
+        Returns:  nothing.
+       -----------------------------------------------------------------
+    """
+    try:
+        entry.rec_interval["exceptions"] = []
+        entry.rec_total = len(date_list)
+        if entry.id not in wl_obj.series:
+            wl_obj.series.append(entry.id)
+        # end if
+        return
+    except Exception as err:
+        _z_exc("wl_series.py/add_series", err)
+    # end try
+# end function
+
+
+def children(wl_obj, parent):
+    """
+        Finds the stored entries of a series, other than its parent.
+
+        The entries of a lazily-read or sharded log are only read for
+         the dates the series covers, from its parent's date to its end
+         date, so a child whose date has been moved outside them is not
+         found.  Other logs are searched in full.
+
+        Arguments:
+        - wl_obj -- the work log object.
+        - parent -- the parent entry of the series.
+
+        Returns:  a list of the child entries.
+       -----------------------------------------------------------------
+    """
+    try:
+        entry_list = wl_obj.entries
+        end = None
+        if type(parent.rec_interval) == dict:
+            end = parent.rec_interval.get("end")
+        # end if
+        if end and isinstance(
+          wl_obj.entries,
+          (wl_lazylog.LazyEntryList, wl_shard.ShardedEntryList)):
+            entry_list = wl_search.lookup_entries_by_date(
+              wl_obj, datetime.datetime.combine(parent.date, datetime.time()),
+              datetime.datetime.combine(end, datetime.time.max))
+        # end if
+        return [entry for entry in entry_list if entry.rec_parent == parent.id]
+    except Exception as err:
+        _z_exc("wl_series.py/children", err)
+    # end try
+# end function
+
+
+def end_series(wl_obj, parent_id):
+    """
+        Removes a series from the work log's list of series.
+
+        Arguments:
+        - wl_obj -- the work log object.
+        - parent_id -- the ID of the series' parent entry.
+
+        Returns:  nothing.
+       -----------------------------------------------------------------
+    """
+    try:
+        if parent_id in wl_obj.series:
+            wl_obj.series.remove(parent_id)
+        # end if
+        return
+    except Exception as err:
+        _z_exc("wl_series.py/end_series", err)
+    # end try
+# end function
+
+
+def is_occurrance(entry):
+    """
+        Checks whether an entry is an occurrance which is not stored.
+
+        Arguments:
+        - entry -- the entry to check.
+
+        Returns:  True if the entry was created from a series' rule,
+         else False.
+       -----------------------------------------------------------------
+    """
+    try:
+        return type(entry.id) == int and entry.id < 0
+    except Exception as err:
+        _z_exc("wl_series.py/is_occurrance", err)
+    # end try
+# end function
+
+
+def is_series(entry):
+    """
+        Checks whether an entry is the parent of a rule-based series.
+
+        Series created before rule-based series were introduced store
+         all of their occurrances as entries, and have no exceptions.
+
+        Arguments:
+        - entry -- the entry to check.
+
+        Returns:  True if the entry is the parent of a rule-based
+         series, else False.
+       -----------------------------------------------------------------
+    """
+    try:
+        return bool(
+          entry.recurring and type(entry.rec_interval) == dict and
+          entry.rec_interval.get("exceptions") is not None)
+    except Exception as err:
+        _z_exc("wl_series.py/is_series", err)
+    # end try
+# end function
+
+
+def longest(wl_obj):
+    """
+        Gets the longest duration of any series' tasks.
+
+        Arguments:
+        - wl_obj -- the work log object.
+
+        Returns:  a timedelta (zero if the log has no series).
+       -----------------------------------------------------------------
+    """
+    try:
+        return max(
+          (parent.duration for parent in _parents(wl_obj)
+           if parent.duration), default=datetime.timedelta(0))
+    except Exception as err:
+        _z_exc("wl_series.py/longest", err)
+    # end try
+# end function
+
+
+def lookup(wl_obj, entry_id):
+    """
+        Finds an occurrance given its ID.
+
+        Arguments:
+        - wl_obj -- the work log object.
+        - entry_id -- the (negative) ID of the occurrance.
+
+        Returns:  the occurrance; the stored entry, if the occurrance
+         has been materialized; or None if there is no such occurrance.
+       -----------------------------------------------------------------
+    """
+    try:
+        parent_id, n = _split_id(entry_id)
+        parent = wl_search.lookup_entry_by_id(wl_obj, parent_id)
+        if not parent or not is_series(parent):
+            return None
+        # end if
+        dates = _dates(parent)
+        if not 1 <= n <= len(dates):
+            return None
+        # end if
+        # If the date is an exception, the occurrance has either been
+        #  deleted or stored.
+        if dates[n - 1] in parent.rec_interval["exceptions"]:
+            for entry in children(wl_obj, parent):
+                if entry.rec_child_seq and entry.rec_child_seq[0] == n:
+                    return entry
+                # end if
+            # end for
+            return None
+        # end if
+        return _occurrance(parent, n, dates[n - 1])
+    except Exception as err:
+        _z_exc("wl_series.py/lookup", err)
+    # end try
+# end function
+
+
+def materialize(wl_obj, entry):
+    """
+        Stores a single occurrance as an entry.
+
+        The stored entry has the occurrance's original values; the
+         caller applies any changes to it.
+
+        Arguments:
+        - wl_obj -- the work log object.
+        - entry -- the occurrance (or an edited copy of it).
+
+        Returns:  the stored entry, or None if the occurrance no longer
+         exists.
+       -----------------------------------------------------------------
+    """
+    try:
+        original = lookup(wl_obj, entry.id)
+        if original is None or not is_occurrance(original):
+            return original
+        # end if
+        parent = wl_search.lookup_entry_by_id(wl_obj, original.rec_parent)
+        stored = _store(wl_obj, original)
+        add_exception(parent, original.date)
+        wl_obj.mark_dirty(parent)
+        wl_obj.changed = True
+        return stored
+    except Exception as err:
+        _z_exc("wl_series.py/materialize", err)
+    # end try
+# end function
+
+
+def materialize_all(wl_obj, parent):
+    """
+        Stores all of a series' occurrances as entries.
+
+        The series is converted into one whose occurrances are all
+         stored, as series were before rule-based series were
+         introduced.  This is needed when the parent of the series is
+         changed or deleted on its own, since the occurrances could no
+         longer be created from it.
+
+        Arguments:
+        - wl_obj -- the work log object.
+        - parent -- the parent entry of the series.
+
+        Returns:  a dictionary mapping the ID of each occurrance which
+         was not stored to its new stored entry.
+       -----------------------------------------------------------------
+    """
+    try:
+        if not is_series(parent):
+            return {}
+        # end if
+        dates = _dates(parent)
+        exceptions = parent.rec_interval["exceptions"]
+        stored = {}
+        for n, date in enumerate(dates, start=1):
+            if date not in exceptions:
+                occ = _occurrance(parent, n, date)
+                stored[occ.id] = _store(wl_obj, occ, sort=False)
+            # end if
+        # end for
+        # The new entries are added to the sort lists together, which is
+        #  much faster than inserting each one in turn.
+        wl_obj.sorts[TITLE_SORT].sort()
+        wl_obj.sorts[DATE_SORT].sort()
+        # Number the stored entries in order, as the original series
+        #  entries were numbered.
+        child_list = children(wl_obj, parent)
+        child_list.sort(key=lambda entry: entry.rec_child_seq[0])
+        for n, entry in enumerate(child_list, start=1):
+            entry.rec_child_seq = (n, len(child_list))
+            wl_obj.mark_dirty(entry)
+        # end for
+        parent.rec_total = len(child_list)
+        del parent.rec_interval["exceptions"]
+        wl_obj.mark_dirty(parent)
+        end_series(wl_obj, parent.id)
+        wl_obj.changed = True
+        return stored
+    except Exception as err:
+        _z_exc("wl_series.py/materialize_all", err)
+    # end try
+# end function
+
+
+def occurrances(wl_obj, start=None, end=None, match=None):
+    """
+        Creates the occurrances of all series in the work log.
+
+        Arguments:
+        - wl_obj -- the work log object.
+
+        Keyword Arguments:
+        - start -- the earliest date/time to include (default None,
+           which includes every occurrance).
+        - end -- the latest date/time to include (default None).
+        - match -- a function which is passed each series' parent entry
+           and returns whether the series' occurrances should be
+           included (default None, which includes every series).  All
+           of a series' occurrances share its parent's title, notes and
+           duration, so only series whose parents match are created.
+
+        Returns:  a list of occurrances, in date order.
+       -----------------------------------------------------------------
+    """
+    try:
+        return_list = []
+        for parent in _parents(wl_obj):
+            if match and not match(parent):
+                continue
+            # end if
+            dates = _dates(parent)
+            first = 0
+            last = len(dates)
+            # The dates are in order, so the range can be found
+            #  directly.
+            if start is not None:
+                first = bisect.bisect_left(dates, start.date())
+                last = bisect.bisect_right(dates, end.date())
+            # end if
+            exceptions = parent.rec_interval["exceptions"]
+            for n in range(first + 1, last + 1):
+                if dates[n - 1] in exceptions:
+                    continue
+                # end if
+                occ = _occurrance(parent, n, dates[n - 1])
+                if start is None or start <= occ.datetime <= end:
+                    return_list.append(occ)
+                # end if
+            # end for
+        # end for
+        return_list.sort(key=lambda entry: (entry.datetime, entry.title))
+        return return_list
+    except Exception as err:
+        _z_exc("wl_series.py/occurrances", err)
+    # end try
+# end function
+
+
+def refresh(wl_obj, entry):
+    """
+        Gets the current version of an entry.
+
+        If the entry is an occurrance which has since been stored, the
+         stored entry is returned.
+
+        Arguments:
+        - wl_obj -- the work log object.
+        - entry -- the entry.
+
+        Returns:  the current version of the entry.
+       -----------------------------------------------------------------
+    """
+    try:
+        if not is_occurrance(entry):
+            return entry
+        # end if
+        return lookup(wl_obj, entry.id) or entry
+    except Exception as err:
+        _z_exc("wl_series.py/refresh", err)
+    # end try
+# end function
+
+
+def remove_occurrance(wl_obj, entry):
+    """
+        Deletes a single occurrance from a series.
+
+        Arguments:
+        - wl_obj -- the work log object.
+        - entry -- the occurrance (stored or not) to delete.
+
+        Returns:  nothing.
+       -----------------------------------------------------------------
+    """
+    try:
+        parent = wl_search.lookup_entry_by_id(wl_obj, entry.rec_parent)
+        # A stored occurrance may have had its date changed, so the
+        #  date produced by the rule is found from its number.
+        add_exception(parent, _dates(parent)[entry.rec_child_seq[0] - 1])
+        wl_obj.mark_dirty(parent)
+        if not is_occurrance(entry):
+            wl_obj.entries.remove(entry)
+            wl_obj.mark_dirty(entry, deleted=True)
+        # end if
+        wl_obj.changed = True
+        return
+    except Exception as err:
+        _z_exc("wl_series.py/remove_occurrance", err)
+    # end try
+# end function
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_dates(start, unit, skip, days, ordinal, dates, end_date):
+    """
+        Calculates (and caches) the dates produced by a recurrance rule.
+
+        Arguments:
+        - start -- the date of the first task in the series.
+        - unit, skip, days, ordinal, dates -- the rule, with lists
+           converted to tuples.
+        - end_date -- the last date on which the task can recur.
+
+        Returns:  a tuple of dates, in order.
+       -----------------------------------------------------------------
+    """
+    try:
+        rec_interval = {
+          "unit": unit, "skip": skip, "days": days and list(days),
+          "ordinal": ordinal and list(ordinal),
+          "dates": dates and list(dates)}
+        return tuple(wl_recur.date_list(
+          wl_recur.date_array(start, rec_interval, end_date)))
+    except Exception as err:
+        _z_exc("wl_series.py/_cached_dates", err)
+    # end try
+# end function
+
+
+def _dates(parent):
+    """
+        Gets the dates produced by a series' rule.
+
+        Arguments:
+        - parent -- the parent entry of the series.
+
+        Returns:  a tuple of dates, in order (including any exceptions).
+       -----------------------------------------------------------------
+    """
+    try:
+        rule = parent.rec_interval
+        return _cached_dates(
+          parent.date, rule["unit"], rule["skip"],
+          rule["days"] and tuple(rule["days"]),
+          rule["ordinal"] and tuple(rule["ordinal"]),
+          rule["dates"] and tuple(rule["dates"]), rule["end"])
+    except Exception as err:
+        _z_exc("wl_series.py/_dates", err)
+    # end try
+# end function
+
+
+def _occurrance(parent, n, date):
+    """
+        Creates one occurrance of a series.
+
+        Arguments:
+        - parent -- the parent entry of the series.
+        - n -- the number of the occurrance.
+        - date -- the date of the occurrance.
+
+        Returns:  a log entry object for the occurrance.
+       -----------------------------------------------------------------
+    """
+    try:
+        entry = logentry.LogEntry()
+        entry.id = -((parent.id + 1) * MAX_OCCURRANCES + n)
+        entry.title = parent.title
+        entry.date = date
+        entry.time = parent.time
+        entry.datetime = datetime.datetime.combine(date, parent.time)
+        entry.duration = parent.duration
+        entry.notes = parent.notes
+        entry.recurring = False
+        entry.rec_child_seq = (n, parent.rec_total)
+        entry.rec_parent = parent.id
+        return entry
+    except Exception as err:
+        _z_exc("wl_series.py/_occurrance", err)
+    # end try
+# end function
+
+
+def _parents(wl_obj):
+    """
+        Gets the parent entries of all of the work log's series.
+
+        Arguments:
+        - wl_obj -- the work log object.
+
+        Returns:  a list of log entry objects.
+       -----------------------------------------------------------------
+    """
+    try:
+        return_list = []
+        for parent_id in wl_obj.series:
+            parent = wl_search.lookup_entry_by_id(wl_obj, parent_id)
+            if parent and is_series(parent):
+                return_list.append(parent)
+            # end if
+        # end for
+        return return_list
+    except Exception as err:
+        _z_exc("wl_series.py/_parents", err)
+    # end try
+# end function
+
+
+def _split_id(entry_id):
+    """
+        Splits an occurrance's ID into its parent's ID and its number.
+
+        Arguments:
+        - entry_id -- the (negative) ID of the occurrance.
+
+        Returns:  a tuple containing the parent's ID and the number of
+         the occurrance.
+       -----------------------------------------------------------------
+    """
+    try:
+        parent_id, n = divmod(-entry_id, MAX_OCCURRANCES)
+        return parent_id - 1, n
+    except Exception as err:
+        _z_exc("wl_series.py/_split_id", err)
+    # end try
+# end function
+
+
+def _store(wl_obj, occ, sort=True):
+    """
+        Adds a copy of an occurrance to the work log, with its own ID.
+
+        Arguments:
+        - wl_obj -- the work log object.
+        - occ -- the occurrance.
+
+        Keyword Arguments:
+        - sort -- keep the sort lists in order (default True).  If
+           False, the entry is appended to the sort lists, which the
+           caller must then sort.
+
+        Returns:  the stored entry.
+       -----------------------------------------------------------------
+    """
+    try:
+        entry = logentry.LogEntry()
+        entry.id = wl_ids.allocate(wl_obj)
+        for attr in [
+          "title", "date", "time", "datetime", "duration", "notes",
+          "recurring", "rec_child_seq", "rec_parent"]:
+            setattr(entry, attr, getattr(occ, attr))
+        # end for
+        if sort:
+            bisect.insort(
+              wl_obj.sorts[TITLE_SORT],
+              (entry.title, entry.datetime, entry.id))
+            bisect.insort(
+              wl_obj.sorts[DATE_SORT],
+              (entry.datetime, entry.title, entry.id))
+        else:
+            wl_obj.sorts[TITLE_SORT].append(
+              (entry.title, entry.datetime, entry.id))
+            wl_obj.sorts[DATE_SORT].append(
+              (entry.datetime, entry.title, entry.id))
+        # end if
+        wl_obj.entries.append(entry)
+        wl_obj.mark_dirty(entry)
+        return entry
+    except Exception as err:
+        _z_exc("wl_series.py/_store", err)
+    # end try
+# end function
@@ -0,0 +1,894 @@
+"""
+    Contains functions and a class to store a work log in monthly shards.
+
+    A sharded log is made up of a manifest file (with a .wlm extension)
+     and a directory of shard files, one csv file for each month which
+     has entries.  The manifest holds the work log's info, the number
+     of entries in each shard, the range of IDs in each shard and the
+     longest task in each shard.  Shards are only read when the entries
+     in them are needed (so an entry looked up by its ID only needs the
+     shards whose ranges hold it), and only the shards which have
+     changed are written when the log is saved.
+
+    Class Definitions:
+    - ShardedEntryList -- a list of log entries stored in monthly
+       shards.
+
+    Public Functions:
+    - create_log -- creates a new, empty sharded log.
+    - is_sharded -- checks whether a filename names a sharded log.
+    - month_key -- returns the shard key for a date.
+    - open_log -- reads a sharded log's manifest.
+    - save_log -- writes the changed shards and the manifest.
+
+    Private Functions:
+    - _month_end -- returns the end of a shard's month.
+    - _shard_dir -- returns the name of a log's shard directory.
+    - _write_manifest -- writes a sharded log's manifest.
+    - _z_exc -- generic exception handler.
+   ---------------------------------------------------------------------
+"""
+
+
+# Import sys.
+import sys
+
+
+def _z_exc(loc, err):
+    """
+        Catch-all exception handler.
+
+        Arguments:
+        - loc -- string naming the module/function/method in which the
+           exception occurred.
+        - err -- the exception string.
+
+        Returns:  nothing (exits program).
+       -----------------------------------------------------------------
+    """
+    # Print error information.
+    print("An interal error occurred in " + loc + ": ", err)
+    # Exit.
+    sys.exit(
+      "Please report the above error and the circumstances which caused it " +
+      "to the developer.")
+    return  # Superfluous return.
+# end function
+
+
+# Other imports.
+try:
+    import collections.abc
+    import datetime
+    import os
+
+    import io_utils
+    import logentry
+    import wl_pool
+except Exception as err:
+    _z_exc("wl_shard.py/module imports", err)
+# end try
+
+
+# Constants.
+EXTENSION = "wlm"
+SHARD_SUFFIX = ".shards"
+TITLE_SORT = 0
+DATE_SORT = 1
+FIELDNAMES = logentry.LogEntry.FIELDNAMES
+
+
+class ShardedEntryList(collections.abc.MutableSequence):
+    """
+        A list of log entries, stored in monthly shards.
+
+        The list holds the entries from the shards which have been
+         loaded; its length also counts the entries in the shards which
+         have not.  Accessing a position beyond the loaded entries loads
+         every shard.  Loaded entries are added to the work log's sort
+         indexes.
+
+        Attributes:
+        - filename -- the name of the manifest file.
+        - counts -- the number of entries in each shard, by month key.
+        - shard_ranges -- the lowest and highest IDs in each shard as
+           last saved, by month key; or None if the manifest was written
+           before the ranges were kept.
+        - shard_longest -- the duration of the longest task in each
+           shard as last saved, in seconds, by month key; or None if the
+           manifest was written before the durations were kept.
+        - failed -- the number of rows which could not be read.
+        - on_load -- a function called with the entries of each shard
+           as it is loaded, or None.
+
+        Public Methods:
+        - index -- finds the position of an entry.
+        - insert -- inserts an entry, loading its shard first.
+        - load_all -- loads every shard.
+        - load_range -- loads the shards covering a range of dates.
+        - load_window -- loads the shards which may hold tasks
+           overlapping a span of time.
+        - loaded -- returns the entries which have been loaded.
+        - lookup -- finds an entry by its ID.
+        - mark_changed -- records that an entry has been edited.
+        - mark_saved -- records that the changed shards have been
+           written.
+        - shard_rows -- returns the rows to write for the changed
+           shards.
+
+        Private Methods:
+        - _id_months -- finds the shards which may have held an entry
+           when the log was last saved.
+        - _load -- loads one shard.
+        - _position -- converts an index into a position in the loaded
+           entries.
+
+        Magic Methods:
+        - __init__ -- creates the list from a manifest.
+        - __delitem__, __getitem__, __len__, __setitem__ -- the
+           sequence protocol.
+       -----------------------------------------------------------------
+    """
+
+    def __init__(
+      self, fname, counts, sorts, pool=None, shard_ranges=None,
+      shard_longest=None):
+        """
+            Creates the list from a manifest.
+
+            Arguments:
+            - fname -- the name of the manifest file.
+            - counts -- the number of entries in each shard, by month
+               key.
+            - sorts -- the work log's sort indexes, which are updated
+               when shards are loaded.
+
+            Keyword Arguments:
+            - pool -- the work log's string pool, which the strings of
+               loaded entries are shared through (default None, for a
+               pool of the list's own).
+            - shard_ranges -- the lowest and highest IDs in each shard,
+               by month key (default None, if they are not known).
+            - shard_longest -- the duration of the longest task in each
+               shard in seconds, by month key (default None, if they are
+               not known).
+           -------------------------------------------------------------
+        """
+        self.filename = fname
+        self.counts = dict(counts)
+        self.shard_ranges = None
+        if shard_ranges is not None:
+            self.shard_ranges = {
+              month: tuple(ids) for month, ids in shard_ranges.items()}
+        # end if
+        self.shard_longest = None
+        if shard_longest is not None:
+            self.shard_longest = dict(shard_longest)
+        # end if
+        self.failed = 0
+        self.on_load = None
+        self._sorts = sorts
+        if pool is None:
+            pool = wl_pool.StringPool()
+        # end if
+        self._pool = pool
+        self._loaded_months = set()
+        self._dirty_months = set()
+        self._entries = []
+        self._ids = {}
+        self._months = {}
+    # end method
+
+    def __delitem__(self, ndx):
+        """Deletes an entry from the list."""
+        try:
+            if type(ndx) == slice:
+                for n in sorted(range(*ndx.indices(len(self))), reverse=True):
+                    del self[n]
+                # end for
+                return
+            # end if
+            ndx = self._position(ndx)
+            entry = self._entries.pop(ndx)
+            self._ids.pop(entry.id, None)
+            self._dirty_months.add(self._months.pop(entry.id, None))
+            self._dirty_months.add(month_key(entry.date))
+            return
+        except IndexError:
+            raise
+        except Exception as err:
+            _z_exc("wl_shard.py/ShardedEntryList/__delitem__", err)
+        # end try
+    # end method
+
+    def __getitem__(self, ndx):
+        """Returns an entry, loading every shard if necessary."""
+        try:
+            if type(ndx) == slice:
+                return [self[n] for n in range(*ndx.indices(len(self)))]
+            # end if
+            return self._entries[self._position(ndx)]
+        except IndexError:
+            raise
+        except Exception as err:
+            _z_exc("wl_shard.py/ShardedEntryList/__getitem__", err)
+        # end try
+    # end method
+
+    def __len__(self):
+        """Returns the number of entries, loaded or not."""
+        unloaded = 0
+        for month, count in self.counts.items():
+            if month not in self._loaded_months:
+                unloaded += count
+            # end if
+        # end for
+        return len(self._entries) + unloaded
+    # end method
+
+    def __setitem__(self, ndx, entry):
+        """Replaces an entry in the list."""
+        try:
+            del self[ndx]
+            self.insert(ndx, entry)
+            return
+        except IndexError:
+            raise
+        except Exception as err:
+            _z_exc("wl_shard.py/ShardedEntryList/__setitem__", err)
+        # end try
+    # end method
+
+    def index(self, entry, start=0, stop=None):
+        """
+            Finds the position of an entry.
+
+            Arguments:
+            - entry -- the entry to find.
+
+            Keyword Arguments:
+            - start, stop -- the range of positions to search.
+
+            Returns:  the position of the entry.
+           -------------------------------------------------------------
+        """
+        try:
+            for n, item in enumerate(self._entries):
+                if item is entry:
+                    return n
+                # end if
+            # end for
+            raise ValueError("entry is not in list")
+        except ValueError:
+            raise
+        except Exception as err:
+            _z_exc("wl_shard.py/ShardedEntryList/index", err)
+        # end try
+    # end method
+
+    def insert(self, ndx, entry):
+        """
+            Inserts an entry, loading its shard first.
+
+            The shard must be loaded so that its other entries are not
+             lost when it is saved.
+
+            Arguments:
+            - ndx -- the position at which to insert the entry.
+            - entry -- the entry to insert.
+
+            Returns:  nothing.
+           -------------------------------------------------------------
+        """
+        try:
+            month = month_key(entry.date)
+            self._load(month)
+            self._entries.insert(min(ndx, len(self._entries)), entry)
+            self._ids[entry.id] = entry
+            self._months[entry.id] = month
+            self._dirty_months.add(month)
+            return
+        except Exception as err:
+            _z_exc("wl_shard.py/ShardedEntryList/insert", err)
+        # end try
+    # end method
+
+    def load_all(self):
+        """
+            Loads every shard.
+
+            Arguments:  none.
+
+            Returns:  nothing.
+           -------------------------------------------------------------
+        """
+        try:
+            for month in sorted(self.counts):
+                self._load(month, resort=False)
+            # end for
+            self._sorts[TITLE_SORT].sort()
+            self._sorts[DATE_SORT].sort()
+            return
+        except Exception as err:
+            _z_exc("wl_shard.py/ShardedEntryList/load_all", err)
+        # end try
+    # end method
+
+    def load_range(self, start_date, end_date):
+        """
+            Loads the shards covering a range of dates.
+
+            Arguments:
+            - start_date -- the first date (or datetime) in the range.
+            - end_date -- the last date (or datetime) in the range.
+
+            Returns:  nothing.
+           -------------------------------------------------------------
+        """
+        try:
+            first = month_key(start_date)
+            last = month_key(end_date)
+            for month in sorted(self.counts):
+                if first <= month <= last:
+                    self._load(month, resort=False)
+                # end if
+            # end for
+            self._sorts[TITLE_SORT].sort()
+            self._sorts[DATE_SORT].sort()
+            return
+        except Exception as err:
+            _z_exc("wl_shard.py/ShardedEntryList/load_range", err)
+        # end try
+    # end method
+
+    def load_window(self, start, end):
+        """
+            Loads the shards which may hold tasks overlapping a span of
+             time.
+
+            A task which starts before the span can still overlap it, so
+             a shard is loaded if its month starts before the end of the
+             span and its longest task, started at the end of the month,
+             would reach the start of the span.  A shard whose longest
+             task is not known is loaded if its month starts before the
+             end of the span.
+
+            Arguments:
+            - start -- the datetime at which the span starts.
+            - end -- the datetime at which the span ends.
+
+            Returns:  nothing.
+           -------------------------------------------------------------
+        """
+        try:
+            last = month_key(end)
+            for month in sorted(self.counts):
+                if month > last:
+                    break
+                # end if
+                longest = None
+                if self.shard_longest is not None:
+                    longest = self.shard_longest.get(month)
+                # end if
+                if longest is None or (
+                  _month_end(month) + datetime.timedelta(seconds=longest) >
+                  start):
+                    self._load(month, resort=False)
+                # end if
+            # end for
+            self._sorts[TITLE_SORT].sort()
+            self._sorts[DATE_SORT].sort()
+            return
+        except Exception as err:
+            _z_exc("wl_shard.py/ShardedEntryList/load_window", err)
+        # end try
+    # end method
+
+    def loaded(self):
+        """
+            Returns the entries which have been loaded.
+
+            Arguments:  none.
+
+            Returns:  a list of the loaded entries.
+           -------------------------------------------------------------
+        """
+        return list(self._entries)
+    # end method
+
+    def lookup(self, entry_id):
+        """
+            Finds an entry by its ID.
+
+            If the entry has not been loaded, the shards whose ranges of
+             IDs hold it are loaded one at a time until it is found.
+             Every shard is loaded if the manifest does not hold the
+             ranges.
+
+            Arguments:
+            - entry_id -- the ID of the entry to find.
+
+            Returns:  the entry, or None if there is no match.
+           -------------------------------------------------------------
+        """
+        try:
+            if entry_id not in self._ids:
+                if self.shard_ranges is None:
+                    self.load_all()
+                else:
+                    for month in self._id_months(entry_id):
+                        self._load(month)
+                        if entry_id in self._ids:
+                            break
+                        # end if
+                    # end for
+                # end if
+            # end if
+            return self._ids.get(entry_id)
+        except Exception as err:
+            _z_exc("wl_shard.py/ShardedEntryList/lookup", err)
+        # end try
+    # end method
+
+    def mark_changed(self, entry):
+        """
+            Records that an entry has been edited.
+
+            Arguments:
+            - entry -- the entry.
+
+            Returns:  nothing.
+           -------------------------------------------------------------
+        """
+        try:
+            self._dirty_months.add(month_key(entry.date))
+            return
+        except Exception as err:
+            _z_exc("wl_shard.py/ShardedEntryList/mark_changed", err)
+        # end try
+    # end method
+
+    def mark_saved(self, written):
+        """
+            Records that the changed shards have been written.
+
+            Arguments:
+            - written -- the number of entries written to each shard,
+               by month key.
+
+            Returns:  nothing.
+           -------------------------------------------------------------
+        """
+        try:
+            self.counts.update(written)
+            # Shards with no entries are dropped from the manifest.
+            self.counts = {
+              month: count for month, count in self.counts.items() if count}
+            # The ranges of IDs and longest tasks of the shards which
+            #  were written are taken from their entries.  A manifest
+            #  without them gets them once every shard has been loaded.
+            if self._loaded_months >= set(self.counts):
+                if self.shard_ranges is None:
+                    self.shard_ranges = {}
+                    written = self.counts
+                # end if
+                if self.shard_longest is None:
+                    self.shard_longest = {}
+                    written = self.counts
+                # end if
+            # end if
+            if self.shard_longest is not None:
+                for month in written:
+                    self.shard_longest[month] = 0
+                # end for
+                for entry in self._entries:
+                    month = self._months[entry.id]
+                    if month in written and (
+                      type(entry.duration) == datetime.timedelta):
+                        # Rounded up, so that no overlap is missed.
+                        self.shard_longest[month] = max(
+                          self.shard_longest[month],
+                          -int(-entry.duration.total_seconds() // 1))
+                    # end if
+                # end for
+                self.shard_longest = {
+                  month: seconds for month, seconds
+                  in self.shard_longest.items() if month in self.counts}
+            # end if
+            if self.shard_ranges is not None:
+                for month in written:
+                    self.shard_ranges.pop(month, None)
+                # end for
+                for entry in self._entries:
+                    month = self._months[entry.id]
+                    if month in written:
+                        low, high = self.shard_ranges.get(
+                          month, (entry.id, entry.id))
+                        self.shard_ranges[month] = (
+                          min(low, entry.id), max(high, entry.id))
+                    # end if
+                # end for
+            # end if
+            self._dirty_months.clear()
+            return
+        except Exception as err:
+            _z_exc("wl_shard.py/ShardedEntryList/mark_saved", err)
+        # end try
+    # end method
+
+    def shard_rows(self):
+        """
+            Returns the rows to write for the changed shards.
+
+            Arguments:  none.
+
+            Returns:  a dictionary of lists of entry dictionaries, by
+             month key.  A shard with no entries has an empty list.
+           -------------------------------------------------------------
+        """
+        try:
+            # An entry whose date has been edited may have moved to a
+            #  different month, which changes both shards.
+            for entry in self._entries:
+                month = month_key(entry.date)
+                if self._months.get(entry.id) != month:
+                    self._dirty_months.add(self._months.get(entry.id))
+                    self._dirty_months.add(month)
+                    self._months[entry.id] = month
+                # end if
+            # end for
+            self._dirty_months.discard(None)
+            shards = {month: [] for month in self._dirty_months}
+            for entry in self._entries:
+                if self._months[entry.id] in shards:
+                    shards[self._months[entry.id]].append(entry.to_dict())
+                # end if
+            # end for
+            return shards
+        except Exception as err:
+            _z_exc("wl_shard.py/ShardedEntryList/shard_rows", err)
+        # end try
+    # end method
+
+    def _id_months(self, entry_id):
+        """
+            Finds the shards which may have held an entry when the log
+             was last saved.
+
+            Arguments:
+            - entry_id -- the ID of the entry.
+
+            Returns:  a list of the month keys of the shards which have
+             not been loaded and whose ranges of IDs hold the ID.
+           -------------------------------------------------------------
+        """
+        try:
+            return [
+              month for month, (low, high) in sorted(self.shard_ranges.items())
+              if low <= entry_id <= high and month not in self._loaded_months]
+        except Exception as err:
+            _z_exc("wl_shard.py/ShardedEntryList/_id_months", err)
+        # end try
+    # end method
+
+    def _load(self, month, resort=True):
+        """
+            Loads one shard.
+
+            Arguments:
+            - month -- the month key of the shard.
+
+            Keyword Arguments:
+            - resort -- flag to sort the indexes after adding the
+               shard's entries (default True).
+
+            Returns:  nothing.
+           -------------------------------------------------------------
+        """
+        try:
+            if month in self._loaded_months:
+                return
+            # end if
+            self._loaded_months.add(month)
+            fname = os.path.join(_shard_dir(self.filename), month + ".csv")
+            # A month with no shard file has no entries yet.
+            if month not in self.counts or not os.path.isfile(fname):
+                self.counts[month] = 0
+                return
+            # end if
+            first = len(self._entries)
+            for row in io_utils.file_read(fname, filetype="csv"):
+                entry = logentry.LogEntry()
+                if not entry.from_dict(row):
+                    self.failed += 1
+                    continue
+                # end if
+                self._pool.intern_entry(entry)
+                self._entries.append(entry)
+                self._ids[entry.id] = entry
+                self._months[entry.id] = month
+                self._sorts[TITLE_SORT].append(
+                  (entry.title, entry.datetime, entry.id))
+                self._sorts[DATE_SORT].append(
+                  (entry.datetime, entry.title, entry.id))
+            # end for
+            if self.on_load is not None:
+                self.on_load(self._entries[first:])
+            # end if
+            if resort:
+                self._sorts[TITLE_SORT].sort()
+                self._sorts[DATE_SORT].sort()
+            # end if
+            return
+        except Exception as err:
+            _z_exc("wl_shard.py/ShardedEntryList/_load", err)
+        # end try
+    # end method
+
+    def _position(self, ndx):
+        """
+            Converts an index into a position in the loaded entries.
+
+            If the index is beyond the loaded entries, every shard is
+             loaded.
+
+            Arguments:
+            - ndx -- the index.
+
+            Returns:  the position.
+           -------------------------------------------------------------
+        """
+        if ndx < 0:
+            ndx += len(self)
+        # end if
+        if ndx >= len(self._entries):
+            self.load_all()
+        # end if
+        if not 0 <= ndx < len(self._entries):
+            raise IndexError("list index out of range")
+        # end if
+        return ndx
+    # end method
+# end class
+
+
+def create_log(fname, line_length=80):
+    """
+        Creates a new, empty sharded log.
+
+        Arguments:
+        - fname -- the name of the manifest file.
+
+        Keyword Arguments:
+        - line_length -- the width of the screen in characters (default
+           80).
+
+        Returns:  True if successful, else False.
+       -----------------------------------------------------------------
+    """
+    try:
+        shard_dir = _shard_dir(fname)
+        try:
+            os.makedirs(shard_dir, exist_ok=True)
+            # Replacing an existing log removes its shards.
+            for shard in os.listdir(shard_dir):
+                if shard.endswith(".csv"):
+                    os.remove(os.path.join(shard_dir, shard))
+                # end if
+            # end for
+        except OSError as err:
+            io_utils.print_status(
+              "Error",
+              f"An error occured while creating the shard directory:  {err}",
+              line_length=line_length)
+            return False
+        # end try
+        return True
+    except Exception as err:
+        _z_exc("wl_shard.py/create_log", err)
+    # end try
+# end function
+
+
+def is_sharded(fname):
+    """
+        Checks whether a filename names a sharded log's manifest.
+
+        Arguments:
+        - fname -- the filename to check.
+
+        Returns:  True if the file is (or would be) a manifest, else
+         False.
+       -----------------------------------------------------------------
+    """
+    try:
+        return fname.lower().endswith("." + EXTENSION)
+    except Exception as err:
+        _z_exc("wl_shard.py/is_sharded", err)
+    # end try
+# end function
+
+
+def month_key(date):
+    """
+        Returns the shard key for a date.
+
+        Arguments:
+        - date -- a date or datetime object.
+
+        Returns:  a string in the form "YYYY-MM".
+       -----------------------------------------------------------------
+    """
+    return f"{date.year:04}-{date.month:02}"
+# end function
+
+
+def open_log(fname, sorts, line_length=80, pool=None):
+    """
+        Reads a sharded log's manifest.
+
+        Arguments:
+        - fname -- the name of the manifest file.
+        - sorts -- the work log's sort indexes.
+
+        Keyword Arguments:
+        - line_length -- the width of the screen in characters (default
+           80).
+        - pool -- the work log's string pool (default None).
+
+        Returns:  the dictionary holding the work log's info and a
+         ShardedEntryList; or None and None if the manifest could not be
+         read.
+       -----------------------------------------------------------------
+    """
+    try:
+        data_list = io_utils.file_read(
+          fname, filetype="csv", line_length=line_length)
+        if not data_list:
+            return None, None
+        # end if
+        header = data_list[0]
+        # Read the shard counts from the info field.
+        info = logentry.LogEntry()
+        info.from_dict(dict(header))
+        counts = {}
+        shard_ranges = None
+        shard_longest = None
+        if type(info.info) == dict:
+            counts = info.info.get("shards") or {}
+            # Manifests written by earlier versions have no ranges of IDs
+            #  or durations.
+            shard_ranges = info.info.get("shard_ranges")
+            shard_longest = info.info.get("shard_longest")
+        # end if
+        return header, ShardedEntryList(
+          fname, counts, sorts, pool=pool, shard_ranges=shard_ranges,
+          shard_longest=shard_longest)
+    except Exception as err:
+        _z_exc("wl_shard.py/open_log", err)
+    # end try
+# end function
+
+
+def save_log(entries, info, line_length=80):
+    """
+        Writes the changed shards and the manifest.
+
+        Arguments:
+        - entries -- the log's ShardedEntryList.
+        - info -- the work log's info dictionary.
+
+        Keyword Arguments:
+        - line_length -- the width of the screen in characters (default
+           80).
+
+        Returns:  True if successful, else False.
+       -----------------------------------------------------------------
+    """
+    try:
+        shard_dir = _shard_dir(entries.filename)
+        try:
+            os.makedirs(shard_dir, exist_ok=True)
+        except OSError as err:
+            io_utils.print_status(
+              "Warning", f"Error writing log shards:  {err}",
+              line_length=line_length)
+            return False
+        # end try
+        written = {}
+        for month, rows in entries.shard_rows().items():
+            fname = os.path.join(shard_dir, month + ".csv")
+            if rows:
+                if not io_utils.file_write(
+                  fname, "csv", rows, fieldnames=FIELDNAMES,
+                  line_length=line_length):
+                    return False
+                # end if
+            elif os.path.isfile(fname):
+                os.remove(fname)
+            # end if
+            written[month] = len(rows)
+        # end for
+        entries.mark_saved(written)
+        return _write_manifest(
+          entries.filename, info, entries.counts, entries.shard_ranges,
+          entries.shard_longest, line_length=line_length)
+    except Exception as err:
+        _z_exc("wl_shard.py/save_log", err)
+    # end try
+# end function
+
+
+def _month_end(month):
+    """
+        Returns the end of a shard's month.
+
+        Arguments:
+        - month -- the month key of the shard.
+
+        Returns:  the datetime at which the next month starts.
+       -----------------------------------------------------------------
+    """
+    year, month = (int(part) for part in month.split("-"))
+    if month == 12:
+        return datetime.datetime(year + 1, 1, 1)
+    # end if
+    return datetime.datetime(year, month + 1, 1)
+# end function
+
+
+def _shard_dir(fname):
+    """
+        Returns the name of a log's shard directory.
+
+        Arguments:
+        - fname -- the name of the manifest file.
+
+        Returns:  the directory name.
+       -----------------------------------------------------------------
+    """
+    return fname[:-len(EXTENSION) - 1] + SHARD_SUFFIX
+# end function
+
+
+def _write_manifest(
+  fname, info, counts, shard_ranges, shard_longest, line_length=80):
+    """
+        Writes a sharded log's manifest.
+
+        Arguments:
+        - fname -- the name of the manifest file.
+        - info -- the work log's info dictionary.
+        - counts -- the number of entries in each shard, by month key.
+        - shard_ranges -- the lowest and highest IDs in each shard, by
+           month key, or None if they are not known.
+        - shard_longest -- the duration of the longest task in each
+           shard in seconds, by month key, or None if they are not
+           known.
+
+        Keyword Arguments:
+        - line_length -- the width of the screen in characters (default
+           80).
+
+        Returns:  True if successful, else False.
+       -----------------------------------------------------------------
+    """
+    try:
+        header = logentry.LogEntry()
+        header.info = dict(info)
+        header.info["shards"] = dict(sorted(counts.items()))
+        if shard_ranges is not None:
+            header.info["shard_ranges"] = {
+              month: list(ids) for month, ids in sorted(shard_ranges.items())}
+        # end if
+        if shard_longest is not None:
+            header.info["shard_longest"] = dict(
+              sorted(shard_longest.items()))
+        # end if
+        return io_utils.file_write(
+          fname, "csv", [header.to_dict()], fieldnames=FIELDNAMES,
+          line_length=line_length)
+    except Exception as err:
+        _z_exc("wl_shard.py/_write_manifest", err)
+    # end try
+# end function
@@ -0,0 +1,446 @@
+"""
+    Contains functions to store a work log in an SQLite database.
+
+    The database holds the same strings that are written to a work log's
+     csv file, so that logs can be moved between the two formats without
+     losing anything.  Additional columns hold the values that are
+     indexed for searching.
+
+    Public Functions:
+    - db_create -- creates a new, empty work log database.
+    - db_read -- reads the contents of a work log database.
+    - db_save -- writes changed entries to a work log database.
+    - export_csv -- copies a work log database to a csv file.
+    - find_ids_by_date -- finds the IDs of all entries matching a
+       datetime or range of datetimes.
+    - find_ids_by_duration -- finds the IDs of all entries matching a
+       duration or range of durations.
+    - import_csv -- copies a work log csv file to a database.
+    - is_db -- checks whether a filename names a work log database.
+
+    Private Functions:
+    - _connect -- opens a connection to a database.
+    - _duration_seconds -- converts a duration string to seconds.
+    - _write_entries -- inserts or updates a set of entry rows.
+    - _write_header -- replaces the row holding the work log's info.
+    - _z_exc -- generic exception handler.
+   ---------------------------------------------------------------------
+"""
+
+
+# Import sys.
+import sys
+
+
+def _z_exc(loc, err):
+    """
+        Catch-all exception handler.
+
+        Arguments:
+        - loc -- string naming the module/function/method in which the
+           exception occurred.
+        - err -- the exception string.
+
+        Returns:  nothing (exits program).
+       -----------------------------------------------------------------
+    """
+    # Print error information.
+    print("An interal error occurred in " + loc + ": ", err)
+    # Exit.
+    sys.exit(
+      "Please report the above error and the circumstances which caused it " +
+      "to the developer.")
+    return  # Superfluous return.
+# end function
+
+
+# Other imports.
+try:
+    import contextlib
+    import os
+    import sqlite3
+
+    import io_utils
+    import logentry
+    import str_utils
+except Exception as err:
+    _z_exc("wl_sqlite.py/module imports", err)
+# end try
+
+
+# Constants.
+EXTENSION = "db"
+FIELDNAMES = logentry.LogEntry.FIELDNAMES
+# The entries table has one text column for each field, plus a column
+#  to preserve the order of the rows and a numeric copy of the duration
+#  (duration strings do not sort correctly).
+SCHEMA = (
+  "CREATE TABLE IF NOT EXISTS header (" +
+  ", ".join(f"{f} TEXT" for f in FIELDNAMES) + ");" +
+  "CREATE TABLE IF NOT EXISTS entries (" +
+  ", ".join(
+    f"{f} TEXT PRIMARY KEY" if f == "id" else f"{f} TEXT"
+    for f in FIELDNAMES) +
+  ", seq INTEGER, duration_sec REAL);" +
+  "CREATE INDEX IF NOT EXISTS ndx_datetime ON entries (datetime, title);" +
+  "CREATE INDEX IF NOT EXISTS ndx_title ON entries (title, datetime);" +
+  "CREATE INDEX IF NOT EXISTS ndx_duration ON entries (duration_sec);" +
+  "CREATE INDEX IF NOT EXISTS ndx_rec_parent ON entries (rec_parent);")
+
+
+def db_create(fname, line_length=80):
+    """
+        Creates a new work log database, replacing any existing file.
+
+        Arguments:
+        - fname -- the name of the database file.
+
+        Keyword Arguments:
+        - line_length -- the width of the screen in characters (default
+           80).
+
+        Returns:  True if successful, else False.
+       -----------------------------------------------------------------
+    """
+    try:
+        # Any existing file (including the test file written when the
+        #  filename was chosen) is replaced.
+        if os.path.isfile(fname):
+            os.remove(fname)
+        # end if
+        with _connect(fname) as conn:
+            conn.executescript(SCHEMA)
+        # end with
+        return True
+    except (OSError, sqlite3.Error) as err:
+        io_utils.print_status(
+          "Error", f"An error occured while creating the database:  {err}",
+          line_length=line_length)
+        return False
+    # end try
+# end function
+
+
+def db_read(fname, line_length=80):
+    """
+        Reads the contents of a work log database.
+
+        Arguments:
+        - fname -- the name of the database file.
+
+        Keyword Arguments:
+        - line_length -- the width of the screen in characters (default
+           80).
+
+        Returns:  a list of dictionaries, in the same form as a work log
+         csv file read by io_utils.file_read (the first dictionary holds
+         the work log's info); an empty list if the read failed.
+       -----------------------------------------------------------------
+    """
+    try:
+        columns = ", ".join(FIELDNAMES)
+        with _connect(fname) as conn:
+            header = conn.execute(f"SELECT {columns} FROM header").fetchall()
+            rows = conn.execute(
+              f"SELECT {columns} FROM entries ORDER BY seq").fetchall()
+        # end with
+        # A database without a header row is not a valid work log.
+        if not header:
+            return []
+        # end if
+        data_list = [dict(zip(FIELDNAMES, header[0]))]
+        for row in rows:
+            data_list.append(dict(zip(FIELDNAMES, row)))
+        # end for
+        return data_list
+    except sqlite3.Error as err:
+        io_utils.print_status(
+          "Error", f"An error occured while reading the database:  {err}",
+          line_length=line_length)
+        return []
+    # end try
+# end function
+
+
+def db_save(fname, header, changed, deleted, line_length=80):
+    """
+        Writes changes to a work log database.
+
+        Only the entries that have been added, edited or deleted since
+         the database was last read or saved are written.
+
+        Arguments:
+        - fname -- the name of the database file.
+        - header -- a dictionary holding the work log's info.
+        - changed -- a list of dictionaries, one for each entry that has
+           been added or edited.
+        - deleted -- the IDs of the entries that have been deleted.
+
+        Keyword Arguments:
+        - line_length -- the width of the screen in characters (default
+           80).
+
+        Returns:  True if successful, else False.
+       -----------------------------------------------------------------
+    """
+    try:
+        with _connect(fname) as conn:
+            # The with block commits all of the changes at once, or
+            #  none of them if there is an error.
+            with conn:
+                conn.executescript(SCHEMA)
+                _write_header(conn, header)
+                conn.executemany(
+                  "DELETE FROM entries WHERE id = ?",
+                  [(str(entry_id),) for entry_id in deleted])
+                _write_entries(conn, changed)
+            # end with
+        # end with
+        return True
+    except sqlite3.Error as err:
+        io_utils.print_status(
+          "Warning", f"Error writing log database:  {err}",
+          line_length=line_length)
+        return False
+    # end try
+# end function
+
+
+def export_csv(db_fname, csv_fname, line_length=80):
+    """
+        Copies a work log database to a csv file.
+
+        Arguments:
+        - db_fname -- the name of the database file to read.
+        - csv_fname -- the name of the csv file to write.
+
+        Keyword Arguments:
+        - line_length -- the width of the screen in characters (default
+           80).
+
+        Returns:  True if successful, else False.
+       -----------------------------------------------------------------
+    """
+    try:
+        data_list = db_read(db_fname, line_length=line_length)
+        if not data_list:
+            return False
+        # end if
+        return io_utils.file_write(
+          csv_fname, "csv", data_list, fieldnames=FIELDNAMES,
+          line_length=line_length)
+    except Exception as err:
+        _z_exc("wl_sqlite.py/export_csv", err)
+    # end try
+# end function
+
+
+def find_ids_by_date(fname, start_date, end_date):
+    """
+        Finds entries matching a date/time or range of date/times.
+
+        Arguments:
+        - fname -- the name of the database file.
+        - start_date -- the starting date/time to search.
+        - end_date -- the ending date/time to search.
+
+        Returns:  a list of matching entry IDs, in date order.
+       -----------------------------------------------------------------
+    """
+    try:
+        # Datetimes are stored in ISO format, so they can be compared
+        #  as strings.
+        with _connect(fname) as conn:
+            rows = conn.execute(
+              "SELECT id FROM entries WHERE datetime BETWEEN ? AND ? " +
+              "ORDER BY datetime, title",
+              (str(start_date), str(end_date))).fetchall()
+        # end with
+        return [int(row[0]) for row in rows]
+    except Exception as err:
+        _z_exc("wl_sqlite.py/find_ids_by_date", err)
+    # end try
+# end function
+
+
+def find_ids_by_duration(fname, min_duration, max_duration):
+    """
+        Finds entries matching a duration or range of durations.
+
+        Arguments:
+        - fname -- the name of the database file.
+        - min_duration -- the minimum duration to search.
+        - max_duration -- the maximum duration to search.
+
+        Returns:  a list of matching entry IDs, in date order.
+       -----------------------------------------------------------------
+    """
+    try:
+        with _connect(fname) as conn:
+            rows = conn.execute(
+              "SELECT id FROM entries WHERE duration_sec BETWEEN ? AND ? " +
+              "ORDER BY datetime, title",
+              (min_duration.total_seconds(),
+               max_duration.total_seconds())).fetchall()
+        # end with
+        return [int(row[0]) for row in rows]
+    except Exception as err:
+        _z_exc("wl_sqlite.py/find_ids_by_duration", err)
+    # end try
+# end function
+
+
+def import_csv(csv_fname, db_fname, line_length=80):
+    """
+        Copies a work log csv file to a database.
+
+        Arguments:
+        - csv_fname -- the name of the csv file to read.
+        - db_fname -- the name of the database file to write (any
+           existing file is replaced).
+
+        Keyword Arguments:
+        - line_length -- the width of the screen in characters (default
+           80).
+
+        Returns:  True if successful, else False.
+       -----------------------------------------------------------------
+    """
+    try:
+        data_list = io_utils.file_read(
+          csv_fname, filetype="csv", line_length=line_length)
+        if not data_list:
+            return False
+        # end if
+        if not db_create(db_fname, line_length=line_length):
+            return False
+        # end if
+        return db_save(
+          db_fname, data_list[0], data_list[1:], [], line_length=line_length)
+    except Exception as err:
+        _z_exc("wl_sqlite.py/import_csv", err)
+    # end try
+# end function
+
+
+def is_db(fname):
+    """
+        Checks whether a filename names a work log database.
+
+        Arguments:
+        - fname -- the filename to check.
+
+        Returns:  True if the file is (or would be) a database, else
+         False.
+       -----------------------------------------------------------------
+    """
+    try:
+        return fname.lower().endswith("." + EXTENSION)
+    except Exception as err:
+        _z_exc("wl_sqlite.py/is_db", err)
+    # end try
+# end function
+
+
+def _connect(fname):
+    """
+        Opens a connection to a database.
+
+        Arguments:
+        - fname -- the name of the database file.
+
+        Returns:  a context manager which closes the connection on exit.
+       -----------------------------------------------------------------
+    """
+    return contextlib.closing(sqlite3.connect(fname))
+# end function
+
+
+def _duration_seconds(string):
+    """
+        Converts the string representation of a duration to seconds.
+
+        Arguments:
+        - string -- the string to convert.
+
+        Returns:  the number of seconds as a float, or None if the
+         string does not represent a duration.
+       -----------------------------------------------------------------
+    """
+    try:
+        duration = str_utils.str_to_datetime(string)
+        if type(duration) == str:
+            return None
+        # end if
+        return duration.total_seconds()
+    except Exception as err:
+        _z_exc("wl_sqlite.py/_duration_seconds", err)
+    # end try
+# end function
+
+
+def _write_entries(conn, entry_list):
+    """
+        Inserts or updates entry rows.
+
+        New rows are placed after all existing rows; updated rows keep
+         their place.
+
+        Arguments:
+        - conn -- the database connection.
+        - entry_list -- a list of entry dictionaries.
+
+        Returns:  nothing.
+       -----------------------------------------------------------------
+    """
+    try:
+        columns = ", ".join(FIELDNAMES)
+        marks = ", ".join("?" for _ in FIELDNAMES)
+        updates = ", ".join(f"{f} = excluded.{f}" for f in FIELDNAMES)
+        seq = conn.execute(
+          "SELECT COALESCE(MAX(seq), -1) FROM entries").fetchone()[0]
+        rows = []
+        for entry in entry_list:
+            seq += 1
+            rows.append(
+              [entry[f] for f in FIELDNAMES] +
+              [seq, _duration_seconds(entry["duration"])])
+        # end for
+        conn.executemany(
+          f"INSERT INTO entries ({columns}, seq, duration_sec) " +
+          f"VALUES ({marks}, ?, ?) ON CONFLICT (id) DO UPDATE SET " +
+          f"{updates}, duration_sec = excluded.duration_sec", rows)
+        return
+    except sqlite3.Error:
+        raise
+    except Exception as err:
+        _z_exc("wl_sqlite.py/_write_entries", err)
+    # end try
+# end function
+
+
+def _write_header(conn, header):
+    """
+        Replaces the row holding the work log's info.
+
+        Arguments:
+        - conn -- the database connection.
+        - header -- a dictionary holding the work log's info.
+
+        Returns:  nothing.
+       -----------------------------------------------------------------
+    """
+    try:
+        columns = ", ".join(FIELDNAMES)
+        marks = ", ".join("?" for _ in FIELDNAMES)
+        conn.execute("DELETE FROM header")
+        conn.execute(
+          f"INSERT INTO header ({columns}) VALUES ({marks})",
+          [header[f] for f in FIELDNAMES])
+        return
+    except sqlite3.Error:
+        raise
+    except Exception as err:
+        _z_exc("wl_sqlite.py/_write_header", err)
+    # end try
+# end function
@@ -21,6 +21,7 @@
     - _edit_entry -- allows the user to edit certain values for an
        entry; if the entry is part of a recurring series, allows the
        user to apply changes to the entire series.
+    - _remove_entries -- removes a number of entries from the work log.
     - _update_entry -- makes changes to an entry as directed by the
        user; if the entry is part of a recurring series and the user so
        wishes, makes changes to all entries in the series.
@@ -64,6 +65,7 @@ try:
     import wl_add
     import wl_resource
     import wl_search
+    import wl_series
 except Exception as err:
     _z_exc("wl_viewedit.py/module imports", err)
 # end try
@@ -156,6 +158,9 @@ def browse_entries(wl_obj, entry_list, ndx=0):
                 # If the user wants to edit the current entry, call the
                 #  edit function and then loop.
                 _edit_entry(wl_obj, entry_list[ndx], ndx, len(entry_list))
+                # An occurrance of a recurring series is stored when it
+                #  is edited; show the stored entry from now on.
+                entry_list[ndx] = wl_series.refresh(wl_obj, entry_list[ndx])
                 continue
             else:
                 # If the user wants to delete the entry, confirm, and if
@@ -447,6 +452,7 @@ def _delete_entry(wl_obj, entry_list, ndx):
         # If the entry is not part of any series, just delete it.
         else:
             wl_obj.entries.remove(entry_list[ndx])
+            wl_obj.mark_dirty(entry_list[ndx], deleted=True)
             # Delete from the sort lists.
             _delete_from_sort(wl_obj, entry_list[ndx])
             # Delete the entry from the entry list.
@@ -461,71 +467,86 @@ def _delete_entry(wl_obj, entry_list, ndx):
             # Delete the entry from the entry list.
             del entry_list[ndx]
         elif action == DELETE_ALL:
-            # Set ID to match.
+            # Set ID to match (the parent's own ID if the entry is the
+            #  parent).
             del_id = entry_list[ndx].rec_parent
-            # To delete the entire series, loop through all entries and
-            #  delete those in the series, including the original.
-            for n in range(len(wl_obj.entries) - 1, -1, -1):
-                if (
-                  (wl_obj.entries[n].rec_parent == del_id) or
-                  (wl_obj.entries[n].id == del_id)):
-                    # If the entry is also in the entry list, delete it
-                    #  from the list.
-                    if wl_obj.entries[n] in entry_list:
-                        entry_list.remove(wl_obj.entries[n])
-                    # end if
-                    # Delete the entry from the sort indexes.
-                    _delete_from_sort(wl_obj, wl_obj.entries[n])
-                    # Delete the entry from the log.
-                    del wl_obj.entries[n]
+            if del_id is None:
+                del_id = entry_list[ndx].id
+            # end if
+            # To delete the entire series, find the entries in the
+            #  series, including the original, and delete them.
+            parent = wl_search.lookup_entry_by_id(wl_obj, del_id)
+            series_list = [parent] + wl_series.children(wl_obj, parent)
+            for entry in series_list:
+                # If the entry is also in the entry list, delete it from
+                #  the list.
+                if entry in entry_list:
+                    entry_list.remove(entry)
                 # end if
+                # Delete the entry from the sort indexes.
+                _delete_from_sort(wl_obj, entry)
+                wl_obj.mark_dirty(entry, deleted=True)
             # end for
+            # Delete the entries from the log.
+            _remove_entries(wl_obj, series_list)
+            # Occurrances of a rule-based series which were never stored
+            #  only need to be removed from the entry list.
+            for n in range(len(entry_list) - 1, -1, -1):
+                if entry_list[n].rec_parent == del_id:
+                    del entry_list[n]
+                # end if
+            # end for
+            wl_series.end_series(wl_obj, del_id)
         elif action == DELETE_PARENT:
+            # The occurrances of a rule-based series are created from
+            #  its parent, so they must all be stored before the parent
+            #  can be deleted.  Any in the entry list are replaced by
+            #  their stored entries.
+            stored = wl_series.materialize_all(wl_obj, entry_list[ndx])
+            for n in range(len(entry_list)):
+                if entry_list[n].id in stored:
+                    entry_list[n] = stored[entry_list[n].id]
+                # end if
+            # end for
             # When only the parent of a recurring series is deleted, the
             #  first child entry becomes the new parent, and the
             #  attributes of all the other child entries are changed to
             #  reflect that.
+            child_list = wl_series.children(wl_obj, entry_list[ndx])
             if entry_list[ndx].rec_total > 1:
-                # Go through the entries, looking for child entries.
-                for n in range(len(wl_obj.entries)):
-                    if wl_obj.entries[n].rec_parent == entry_list[ndx].id:
-                        # First child entry changes.
-                        if wl_obj.entries[n].rec_child_seq[0] == 1:
-                            wl_obj.entries[n].recurring = True
-                            wl_obj.entries[n].rec_interval = (
-                              entry_list[ndx].rec_interval)
-                            wl_obj.entries[n].rec_total = (
-                              entry_list[ndx].rec_total - 1)
-                            wl_obj.entries[n].rec_child_seq = None
-                            wl_obj.entries[n].rec_parent = None
-                            # Set the new parent ID.
-                            new_id = wl_obj.entries[n].id
-                        # Changes for all other child entries.
-                        else:
-                            wl_obj.entries[n].rec_child_seq = (
-                              wl_obj.entries[n].rec_child_seq[0] - 1,
-                              wl_obj.entries[n].rec_child_seq[1] - 1)
-                            wl_obj.entries[n].rec_parent = new_id
-                        # end if
+                # Go through the child entries in order, so that the new
+                #  parent is found first.
+                child_list.sort(key=lambda entry: entry.rec_child_seq[0])
+                for child in child_list:
+                    wl_obj.mark_dirty(child)
+                    # First child entry changes.
+                    if child.rec_child_seq[0] == 1:
+                        child.recurring = True
+                        child.rec_interval = entry_list[ndx].rec_interval
+                        child.rec_total = entry_list[ndx].rec_total - 1
+                        child.rec_child_seq = None
+                        child.rec_parent = None
+                        # Set the new parent ID.
+                        new_id = child.id
+                    # Changes for all other child entries.
+                    else:
+                        child.rec_child_seq = (
+                          child.rec_child_seq[0] - 1,
+                          child.rec_child_seq[1] - 1)
+                        child.rec_parent = new_id
                     # end if
                 # end for
             # BUT if the first child entry is the ONLY entry in the
             #  series remaining, then it becomes a non-recurring task.
-            else:
-                # Go through the entries, looking for the one child
-                #  entry.
-                for n in range(len(wl_obj.entries)):
-                    if wl_obj.entries[n].rec_parent == entry_list[ndx].id:
-                        # Change the child entry to a regular
-                        #  non-recurring task.
-                        wl_obj.entries[n].rec_child_seq = None
-                        wl_obj.entries[n].rec_parent = None
-                        # No need to keep looking.
-                        break
-                    # end if
-                # end for
+            elif child_list:
+                # Change the child entry to a regular non-recurring task.
+                wl_obj.mark_dirty(child_list[0])
+                child_list[0].rec_child_seq = None
+                child_list[0].rec_parent = None
+            # end if
             # Finally, delete the parent entry.
             wl_obj.entries.remove(entry_list[ndx])
+            wl_obj.mark_dirty(entry_list[ndx], deleted=True)
             # Delete from the sort lists.
             _delete_from_sort(wl_obj, entry_list[ndx])
             # Delete the entry from the entry list.
@@ -553,6 +574,13 @@ def _delete_from_series(wl_obj, del_entry):
        -----------------------------------------------------------------
     """
     try:
+        # Occurrances of a rule-based series keep their numbers; the
+        #  deleted occurrance just becomes an exception to the rule.
+        parent = wl_search.lookup_entry_by_id(wl_obj, del_entry.rec_parent)
+        if wl_series.is_series(parent):
+            wl_series.remove_occurrance(wl_obj, del_entry)
+            return
+        # end if
         # When deleting a single occurrance from a series, the other
         #  entries in the series must be "cleaned up" to correctly
         #  represent their positions.
@@ -560,26 +588,25 @@ def _delete_from_series(wl_obj, del_entry):
         # Get the occurance number and the total number of recurrances.
         occ_num, total_occ = del_entry.rec_child_seq
         # Find the parent entry, reduce the number of recurrances by 1.
-        wl_search.lookup_entry_by_id(
-          wl_obj, del_entry.rec_parent).rec_total = (total_occ - 1)
-        # Now go through the entries, finding and editing the recurrance
-        #  data for each child entry.  (Cannot use a for-loop directly
-        #  since we are editing the entries.)
-        for ndx in range(len(wl_obj.entries)):
-            if wl_obj.entries[ndx].rec_parent == del_entry.rec_parent:
-                # Only change the recurrance number for recurrances
-                #  after the one being deleted.
-                if wl_obj.entries[ndx].rec_child_seq[0] > occ_num:
-                    wl_obj.entries[ndx].rec_child_seq = (
-                      wl_obj.entries[ndx].rec_child_seq[0] - 1, total_occ - 1)
-                else:
-                    wl_obj.entries[ndx].rec_child_seq = (
-                      wl_obj.entries[ndx].rec_child_seq[0], total_occ - 1)
-                # end if
+        parent = wl_search.lookup_entry_by_id(wl_obj, del_entry.rec_parent)
+        parent.rec_total = total_occ - 1
+        wl_obj.mark_dirty(parent)
+        # Now go through the child entries, editing the recurrance data
+        #  for each one.
+        for child in wl_series.children(wl_obj, parent):
+            wl_obj.mark_dirty(child)
+            # Only change the recurrance number for recurrances after the
+            #  one being deleted.
+            if child.rec_child_seq[0] > occ_num:
+                child.rec_child_seq = (
+                  child.rec_child_seq[0] - 1, total_occ - 1)
+            else:
+                child.rec_child_seq = (child.rec_child_seq[0], total_occ - 1)
             # end if
         # end for
         # Finally delete the child entry.
         wl_obj.entries.remove(del_entry)
+        wl_obj.mark_dirty(del_entry, deleted=True)
         # Set changed flag.
         wl_obj.changed = True
         return
@@ -732,6 +759,37 @@ def _edit_entry(wl_obj, edit_entry, ndx, total):
 # end function
 
 
+def _remove_entries(wl_obj, remove_list):
+    """
+        Removes a number of entries from the work log.
+
+        A log which is read in full is rebuilt without the entries in
+         one pass; other logs remove them one at a time.
+
+        Arguments:
+        - wl_obj -- the work log object.
+        - remove_list -- the entries to remove.
+
+        Returns:  nothing.
+       -----------------------------------------------------------------
+    """
+    try:
+        if type(wl_obj.entries) == list:
+            remove_ids = {entry.id for entry in remove_list}
+            wl_obj.entries[:] = [
+              entry for entry in wl_obj.entries if entry.id not in remove_ids]
+        else:
+            for entry in remove_list:
+                wl_obj.entries.remove(entry)
+            # end for
+        # end if
+        return
+    except Exception as err:
+        _z_exc("wl_viewedit.py/_remove_entries", err)
+    # end try
+# end function
+
+
 def _update_entry(wl_obj, entry, resort):
     """
         Updates a log entry object's attributes with new values.
@@ -752,7 +810,7 @@ def _update_entry(wl_obj, entry, resort):
         #  apply all the edits to just the one entry, even if other
         #  attributes have also been changed.
         if (
-          (entry.recurring is True or entry.rec_parent) and
+          (entry.recurring is True or entry.rec_parent is not None) and
           (entry.date == entry.info["date"])):
             response = io_utils.menu(
               ["Edit this task only", "Edit all tasks in the series"],
@@ -771,23 +829,47 @@ def _update_entry(wl_obj, entry, resort):
         else:
             edit_series = False
         # end if
-        # Find the original entry (and, if applicable, any child
-        #  entries).
-        for ndx in range(len(wl_obj.entries)):
-            if (
-              (wl_obj.entries[ndx].id == entry.id) or
-              (edit_series and
-               ((wl_obj.entries[ndx].rec_parent == entry.rec_parent) or
-               (wl_obj.entries[ndx].id == entry.rec_parent)))):
+        # When only one task of a rule-based series is edited, it needs
+        #  to be stored first.  An occurrance is stored on its own; if
+        #  the parent is edited, all of the occurrances are stored,
+        #  since they would otherwise change with it.
+        if not edit_series and wl_series.is_occurrance(entry):
+            stored = wl_series.materialize(wl_obj, entry)
+            if stored is None:
+                return
+            # end if
+            entry.id = stored.id
+        elif not edit_series and wl_series.is_series(entry):
+            wl_series.materialize_all(
+              wl_obj, wl_search.lookup_entry_by_id(wl_obj, entry.id))
+        # end if
+        # Set ID to match (the parent's own ID if the entry is the
+        #  parent).
+        series_id = entry.rec_parent
+        if series_id is None:
+            series_id = entry.id
+        # end if
+        # Find the original entry (and, if applicable, the parent and
+        #  child entries).
+        if edit_series:
+            parent = wl_search.lookup_entry_by_id(wl_obj, series_id)
+            series_list = [parent] + wl_series.children(wl_obj, parent)
+        else:
+            series_list = [wl_search.lookup_entry_by_id(wl_obj, entry.id)]
+        # end if
+        for stored in series_list:
+            if stored is not None:
                 # Simpler to overwrite the values (even if unchanged).
-                wl_obj.entries[ndx].title = entry.title
-                wl_obj.entries[ndx].time = entry.time
-                wl_obj.entries[ndx].duration = entry.duration
-                wl_obj.entries[ndx].notes = entry.notes
+                stored.title = entry.title
+                stored.time = entry.time
+                stored.duration = entry.duration
+                stored.notes = entry.notes
                 # Recalculate the datetime attribute, in case it's
                 #  changed.
-                wl_obj.entries[ndx].datetime = (
-                  wl_add.add_datetime(wl_obj.entries[ndx]))
+                stored.datetime = wl_add.add_datetime(stored)
+                # Mark the entry once its new values are set, so that the
+                #  index of task times is updated with them.
+                wl_obj.mark_dirty(stored)
                 # If title, date or time changed, need to update sort
                 #  lists.
                 if resort:
@@ -44,9 +44,18 @@ try:
     import wl_add
     import wl_datetime
     import wl_help
+    import wl_ids
+    import wl_lazylog
     import wl_manual
+    import wl_overlap
+    import wl_parallel
+    import wl_pool
+    import wl_recur
     import wl_resource
     import wl_search
+    import wl_series
+    import wl_shard
+    import wl_sqlite
 except Exception as err:
     _z_exc("worklog.py/module imports", err)
 # end try
@@ -58,6 +67,13 @@ DATE_SORT = 1
 QUIT = 0
 DATE_F = 1
 TIME_F = 2
+SCREEN_W = 3
+OPEN_M = 4
+CSV = "csv"
+CSV_GZ = "csv.gz"
+CSV_XZ = "csv.xz"
+DB = "db"
+SHARD = "wlm"
 
 
 class WorkLog:
@@ -86,13 +102,40 @@ class WorkLog:
            about the WorkLog object to be written to a file.
         - help -- a WlHelp object, containing methods for displaying
            help text.
+        - backend -- the type of file the log is stored in ("csv",
+           "db" or "wlm" for a sharded log).
+        - dirty -- the IDs of entries that have been added or edited
+           since the log was last saved.
+        - deleted -- the IDs of entries that have been deleted since the
+           log was last saved.
+        - open_mode -- whether log files are read in full ("full") or
+           as needed ("lazy").
+        - series -- the IDs of the parent entries of all rule-based
+           recurring series in the log.
+        - overlaps -- an index of the times that the log's tasks occupy
+           (see wl_overlap), or None until it is first needed.
+        - strings -- a pool of the titles and notes shared by the log's
+           entries (see wl_pool).
+        - next_id -- the ID to give the next entry added to the log (see
+           wl_ids).
+        - slots -- a list of the log's entries indexed by ID (see
+           wl_ids), or None until it is first needed.
+        - dense_ids -- True if the log's IDs were all assigned in order
+           by next_id; False if it still has random IDs from an earlier
+           version (see wl_ids.migrate).
 
         Public Methods:
         - action_get -- asks for and gets an action from the user.
         - action_take -- takes the action the user specifies.
+        - add_many -- adds many entries at once, without asking the
+           user anything.
+        - mark_dirty -- records that an entry has been added, edited or
+           deleted.
 
         Private Methods:
         - _add_entry -- adds a single entry to the work log object.
+        - _backend_for -- determines the type of log a file holds.
+        - _bulk_entry -- creates and checks an entry for add_many.
         - _add_recurring_entries -- adds a series of recurring entries
            to the work log object.
         - _do_add -- creates a new LogEntry object, initializes it with
@@ -110,9 +153,17 @@ class WorkLog:
            allows the user to edit or delete entries that are found.
         - _do_open -- opens a file and populates the work log object
            with its data.
+        - _do_open_lazy -- maps a file and populates the work log
+           object's indexes, leaving entries to be read as needed.
+        - _do_open_parallel -- reads a large file, decoding its entries
+           in several processes at once.
+        - _do_open_sharded -- reads a sharded log's manifest, leaving
+           its shards to be read as needed.
         - _do_save -- saves the data in the WorkLog object to a file.
         - _do_sort -- updates the work log object's sorted lists when a
            new entry is added.
+        - _finish_open -- sorts the indexes and reports the result of
+           opening a file.
         - _init_entries -- initializes log entries from data read from
            a file, and adds the entries to the work log object.
         - _init_worklog -- initializes the work log object from data
@@ -146,6 +197,16 @@ class WorkLog:
         self.sorts = [[], []]
         self.info = {}
         self.help = wl_help.WlHelp()
+        self.backend = CSV
+        self.dirty = set()
+        self.deleted = set()
+        self.open_mode = wl_lazylog.FULL
+        self.series = []
+        self.overlaps = None
+        self.strings = wl_pool.StringPool()
+        self.next_id = 0
+        self.slots = None
+        self.dense_ids = True
     # end method
 
     def __eq__(self, other):
@@ -291,8 +352,8 @@ class WorkLog:
                 self._do_settings(self.total_entries)
             # If the user wants to read the user manual...
             elif self.action == "M":
-                input(wl_manual.string)
-                io_utils.clear_screen
+                wl_manual.show(line_length=self.line_length)
+                io_utils.clear_screen()
             # end if
             # To go back to the actions menu, return True.
             return True
@@ -301,6 +362,130 @@ class WorkLog:
         # end try
     # end method
 
+    def add_many(self, items):
+        """
+            Adds many entries at once, without asking the user anything.
+
+            Each item is checked, given an ID, and added; then the sort
+             indexes are merged with the new entries in one pass.  An
+             item whose recurring attribute is set becomes the parent of
+             a rule-based series, if its rec_interval has a unit and an
+             end date.  No overlap warnings are given.
+
+            Arguments:
+            - items -- a list of LogEntry objects, or of dictionaries
+               holding the attributes of log entries (either as read from
+               a file, or already converted).  Items are taken to be new
+               tasks; their IDs, and any links to a series, are replaced.
+
+            Returns:  a list of the entries added, and a list of the
+             positions in items of any items which were not valid.
+           -------------------------------------------------------------
+        """
+        try:
+            added = []
+            rejected = []
+            for ndx, item in enumerate(items):
+                entry = self._bulk_entry(item)
+                if entry is None:
+                    rejected.append(ndx)
+                else:
+                    added.append(entry)
+                # end if
+            # end for
+            if not added:
+                return added, rejected
+            # end if
+            # Number the entries in one block, and share their strings.
+            for entry, entry_id in zip(
+              added, wl_ids.allocate_many(self, len(added))):
+                entry.id = entry_id
+                self.strings.intern_entry(entry)
+            # end for
+            # The dates of all of the new series are found at once.
+            parents = [entry for entry in added if entry.recurring]
+            for entry, dates in zip(parents, wl_recur.expand_many(
+              [(entry.date, entry.rec_interval, entry.rec_interval["end"])
+               for entry in parents])):
+                wl_series.add_series(self, entry, wl_recur.date_list(dates))
+            # end for
+            # The entries must be in the log before their tuples are
+            #  added to the sort indexes (a sharded log adds the tuples
+            #  of the shards it loads).  The new tuples are sorted, and
+            #  each index then merges the two sorted runs.
+            self.entries.extend(added)
+            title_run = sorted(
+              (entry.title, entry.datetime, entry.id) for entry in added)
+            date_run = sorted(
+              (entry.datetime, entry.title, entry.id) for entry in added)
+            self.sorts[TITLE_SORT] += title_run
+            self.sorts[TITLE_SORT].sort()
+            self.sorts[DATE_SORT] += date_run
+            self.sorts[DATE_SORT].sort()
+            # The new entries' times are added to the index of task times
+            #  in one batch.
+            for entry in added:
+                self.mark_dirty(entry, bulk=True)
+            # end for
+            wl_overlap.add_many(self, added)
+            self.total_entries = len(self.entries)
+            return added, rejected
+        except Exception as err:
+            _z_exc("worklog.py/WorkLog/add_many", err)
+        # end try
+    # end method
+
+    def mark_dirty(self, entry, deleted=False, bulk=False):
+        """
+            Records that an entry has been added, edited or deleted.
+
+            A database-backed log uses these records to write only the
+             rows that have changed when it is saved.
+
+            Arguments:
+            - entry -- the entry which has changed.
+
+            Keyword Arguments:
+            - deleted -- flag that the entry has been deleted (default
+               False).
+            - bulk -- flag that the entry is one of many new entries,
+               whose times the caller adds to the index of task times
+               (default False).
+
+            Returns:  nothing.
+           -------------------------------------------------------------
+        """
+        try:
+            if deleted:
+                self.dirty.discard(entry.id)
+                self.deleted.add(entry.id)
+            else:
+                self.dirty.add(entry.id)
+                # An edited entry shares its new title and notes.
+                self.strings.intern_entry(entry)
+            # end if
+            # A sharded log also needs to know which shard has changed.
+            if isinstance(self.entries, wl_shard.ShardedEntryList):
+                self.entries.mark_changed(entry)
+            # end if
+            # Keep the index of the times that tasks occupy, and the index
+            #  of IDs, up to date.
+            if deleted:
+                wl_overlap.remove(self, entry)
+                wl_ids.remove(self, entry)
+            else:
+                if not bulk:
+                    wl_overlap.update(self, entry)
+                # end if
+                wl_ids.update(self, entry)
+            # end if
+            self.changed = True
+            return
+        except Exception as err:
+            _z_exc("worklog.py/WorkLog/mark_dirty", err)
+        # end try
+    # end method
+
     def _do_add(self):
         """
             Adds one or more entry objects to the log object.
@@ -425,11 +610,19 @@ class WorkLog:
            -------------------------------------------------------------
         """
         try:
-            # Set the datetime attribute.
+            # Give the entry the log's next ID, and set the datetime
+            #  attribute.
+            entry.id = wl_ids.allocate(self)
             entry.datetime = wl_add.add_datetime(entry)
+            # Warn the user if the task (or series) overlaps other tasks.
+            wl_overlap.warn(self, entry, date_list=recurring_entries)
+            # Share the entry's title and notes before they are added to
+            #  the sort indexes.
+            self.strings.intern_entry(entry)
             # Add the entry to the work log.
             self._do_sort(entry)
             self.entries.append(entry)
+            self.mark_dirty(entry)
             # Now add the recurring entries, if any.
             self._add_recurring_entries(entry, recurring_entries)
             # And update.
@@ -457,10 +650,100 @@ class WorkLog:
         # end try
     # end method
 
+    def _backend_for(self, fname):
+        """
+            Determines the type of log a file holds, by its extension.
+
+            Arguments:
+            - fname -- the filename.
+
+            Returns:  the backend type ("csv", "db" or "wlm").  Compressed
+             csv files are read and written like any other csv file.
+           -------------------------------------------------------------
+        """
+        try:
+            if wl_sqlite.is_db(fname):
+                return DB
+            elif wl_shard.is_sharded(fname):
+                return SHARD
+            else:
+                return CSV
+            # end if
+        except Exception as err:
+            _z_exc("worklog.py/WorkLog/_backend_for", err)
+        # end try
+    # end method
+
+    def _bulk_entry(self, item):
+        """
+            Creates and checks an entry for add_many.
+
+            Arguments:
+            - item -- a LogEntry object, or a dictionary of a log
+               entry's attributes.  String values in a dictionary are
+               converted as they are when a file is read.
+
+            Returns:  the entry, with its datetime set, if it is valid;
+             else None.
+           -------------------------------------------------------------
+        """
+        try:
+            if isinstance(item, logentry.LogEntry):
+                entry = item
+            else:
+                entry = logentry.LogEntry()
+                for attr in entry.FIELDNAMES:
+                    if attr in item:
+                        value = item[attr]
+                        if type(value) == str and value:
+                            value = entry._convert_dict_key(value)
+                        # end if
+                        setattr(entry, attr, value)
+                    # end if
+                # end for
+            # end if
+            # The same checks that are made on entries read from a file,
+            #  and a title.
+            if (
+              type(entry.title) != str or not entry.title or
+              type(entry.date) != datetime.date or
+              type(entry.time) != datetime.time or
+              type(entry.duration) != datetime.timedelta):
+                return None
+            # end if
+            entry.datetime = wl_add.add_datetime(entry)
+            entry.rec_child_seq = None
+            entry.rec_parent = None
+            entry.rec_total = None
+            # A series needs a rule which can be expanded.
+            if entry.recurring:
+                rule = entry.rec_interval
+                if (
+                  type(rule) != dict or
+                  rule.get("unit") not in
+                  [wl_recur.DAILY, wl_recur.WEEKLY, wl_recur.MONTHLY] or
+                  type(rule.get("end")) != datetime.date or
+                  rule["end"] <= entry.date):
+                    return None
+                # end if
+                entry.rec_interval = dict(rule)
+                entry.rec_interval["skip"] = rule.get("skip") or 1
+            # end if
+            entry.recurring = bool(entry.recurring)
+            return entry
+        except Exception as err:
+            _z_exc("worklog.py/WorkLog/_bulk_entry", err)
+        # end try
+    # end method
+
     def _add_recurring_entries(self, entry, recurrance_list):
         """
             Adds a series of recurring entries.
 
+            Only the original entry is stored, holding the rule for the
+             series; the other entries are created from the rule when
+             they are needed.
+
             Arguments:
             - entry -- the original entry.
             - recurrance_list -- the list of recurring dates.
@@ -473,28 +756,8 @@ class WorkLog:
             if not recurrance_list:
                 return
             # end if
-            # Finish setting the original entry's attribute.
-            entry.rec_total = len(recurrance_list)
-            for n, date in enumerate(recurrance_list):
-                # Create a new entry object with the original entry's
-                #  attributes.
-                new_entry = logentry.LogEntry()
-                new_entry.title = entry.title
-                # Different date.
-                new_entry.date = date
-                new_entry.time = entry.time
-                # Set new datetime attribute.
-                new_entry.datetime = wl_add.add_datetime(new_entry)
-                new_entry.duration = entry.duration
-                new_entry.notes = entry.notes
-                # Recurrance-specific attributes.
-                new_entry.recurring = False
-                new_entry.rec_child_seq = (n + 1, len(recurrance_list))
-                new_entry.rec_parent = entry.id
-                # Add the entry to the work log.
-                self._do_sort(new_entry)
-                self.entries.append(new_entry)
-            # end for
+            # Finish setting the original entry's attributes.
+            wl_series.add_series(self, entry, recurrance_list)
             return
         except Exception as err:
             _z_exc("worklog.py/WorkLog/do_add_recurring_entries", err)
@@ -526,6 +789,11 @@ class WorkLog:
                 io_utils.print_status(
                   "Status", f"{self.filename} closed.",
                   line_length=self.line_length)
+            # end if
+            # Release a mapped file.
+            if isinstance(self.entries, wl_lazylog.LazyEntryList):
+                self.entries.release()
+            # end if
             return False
         except Exception as err:
             _z_exc("worklog.py/WorkLog/do_close", err)
@@ -547,20 +815,38 @@ class WorkLog:
         """
         try:
             # Call the io_utils method to get a filename and create the file.
-            self.filename, go_open = io_utils.file_create(filetype="csv")
+            self.filename, go_open = io_utils.file_create(
+              filetype=[CSV, CSV_GZ, CSV_XZ, DB, SHARD])
             # If no filename was returned, the attempt was unsuccessful.
             #  Return False
             if self.filename == "":
                 return False
+            # end if
+            self.backend = self._backend_for(self.filename)
             # If the open flag was set, call _do_open for the file.
-            elif go_open:
+            if go_open:
                 success = self._do_open()
                 if success:
                     return True
                 else:
                     return False
                 # end if
+            # end if
+            # A database needs its tables set up before it can be used.
+            if self.backend == DB and not wl_sqlite.db_create(
+              self.filename, line_length=self.line_length):
+                return False
+            # So does a sharded log's shard directory.
+            elif self.backend == SHARD and not wl_shard.create_log(
+              self.filename, line_length=self.line_length):
+                return False
             else:
+                # A new sharded log starts with no shards.
+                if self.backend == SHARD:
+                    self.entries = wl_shard.ShardedEntryList(
+                      self.filename, {}, self.sorts, pool=self.strings,
+                      shard_ranges={}, shard_longest={})
+                # end if
                 self.total_entries = 0
                 # Print status.
                 io_utils.print_status(
@@ -644,7 +930,8 @@ class WorkLog:
         try:
             # If we don't have a filename, get one.
             if self.filename == "":
-                self.filename = io_utils.get_filename_open(filetype="csv")
+                self.filename = io_utils.get_filename_open(
+                  filetype=[CSV, CSV_GZ, CSV_XZ, DB, SHARD])
             # end if
             # If self.filename is still empty, the user chose to go
             #  back, so just return.
@@ -652,7 +939,28 @@ class WorkLog:
                 return False
             # end if
             # Open and read the file.
-            entry_dict = io_utils.file_read(self.filename, filetype="csv")
+            self.backend = self._backend_for(self.filename)
+            # A sharded log reads only its manifest.
+            if self.backend == SHARD:
+                return self._do_open_sharded()
+            # end if
+            # In lazy mode, a csv file is mapped rather than read, and
+            #  entries are only created when they are needed.  A
+            #  compressed file can't be mapped, so it is read in full.
+            if (
+              self.backend == CSV and self.open_mode == wl_lazylog.LAZY and
+              not io_utils.is_compressed(self.filename)):
+                return self._do_open_lazy()
+            # A large csv file is decoded by several processes at once.
+            elif self.backend == CSV and wl_parallel.use_parallel(
+              self.filename):
+                return self._do_open_parallel()
+            elif self.backend == DB:
+                entry_dict = wl_sqlite.db_read(
+                  self.filename, line_length=self.line_length)
+            else:
+                entry_dict = io_utils.file_read(self.filename, filetype="csv")
+            # end if
             # If the file didn't open properly, let the user know before
             #  returning.
             if not entry_dict:
@@ -668,6 +976,129 @@ class WorkLog:
             # end if
             # Initialize the log entry objects.
             failed = self._init_entries(entry_dict)
+            return self._finish_open(failed)
+        except Exception as err:
+            _z_exc("worklog.py/WorkLog/_do_open", err)
+        # end try
+    # end method
+
+    def _do_open_lazy(self):
+        """
+            Maps a log file and reads only its indexes into the log
+             object.
+
+            Arguments:  none.
+
+            Returns:  True if successful; False if there was an error.
+           -------------------------------------------------------------
+        """
+        try:
+            entries = wl_lazylog.open_log(
+              self.filename, line_length=self.line_length,
+              pool=self.strings)
+            # If the file didn't open properly, let the user know before
+            #  returning.
+            if entries is None:
+                io_utils.print_status(
+                  "Error", f"{self.filename} could not be opened.")
+                return False
+            # end if
+            # The first data row holds the work log's info.
+            if not self._init_worklog(entries.header):
+                entries.release()
+                return False
+            # end if
+            # The entries are decoded as needed, but the sort indexes
+            #  are built now.
+            self.entries = entries
+            self.sorts[TITLE_SORT], self.sorts[DATE_SORT] = (
+              entries.sort_keys())
+            return self._finish_open(entries.failed)
+        except Exception as err:
+            _z_exc("worklog.py/WorkLog/_do_open_lazy", err)
+        # end try
+    # end method
+
+    def _do_open_parallel(self):
+        """
+            Reads a large log file, decoding it in parallel.
+
+            Arguments:  none.
+
+            Returns:  True if successful; False if there was an error.
+           -------------------------------------------------------------
+        """
+        try:
+            result = wl_parallel.read_log(
+              self.filename, line_length=self.line_length)
+            # If the file didn't open properly, let the user know before
+            #  returning.
+            if result is None:
+                io_utils.print_status(
+                  "Error", f"{self.filename} could not be opened.")
+                return False
+            # end if
+            info, entries, title_sort, date_sort, failed = result
+            if not self._init_worklog(info):
+                return False
+            # end if
+            # The sort indexes come back already sorted.  Each process
+            #  made its own copies of the strings, so they are pooled
+            #  here.
+            self.entries = entries
+            for entry in entries:
+                self.strings.intern_entry(entry)
+            # end for
+            self.sorts[TITLE_SORT] = title_sort
+            self.sorts[DATE_SORT] = date_sort
+            self.strings.intern_sorts(self.sorts)
+            return self._finish_open(failed)
+        except Exception as err:
+            _z_exc("worklog.py/WorkLog/_do_open_parallel", err)
+        # end try
+    # end method
+
+    def _do_open_sharded(self):
+        """
+            Reads a sharded log's manifest; shards are read as needed.
+
+            Arguments:  none.
+
+            Returns:  True if successful; False if there was an error.
+           -------------------------------------------------------------
+        """
+        try:
+            header, entries = wl_shard.open_log(
+              self.filename, self.sorts, line_length=self.line_length,
+              pool=self.strings)
+            # If the file didn't open properly, let the user know before
+            #  returning.
+            if header is None:
+                io_utils.print_status(
+                  "Error", f"{self.filename} could not be opened.")
+                return False
+            # end if
+            if not self._init_worklog(header):
+                return False
+            # end if
+            self.entries = entries
+            return self._finish_open(0)
+        except Exception as err:
+            _z_exc("worklog.py/WorkLog/_do_open_sharded", err)
+        # end try
+    # end method
+
+    def _finish_open(self, failed):
+        """
+            Sorts the indexes and reports the result of opening a file.
+
+            Arguments:
+            - failed -- the number of entries which could not be read.
+
+            Returns:  True.
+           -------------------------------------------------------------
+        """
+        try:
             # Once all the entries have been added, sort the lists.
             self.sorts[TITLE_SORT].sort()
             self.sorts[DATE_SORT].sort()
@@ -686,9 +1117,14 @@ class WorkLog:
             # Finally reset the total_entries attribute to the actual
             #  number of entries added.
             self.total_entries = len(self.entries)
+            # Nothing has changed since the file was read.
+            self.dirty.clear()
+            self.deleted.clear()
+            # Logs saved by earlier versions need their IDs set up.
+            wl_ids.migrate(self)
             return True
         except Exception as err:
-            _z_exc("worklog.py/WorkLog/_do_open", err)
+            _z_exc("worklog.py/WorkLog/_finish_open", err)
         # end try
     # end method
 
@@ -715,25 +1151,54 @@ class WorkLog:
               "total_entries": self.total_entries,
               "date_format": self.date_format,
               "time_format": self.time_format, "show_help": self.show_help,
-              "last_modified": self.last_modified}
-            # Start the list with the dummy entry object.
-            entry_dict = new_entry.to_dict()
-            entry_list.append(entry_dict)
-            # Now add all of the entries.
-            for entry in self.entries:
-                # For each entry object, convert to a dictionary.
-                entry_dict = entry.to_dict()
+              "last_modified": self.last_modified, "series": self.series,
+              "next_id": self.next_id}
+            # A log with random IDs is saved without a next ID, so that
+            #  it is renumbered when next read in full.
+            if not self.dense_ids:
+                new_entry.info["next_id"] = None
+            # end if
+            # A database only needs the entries that have changed.
+            if self.backend == DB:
+                for entry in self.entries:
+                    if entry.id in self.dirty:
+                        entry_list.append(entry.to_dict())
+                    # end if
+                # end for
+                success = wl_sqlite.db_save(
+                  self.filename, new_entry.to_dict(), entry_list,
+                  self.deleted, line_length=self.line_length)
+            # A sharded log only writes the shards that have changed.
+            elif self.backend == SHARD:
+                success = wl_shard.save_log(
+                  self.entries, new_entry.info, line_length=self.line_length)
+            # A lazily-read log copies unchanged rows from the file.
+            elif isinstance(self.entries, wl_lazylog.LazyEntryList):
+                success = wl_lazylog.save_log(
+                  self.entries, new_entry.to_dict(), fn,
+                  line_length=self.line_length)
+            else:
+                # Start the list with the dummy entry object.
+                entry_dict = new_entry.to_dict()
                 entry_list.append(entry_dict)
-            # end for
-            # Pass everything to the io_utils function.
-            success = io_utils.file_write(
-              self.filename, "csv", entry_list, fieldnames=fn)
+                # Now add all of the entries.
+                for entry in self.entries:
+                    # For each entry object, convert to a dictionary.
+                    entry_dict = entry.to_dict()
+                    entry_list.append(entry_dict)
+                # end for
+                # Pass everything to the io_utils function.
+                success = io_utils.file_write(
+                  self.filename, "csv", entry_list, fieldnames=fn)
+            # end if
             if success:
                 # Print status.
                 io_utils.print_status(
                   "status", f"{self.filename} saved.",
                   line_length=self.line_length)
                 self.changed = False
+                self.dirty.clear()
+                self.deleted.clear()
                 return True
             else:
                 return False
@@ -766,7 +1231,8 @@ class WorkLog:
                   line_length=self.line_length)
                 # Show menu and get a response.
                 response = io_utils.menu(
-                  ["Set Date Format", "Set Time Format", "Set Screen Width"],
+                  ["Set Date Format", "Set Time Format", "Set Screen Width",
+                   "Set Open Mode"],
                   keystroke_list="#", help_toggle=True,
                   line_length=self.line_length)
                 # If the user chose to toggle help, do that and then
@@ -785,8 +1251,10 @@ class WorkLog:
                     wl_datetime.set_endian(self)
                 elif response == TIME_F:
                     wl_datetime.set_time_format(self)
-                else:  # response == 3
+                elif response == SCREEN_W:
                     wl_resource.set_screen_width(self)
+                else:  # response == OPEN_M
+                    wl_lazylog.set_open_mode(self)
                 # end if
             # end while
         except Exception as err:
@@ -901,7 +1369,8 @@ class WorkLog:
             #  dictionary.
             if new_entry.from_dict(dict_entry):
                 # If it worked, add the entry to the log object and
-                #  sort lists.
+                #  sort lists, sharing its strings with other entries.
+                self.strings.intern_entry(new_entry)
                 self.entries.append(new_entry)
                 self.sorts[TITLE_SORT].append(
                   (new_entry.title, new_entry.datetime, new_entry.id))
@@ -942,6 +1411,11 @@ class WorkLog:
             self.total_entries = new_entry.info["total_entries"]
             self.show_help = new_entry.info["show_help"]
             self.last_modified = new_entry.info["last_modified"]
+            # Logs saved before rule-based series were introduced have
+            #  no list of series.
+            self.series = new_entry.info.get("series") or []
+            # Nor do they have a next ID (see wl_ids.migrate).
+            self.next_id = new_entry.info.get("next_id")
             # But only set the format attributes if the user has not
             #  already set them.
             if not self.date_format:
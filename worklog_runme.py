@@ -33,6 +33,7 @@ def _z_exc(loc, err):
 # Other imports.
 try:
     import io_utils
+    import wl_lazylog
     import worklog
 except Exception as err:
     _z_exc("worklog_runme.py/module imports", err)
@@ -59,6 +60,8 @@ def main():
         # Also at the beginning of the run, set the default line length
         #  (the user can change this during the run.)
         preferences["line_length"] = 80
+        # Log files are read in full unless the user chooses otherwise.
+        preferences["open_mode"] = wl_lazylog.FULL
         # Print welcome screen.
         io_utils.welcome_screen(3, "Work Log!", preferences["line_length"])
         # Outer loop, cycles until the user chooses to exit the program.
@@ -70,6 +73,8 @@ def main():
             work_log.show_help = preferences["show_help"]
             # Set the line length.
             work_log.line_length = preferences["line_length"]
+            # Set the open mode.
+            work_log.open_mode = preferences["open_mode"]
             # Inner loop, starts by initializing the log object from a
             #  file, or creating a new file.  If the user exits out of
             #  the open or create file process, or chooses to close the
@@ -89,10 +94,11 @@ def main():
                 working = work_log.action_take()
             # end while
             # Before looping back to the main menu, pass the current
-            #  values for show_help and line_length back to the
-            #  function.
+            #  values for show_help, line_length and open_mode back to
+            #  the function.
             preferences["show_help"] = work_log.show_help
             preferences["line_length"] = work_log.line_length
+            preferences["open_mode"] = work_log.open_mode
         # end while
         # User chose to quit.
         io_utils.goodbye_screen(